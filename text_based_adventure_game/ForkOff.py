@@ -1,19 +1,30 @@
 """The adventure game module."""
 
 import argparse
+import json
 import sys
-from typing import Any
+import time
+from typing import Any, TextIO
 
 from common.controller_type import ControllerType
 from common.game_message import GameMessage
+from common.game_response import GameResponse
+from common.load_error import FileOperationError
+from common.profiler import Profiler
 from common.request_status import RequestStatus
+from common.request_type import RequestType
 from common.service_type import ServiceType
 from controllers.game_controller import GameController
 from controllers.interaction_controller import InteractionController
 from controllers.inventory_controller import InventoryController
 from controllers.movement_controller import MovementController
+from game_repository.autosave_policy import AutosavePolicy
 from game_repository.file_manager import FileManager
 from game_repository.game_repository import GameRepository
+from game_repository.memory_save_storage import MemorySaveStorage
+from game_repository.save_storage import FileSaveStorage, SaveStorage
+from game_repository.sqlite_save_storage import SqliteSaveStorage
+from language.terminal_renderer import TerminalRenderer
 from language.text_parser import TextParser
 from router.router import Router
 from services.game_service import GameService
@@ -25,9 +36,31 @@ from services.movement_service import MovementService
 class AdventureGame:
     """A class that represents the adventure game setup and configuration."""
 
+    # The storages which saved games can be kept in, by their name on the command line.
+    save_storages: dict[str, type[SaveStorage]] = {
+        "files": FileSaveStorage,
+        "sqlite": SqliteSaveStorage,
+        "memory": MemorySaveStorage,
+    }
+    # The file operations which are timed when the game is profiled.
+    profiled_file_operations = [
+        "get_saved_game",
+        "save_game_file",
+        "get_saved_game_metadata",
+        "get_save_index",
+        "add_save_index_entry",
+        "replace_save_index",
+        "get_content_bundle",
+        "get_items_file",
+        "get_room_file",
+        "get_player_file",
+        "get_objectives_file",
+    ]
+
     def __init__(self: "AdventureGame") -> None:
         """Initialize the adventure game."""
-        pass
+        # Times each turn when the game is run with --profile.
+        self.profiler: Profiler | None = None
 
     def initialize_text_parser(
         self: "AdventureGame", router: Router, repository: GameRepository
@@ -64,16 +97,26 @@ class AdventureGame:
         }
 
     def initialize_game_repository(
-        self: "AdventureGame", is_dev: bool
+        self: "AdventureGame", is_dev: bool, storage: SaveStorage | None = None
     ) -> GameRepository:
         """Initialize the game repository."""
-        repo = GameRepository(is_dev)
+        repo = GameRepository(is_dev, storage)
         repo.load_default_state()
         return repo
 
-    def initialize_game(self: "AdventureGame", is_dev: bool) -> "AdventureGame":
-        """Initialize the game."""
-        self.game_repository = self.initialize_game_repository(is_dev)
+    def initialize_game(
+        self: "AdventureGame", is_dev: bool, storage: SaveStorage | None = None
+    ) -> "AdventureGame":
+        """Initialize the game, keeping saves in the storage if one is given."""
+        return self.initialize_game_with_repository(
+            self.initialize_game_repository(is_dev, storage)
+        )
+
+    def initialize_game_with_repository(
+        self: "AdventureGame", repository: GameRepository
+    ) -> "AdventureGame":
+        """Initialize the services, controllers, router and parser for a repository."""
+        self.game_repository = repository
         self.services = self.initialize_services(self.game_repository)
         self.controllers = self.initialize_controllers(self.services)
         self.router = self.initialize_router(self.controllers)
@@ -82,6 +125,27 @@ class AdventureGame:
         )
         return self
 
+    def attach_profiler(self: "AdventureGame", profiler: Profiler) -> None:
+        """Time the parser, router, services, file operations and output."""
+        self.profiler = profiler
+        self.game_repository.profiler = profiler
+        profiler.instrument(self.text_parser, ["parse_text", "print_response"])
+        profiler.instrument(self.router, ["route"])
+        for service in self.services.values():
+            profiler.instrument_public_methods(service)
+        self.router.register_controllers()
+        profiler.instrument(FileManager, AdventureGame.profiled_file_operations)
+
+    def finish_profiling(self: "AdventureGame") -> None:
+        """Export the timed spans to the trace file, if one was asked for."""
+        if self.profiler is None or self.profiler.trace_file is None:
+            return
+        error = FileManager.save_trace(
+            self.profiler.trace_file, self.profiler.trace_events()
+        )
+        if isinstance(error, FileOperationError):
+            print(error.message, file=sys.stderr)
+
     def handle_save_request(self: "AdventureGame") -> None:
         """Handle the save request."""
         self.text_parser.handle_game_input("savegame", False)
@@ -104,14 +168,21 @@ class AdventureGame:
         input()
 
     def exit_game(self: "AdventureGame") -> None:
-        """Exit the game."""
+        """Exit the game once any saves have been written."""
+        error = self.game_repository.finish_saving()
+        if isinstance(error, FileOperationError):
+            messages = [GameMessage.blank_line(), GameMessage.paragraph(error.message)]
+            self.text_parser.print_list_of_messages(messages, False)
+        self.finish_profiling()
+        self.print_parse_cache_statistics()
         self.print_exit_message()
         sys.exit()
 
     def try_handle_load_request(self: "AdventureGame") -> RequestStatus:
         """Ask the user if they want to load a game or start a new one."""
-        # Check to see if there is a saved game
-        has_saved_game = FileManager.has_saved_game()
+        # Check to see if there is a saved game, once any save has been written
+        self.game_repository.finish_saving()
+        has_saved_game = self.game_repository.storage.has_any_saved_game()
         # If not, load a new game without asking
         if not has_saved_game:
             return self.text_parser.handle_game_input("newgame", False)
@@ -127,7 +198,9 @@ class AdventureGame:
         action = ""
         confirmed = self.user_confirmed(response)
         if confirmed and has_saved_game:
-            action = "loadgame"
+            # Load the game which was saved most recently.
+            slot = self.game_repository.storage.most_recent_slot()
+            action = "loadgame" if slot is None else f"loadgame {slot}"
         else:
             action = "newgame"
         return self.text_parser.handle_game_input(action, False)
@@ -182,6 +255,7 @@ class AdventureGame:
         while self.game_repository.game_active:
             self.text_parser.handle_user_input()  # pragma: no cover
             self.check_for_game_over()  # pragma: no cover
+            self.end_turn()  # pragma: no cover
             if (
                 self.game_repository.player.won
                 and not self.game_repository.player.watched_end_credits
@@ -207,9 +281,90 @@ class AdventureGame:
                 self.text_parser.print_list_of_messages(messages, False)
         self.exit_game()
 
+    def run_script(self: "AdventureGame", script: TextIO, output: TextIO) -> int:
+        """Run a new game from a script of commands without scrolling or sleeping.
+
+        Each response is written to the output as a line of JSON, and the number
+        of commands per second is reported on stderr when the script ends.
+
+        Args:
+            script: The commands to run, one per line.
+            output: Where to write the responses.
+
+        Returns:
+            The number of commands that were run.
+        """
+        self.text_parser.script = script
+        self.text_parser.renderer = TerminalRenderer(sys.stderr, typewriter=False)
+        self.router.route(self.text_parser.parse_text("newgame", False))
+        command_count = 0
+        start = time.perf_counter()
+        line = script.readline()
+        while line != "" and self.game_repository.game_active:
+            if line.strip() != "":
+                response = self.run_command(line.strip())
+                output.write(json.dumps(response.dictionary()) + "\n")
+                command_count += 1
+                self.check_for_game_over()
+                self.end_turn()
+            line = script.readline()
+        output.flush()
+        error = self.game_repository.finish_saving()
+        if isinstance(error, FileOperationError):
+            print(error.message, file=sys.stderr)
+        self.print_script_summary(command_count, time.perf_counter() - start)
+        self.finish_profiling()
+        return command_count
+
+    def end_turn(self: "AdventureGame") -> None:
+        """Autosave the game if it is time, and report a save that failed."""
+        error = self.game_repository.end_turn()
+        if self.profiler is not None:
+            self.profiler.end_turn()
+        if isinstance(error, FileOperationError):
+            messages = [GameMessage.blank_line(), GameMessage.paragraph(error.message)]
+            self.text_parser.print_list_of_messages(messages, False)
+
+    def run_command(self: "AdventureGame", command: str) -> GameResponse:
+        """Parse and route a single command from the player."""
+        request = self.text_parser.parse_text(command, True)
+        if request.action == RequestType.LOAD_GAME_DENIED:
+            return self.text_parser.handle_load_game_denied()
+        return self.router.route(request)
+
+    def print_script_summary(
+        self: "AdventureGame", command_count: int, seconds: float
+    ) -> None:
+        """Report how quickly the script ran on stderr."""
+        rate = command_count / seconds if seconds > 0 else 0
+        print(
+            f"Ran {command_count} commands in {seconds:.3f} seconds"
+            + f" ({rate:,.0f} commands per second).",
+            file=sys.stderr,
+        )
+        self.print_parse_cache_statistics()
+
+    def print_parse_cache_statistics(self: "AdventureGame") -> None:
+        """Report how often parsed commands were reused on stderr, in development."""
+        if self.game_repository.environment.is_development:
+            print(self.text_parser.parse_cache.statistics(), file=sys.stderr)
+
     @staticmethod
-    def is_dev() -> bool:
-        """Parse command line arguments to check for development mode."""
+    def terminal_width(value: str) -> int:
+        """Return the number of columns to wrap to, which must be at least one."""
+        try:
+            width = int(value)
+        except ValueError:
+            width = 0
+        if width < 1:
+            raise argparse.ArgumentTypeError(
+                f"the width must be a number of columns of at least 1, not {value}"
+            )
+        return width
+
+    @staticmethod
+    def parse_arguments() -> argparse.Namespace:
+        """Parse the command line arguments."""
         parser = argparse.ArgumentParser()  # pragma: no cover
         parser.add_argument(
             "-d",
@@ -217,9 +372,62 @@ class AdventureGame:
             help="Run the game in development mode.",
             action="store_true",
         )  # pragma: no cover
-        args = parser.parse_args()  # pragma: no cover
-        return args.development  # pragma: no cover
+        parser.add_argument(
+            "-s",
+            "--script",
+            help="Run the commands in a file, or - for stdin, and print JSON responses.",
+            type=argparse.FileType("r"),
+        )  # pragma: no cover
+        parser.add_argument(
+            "--autosave-turns",
+            help="Save the game automatically after this many turns.",
+            type=int,
+        )  # pragma: no cover
+        parser.add_argument(
+            "--autosave-seconds",
+            help="Save the game automatically after this many seconds.",
+            type=float,
+        )  # pragma: no cover
+        parser.add_argument(
+            "--save-storage",
+            help="Keep saved games in files, an SQLite database or only in memory.",
+            choices=list(AdventureGame.save_storages),
+            default="files",
+        )  # pragma: no cover
+        parser.add_argument(
+            "--profile",
+            help="Time each turn, summarized by the profile command in development.",
+            action="store_true",
+        )  # pragma: no cover
+        parser.add_argument(
+            "--profile-trace",
+            help="Time each turn and export the times to this trace file on exit.",
+        )  # pragma: no cover
+        parser.add_argument(
+            "--width",
+            help="Wrap paragraphs to this many columns.",
+            type=AdventureGame.terminal_width,
+            default=TextParser.default_width,
+        )  # pragma: no cover
+        return parser.parse_args()  # pragma: no cover
 
 
 if __name__ == "__main__":
-    AdventureGame().initialize_game(AdventureGame.is_dev()).run()  # pragma: no cover
+    arguments = AdventureGame.parse_arguments()  # pragma: no cover
+    storage = AdventureGame.save_storages[arguments.save_storage]()  # pragma: no cover
+    game = AdventureGame().initialize_game(
+        arguments.development, storage
+    )  # pragma: no cover
+    if arguments.autosave_turns or arguments.autosave_seconds:  # pragma: no cover
+        game.game_repository.autosave = AutosavePolicy(
+            arguments.autosave_turns, arguments.autosave_seconds
+        )  # pragma: no cover
+    game.text_parser.width = arguments.width  # pragma: no cover
+    if arguments.profile or arguments.profile_trace:  # pragma: no cover
+        profiler = Profiler()  # pragma: no cover
+        profiler.trace_file = arguments.profile_trace  # pragma: no cover
+        game.attach_profiler(profiler)  # pragma: no cover
+    if arguments.script is None:  # pragma: no cover
+        game.run()  # pragma: no cover
+    else:  # pragma: no cover
+        game.run_script(arguments.script, sys.stdout)  # pragma: no cover
@@ -0,0 +1,72 @@
+"""Compare loading the shared game content eagerly with opening it to read on demand.
+
+The eager load is the one the game made before: parsing the whole art and
+stories files and building the items, which every game builds again anyway.
+Memory is the Python memory still held once loading is done.
+
+Run from the project directory with:
+    python -m benchmarks.asset_loading_benchmark
+"""
+
+import json
+import tracemalloc
+from typing import Callable
+
+from benchmarks.benchmark_helpers import time_per_call
+from game_repository.file_manager import FileManager
+from game_repository.game_repository import GameRepository
+
+
+def eager_load() -> GameRepository:
+    """Load the shared content the way the game did before it was read on demand."""
+    repository = GameRepository()
+    repository.language.load_language()
+    for file_name in [FileManager.stories_file, FileManager.game_art_file]:
+        with open(FileManager.join_base_path(file_name), "r") as asset_file:
+            json.loads(asset_file.read())
+    repository.items.load_items(new=True)
+    return repository
+
+
+def lazy_load() -> GameRepository:
+    """Load the shared content the way the game does now."""
+    repository = GameRepository()
+    repository.load_default_state()
+    return repository
+
+
+def retained_bytes(load: Callable[[], GameRepository]) -> int:
+    """Return the bytes of Python memory held by what the load returned."""
+    tracemalloc.start()
+    repository = load()
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del repository
+    return retained
+
+
+def main() -> None:
+    """Run the asset loading benchmark."""
+    eager = time_per_call(eager_load, 200)
+    lazy = time_per_call(lazy_load, 200)
+    repository = lazy_load()
+    first_art = time_per_call(
+        lambda: repository.art_manager.load_art()
+        or repository.art_manager.get_art_by_name("game_map"),
+        200,
+    )
+    cached_art = time_per_call(
+        lambda: repository.art_manager.get_art_by_name("game_map"), 2000
+    )
+    print(
+        f"eager startup load   {eager:>8.1f} us  {retained_bytes(eager_load):>9,} bytes"
+    )
+    print(
+        f"lazy startup load    {lazy:>8.1f} us  {retained_bytes(lazy_load):>9,} bytes"
+    )
+    print(f"first map drawn      {first_art:>8.1f} us")
+    print(f"map drawn again      {cached_art:>8.3f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,21 @@
+"""Helpful methods for benchmarking."""
+
+import timeit
+from typing import Callable
+
+
+def time_per_call(
+    function: Callable[[], object], number: int, repeat: int = 5
+) -> float:
+    """Return the best observed time in microseconds for a single call."""
+    best = min(timeit.repeat(function, number=number, repeat=repeat))
+    return best / number * 1_000_000
+
+
+def print_comparison(name: str, baseline: float, candidate: float) -> None:
+    """Print the timings of a baseline and a candidate implementation."""
+    speedup = baseline / candidate if candidate > 0 else float("inf")
+    print(
+        f"{name:<32} baseline {baseline:>10.3f} us"
+        + f"  indexed {candidate:>10.3f} us  ({speedup:,.1f}x)"
+    )
@@ -0,0 +1,78 @@
+"""Compare starting the game from the content bundle with starting it from the data files.
+
+Each start runs in a new Python process, from before the game is imported
+until the first command has been answered. The bundle is built in a temporary
+directory rather than the data folder.
+
+Run from the project directory with:
+    python -m benchmarks.cold_start_benchmark
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+from game_repository.build_content import build
+from game_repository.file_manager import FileManager
+
+runs = 15
+
+start_game = """
+import sys
+import time
+
+start = time.perf_counter()
+from ForkOff import AdventureGame
+from game_repository.file_manager import FileManager
+
+imported = time.perf_counter()
+FileManager.content_bundle_file = sys.argv[1]
+game = AdventureGame().initialize_game(False)
+game.router.route(game.text_parser.parse_text("newgame", False))
+game.run_command("look")
+finished = time.perf_counter()
+print(imported - start, finished - imported)
+"""
+
+
+def time_starts(bundle_file: str) -> tuple[float, float]:
+    """Return the median import and load times in milliseconds of new processes."""
+    imports: list[float] = []
+    loads: list[float] = []
+    project = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    for _ in range(runs):
+        result = subprocess.run(
+            [sys.executable, "-c", start_game, bundle_file],
+            cwd=project,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        imported, loaded = result.stdout.split()
+        imports.append(float(imported) * 1000)
+        loads.append(float(loaded) * 1000)
+    return statistics.median(imports), statistics.median(loads)
+
+
+def main() -> None:
+    """Run the cold start benchmark."""
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_file = os.path.join(directory, "content.bundle")
+        FileManager.content_bundle_file = bundle_file
+        problems = build()
+        if problems:
+            raise RuntimeError("\n".join(problems))
+        bundle_bytes = os.path.getsize(bundle_file)
+        missing_file = os.path.join(directory, "missing.bundle")
+        json_import, json_load = time_starts(missing_file)
+        bundle_import, bundle_load = time_starts(bundle_file)
+    print(f"median of {runs} new processes    import    load to first answer")
+    print(f"data files               {json_import:>9.1f} ms {json_load:>9.1f} ms")
+    print(f"content bundle           {bundle_import:>9.1f} ms {bundle_load:>9.1f} ms")
+    print(f"content bundle size      {bundle_bytes:>9,} bytes")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""Show that saving tracked changes costs time with the edits rather than the world.
+
+Run from the project directory with:
+    python -m benchmarks.dirty_save_benchmark
+"""
+
+from benchmarks.benchmark_helpers import time_per_call
+from benchmarks.item_manager_benchmark import synthetic_items
+from benchmarks.objective_manager_benchmark import synthetic_objectives
+from benchmarks.synthetic_world import grid_rooms, room_name
+from common.player import Player
+from game_repository.change_tracker import ChangeTracker
+from game_repository.save_state import SaveState
+
+items_per_room = 10
+
+
+def stocked_world(item_count: int):
+    """Return a player, rooms, items and objectives with the items spread out."""
+    items = synthetic_items(item_count)
+    rooms = grid_rooms(item_count // items_per_room)
+    item_list = list(items.values())
+    for number, room in enumerate(rooms.values()):
+        start = number * items_per_room
+        room.inventory = item_list[start : start + items_per_room]
+        room.starting_inventory = list(room.inventory)
+    objectives = synthetic_objectives(item_count // items_per_room)
+    player = Player(
+        name="Player 1",
+        location=rooms[room_name(0)],
+        visited_rooms=[room_name(0)],
+        inventory=[],
+        won=False,
+        watched_end_credits=False,
+    )
+    return player, rooms, items, objectives
+
+
+def make_edits(player, rooms, items, objectives, count: int) -> ChangeTracker:
+    """Take items from rooms across the world and return the tracked changes."""
+    tracker = ChangeTracker()
+    room_list = list(rooms.values())
+    objective_list = list(objectives.values())
+    for number in range(count):
+        room = room_list[number * len(room_list) // count]
+        item = room.inventory.pop()
+        item.discovered = True
+        player.inventory.append(item)
+        objective = objective_list[number * len(objective_list) // count]
+        objective.interactions[0]["complete"] = True
+        tracker.mark_items([item])
+        tracker.mark_room(room)
+        tracker.mark_objective(objective)
+    return tracker
+
+
+def main() -> None:
+    """Run the dirty save benchmark."""
+    print(
+        f"{'items':>8} {'edits':>6} {'compare everything':>20} {'tracked changes':>17}"
+    )
+    for item_count in [1_000, 10_000, 100_000]:
+        for edit_count in [1, 10, 100]:
+            player, rooms, items, objectives = stocked_world(item_count)
+            save_state = SaveState(rooms, items, objectives)
+            unchanged = save_state.changes(player, rooms, items, objectives)
+            tracker = make_edits(player, rooms, items, objectives, edit_count)
+            number = max(1, 100_000 // item_count)
+            full = time_per_call(
+                lambda: save_state.changes(player, rooms, items, objectives), number
+            )
+            tracked = time_per_call(
+                lambda: save_state.update_changes(
+                    unchanged, tracker, player, rooms, items, objectives
+                ),
+                number * 10,
+            )
+            print(
+                f"{item_count:>8,} {edit_count:>6} {full / 1000:>17.3f} ms"
+                + f" {tracked / 1000:>14.3f} ms"
+            )
+
+
+if __name__ == "__main__":
+    main()
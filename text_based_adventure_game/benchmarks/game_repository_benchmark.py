@@ -0,0 +1,89 @@
+"""Compare the room index with scanning every room on generated maps.
+
+Run from the project directory with:
+    python -m benchmarks.game_repository_benchmark
+"""
+
+import timeit
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from benchmarks.synthetic_world import grid_rooms, room_name
+from common.game_request import GameRequest
+from common.player import Player
+from common.request_type import RequestType
+from common.room import Room
+from game_repository.game_repository import GameRepository
+from services.movement_service import MovementService
+
+
+class ScanningGameRepository(GameRepository):
+    """A game repository which finds rooms by scanning all of them."""
+
+    def get_room_by_name(self, name: str | None) -> Room | None:
+        """Find the room with the given name by checking every room."""
+        for room in self.rooms.values():
+            if room.name == name or name in room.aliases:
+                return room
+        return None
+
+    def get_room_by_direction(self, direction: str | None) -> Room | None:
+        """Find the room in the given direction by name."""
+        if direction is None:
+            return None
+        parsed_direction = self.language.get_directional_alias(direction)
+        if parsed_direction is None:
+            return None
+        directional_exit = self.current_location.directional_exit(parsed_direction)
+        return self.get_room_by_name(
+            "" if directional_exit is None else directional_exit
+        )
+
+
+def walk(repository: GameRepository, steps: list[str]) -> None:
+    """Move the player through the given directions and back to the start."""
+    service = MovementService(repository)
+    repository.player.location = repository.rooms[room_name(0)]
+    for step in steps:
+        service.move(GameRequest(RequestType.MOVE, [step]))
+
+
+def make_repository(repository: GameRepository, count: int) -> GameRepository:
+    """Load the language and a generated map into the repository."""
+    repository.language.load_language()
+    repository.rooms = grid_rooms(count)
+    repository.player = Player(
+        "Player", repository.rooms[room_name(0)], [], [], False, False
+    )
+    return repository
+
+
+def main() -> None:
+    """Run the game repository benchmark."""
+    for count in [100, 1_000, 10_000, 40_000]:
+        rooms = grid_rooms(count)
+        indexed = make_repository(GameRepository(), count)
+        scanning = make_repository(ScanningGameRepository(), count)
+        build_time = timeit.timeit(lambda: setattr(indexed, "rooms", rooms), number=1)
+        indexed.player.location = indexed.rooms[room_name(0)]
+        names = [f"hall {number}" for number in range(0, count, max(1, count // 20))]
+        steps = ["east"] * 8 + ["south", "west", "room 0", "south"]
+        number = max(1, 2_000 // count)
+        print(f"{count} rooms, index built in {build_time * 1000:.1f} ms")
+        print_comparison(
+            f"get_room_by_name x{len(names)}",
+            time_per_call(
+                lambda: [scanning.get_room_by_name(name) for name in names], number
+            ),
+            time_per_call(
+                lambda: [indexed.get_room_by_name(name) for name in names], number
+            ),
+        )
+        print_comparison(
+            f"move x{len(steps)}",
+            time_per_call(lambda: walk(scanning, steps), number, repeat=3),
+            time_per_call(lambda: walk(indexed, steps), number, repeat=3),
+        )
+
+
+if __name__ == "__main__":
+    main()
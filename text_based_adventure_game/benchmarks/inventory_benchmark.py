@@ -0,0 +1,75 @@
+"""Compare inventories kept in lists with ordered inventories, in crowded rooms.
+
+The containers are compared by checking for, removing and adding back the
+item which was added last, the worst case for a list. Then a player takes and
+drops the last item of a generated room, which should cost the same however
+many items the room holds.
+
+Run from the project directory with:
+    python -m benchmarks.inventory_benchmark
+"""
+
+import tempfile
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from benchmarks.suite import start_game, write_bundle
+from benchmarks.synthetic_world import synthetic_content
+from common.inventory import Inventory
+from common.item import Item
+from game_repository.file_manager import FileManager
+
+sizes = [1_000, 10_000, 100_000]
+
+
+def make_items(count: int) -> list[Item]:
+    """Return the given number of items with different names."""
+    return [
+        Item(f"thing {number}", [], [], {}, True, True, {}) for number in range(count)
+    ]
+
+
+def move_last(container: list[Item] | Inventory, item: Item) -> None:
+    """Check for the item, then remove it and add it back."""
+    if item in container:
+        container.remove(item)
+        container.append(item)
+
+
+def take_and_drop(items: int) -> float:
+    """Return the time for a player to take and drop the last item of a room."""
+    original_bundle_file = FileManager.content_bundle_file
+    with tempfile.TemporaryDirectory() as directory:
+        bundle_file = write_bundle(
+            directory, "crowded", synthetic_content(2, 2 * items, 1)
+        )
+        game = start_game(bundle_file)
+        FileManager.content_bundle_file = original_bundle_file
+    room = game.game_repository.current_location
+    last = list(room.inventory)[-1].name
+
+    def turn() -> None:
+        game.run_command(f"take {last}")
+        game.run_command(f"drop {last}")
+
+    return time_per_call(turn, 200) / 2
+
+
+def main() -> None:
+    """Run the inventory benchmark."""
+    for size in sizes:
+        items = make_items(size)
+        listed = list(items)
+        inventory = Inventory(items)
+        print_comparison(
+            f"move the last of {size:,} items",
+            time_per_call(lambda: move_last(listed, items[-1]), 200),
+            time_per_call(lambda: move_last(inventory, items[-1]), 200),
+        )
+    for size in [100, 1_000, 10_000]:
+        print(
+            f"{f'take and drop among {size:,} items':<32} {take_and_drop(size):>8.2f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Compare the item name index with a linear scan over a large item catalogue.
+
+Run from the project directory with:
+    python -m benchmarks.item_manager_benchmark
+"""
+
+import timeit
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.item import Item
+from game_repository.item_manager import ItemManager
+
+
+def synthetic_items(count: int) -> dict[str, Item]:
+    """Return a catalogue of items that each have a few aliases."""
+    items: dict[str, Item] = dict()
+    for number in range(count):
+        name = f"item {number}"
+        items[name] = Item(
+            name=name,
+            alias=[f"alias {number}", f"thing {number}", f"object {number}"],
+            description=[name],
+            look_at_message={"line1": name},
+            is_collectible=True,
+            discovered=False,
+            interactions={},
+        )
+    return items
+
+
+def linear_item_by_name(manager: ItemManager, name: str | None) -> Item | None:
+    """Find an item by name or alias by checking every item."""
+    for item in manager.items.values():
+        if item.name == name or name in item.alias:
+            return item
+    return None
+
+
+def main() -> None:
+    """Run the item manager benchmark."""
+    for count in [100, 1_000, 10_000, 50_000]:
+        manager = ItemManager()
+        items = synthetic_items(count)
+        build_time = timeit.timeit(lambda: setattr(manager, "items", items), number=1)
+        names = [f"thing {number}" for number in range(0, count, max(1, count // 20))]
+        names.append("missing item")
+        number = max(1, 20_000 // count)
+        print(f"{count} items, index built in {build_time * 1000:.1f} ms")
+        print_comparison(
+            f"get_item_by_name x{len(names)}",
+            time_per_call(
+                lambda: [linear_item_by_name(manager, name) for name in names], number
+            ),
+            time_per_call(
+                lambda: [manager.get_item_by_name(name) for name in names], number
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
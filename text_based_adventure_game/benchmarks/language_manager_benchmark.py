@@ -0,0 +1,66 @@
+"""Compare the vocabulary index with the linear scan it replaced.
+
+Run from the project directory with:
+    python -m benchmarks.language_manager_benchmark
+"""
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.request_type import RequestType
+from language.language_manager import LanguageManager
+
+
+def linear_request_type(manager: LanguageManager, request_text: str) -> RequestType:
+    """Resolve a request type by scanning every language group in order."""
+    for group, request_type in LanguageManager.request_type_groups:
+        if request_text in manager.language.get(group, []):
+            return request_type
+    return RequestType.UNKNOWN
+
+
+def linear_command_target(manager: LanguageManager, command: str) -> str | None:
+    """Resolve a command target by scanning every language group in order."""
+    for group, command_target in LanguageManager.command_target_groups:
+        if command in manager.language.get(group, []):
+            return command_target
+    return None
+
+
+def linear_aliases(manager: LanguageManager, item_name: str) -> list[str]:
+    """Resolve the aliases of a phrase by scanning every language group in order."""
+    for group in LanguageManager.alias_groups:
+        aliases = manager.language.get(group, [])
+        if item_name in aliases:
+            return aliases
+    return []
+
+
+def main() -> None:
+    """Run the language manager benchmark."""
+    manager = LanguageManager()
+    manager.load_language()
+    phrases = sorted(manager.vocabulary.keys()) + ["not a phrase", "kitchen"]
+    number = 200
+
+    def run_all(lookup):
+        return lambda: [lookup(manager, phrase) for phrase in phrases]
+
+    print(f"{len(phrases)} phrases per run")
+    print_comparison(
+        "get_request_type",
+        time_per_call(run_all(linear_request_type), number),
+        time_per_call(run_all(LanguageManager.get_request_type), number),
+    )
+    print_comparison(
+        "find_command_target",
+        time_per_call(run_all(linear_command_target), number),
+        time_per_call(run_all(LanguageManager.find_command_target), number),
+    )
+    print_comparison(
+        "get_request_type_aliases",
+        time_per_call(run_all(linear_aliases), number),
+        time_per_call(run_all(LanguageManager.get_request_type_aliases), number),
+    )
+
+
+if __name__ == "__main__":
+    main()
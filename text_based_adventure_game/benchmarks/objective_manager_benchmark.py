@@ -0,0 +1,96 @@
+"""Compare the interaction index with scanning every objective after an interaction.
+
+Run from the project directory with:
+    python -m benchmarks.objective_manager_benchmark
+"""
+
+import timeit
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.game_objective import GameObjective
+from common.item import Item
+from game_repository.objectives_manager import ObjectiveManager
+
+actions = ["use", "use_with", "turn on", "eat", "feed"]
+
+
+def synthetic_objectives(count: int) -> dict[str, GameObjective]:
+    """Return generated quests that each need a few interactions on nearby items."""
+    objectives: dict[str, GameObjective] = dict()
+    for number in range(count):
+        name = f"quest {number}"
+        interactions = [
+            {
+                "interaction_type": actions[(number + offset) % len(actions)],
+                "item": f"item {(number + offset) % count}",
+                "complete": False,
+            }
+            for offset in range(3)
+        ]
+        objectives[name] = GameObjective(
+            name=name,
+            hints=[f"Finish quest {number}."],
+            requirements=[f"item {number}"],
+            interactions=interactions,
+        )
+    return objectives
+
+
+def scanning_update(manager: ObjectiveManager, item: Item, action: str) -> None:
+    """Complete interactions by checking every interaction of every objective."""
+    for objective in manager.objectives.values():
+        for interaction in objective.interactions:
+            if (
+                interaction.get("item") == item.name
+                and interaction.get("interaction_type") == action
+            ):
+                for candidate in objective.interactions:
+                    if (
+                        candidate["item"] == item.name
+                        and candidate["interaction_type"] == action
+                    ):
+                        candidate["complete"] = True
+
+
+def indexed_update(manager: ObjectiveManager, item: Item, action: str) -> None:
+    """Complete interactions the way the interaction service does."""
+    for objective in manager.find_related_objectives(item, action):
+        objective.complete_interaction_objective(item.name, action)
+        manager.invalidate_objective(objective)
+
+
+def synthetic_item(name: str) -> Item:
+    """Return an item that only has a name."""
+    return Item(
+        name=name,
+        alias=[],
+        description=[name],
+        look_at_message={},
+        is_collectible=True,
+        discovered=True,
+        interactions={},
+    )
+
+
+def main() -> None:
+    """Run the objective manager benchmark."""
+    for count in [100, 1_000, 5_000, 20_000]:
+        manager = ObjectiveManager()
+        objectives = synthetic_objectives(count)
+        manager.objectives = objectives
+        build_time = timeit.timeit(
+            lambda: manager.build_interaction_index(objectives), number=1
+        )
+        item = synthetic_item(f"item {count // 2}")
+        action = actions[(count // 2) % len(actions)]
+        number = max(1, 20_000 // count)
+        print(f"{count} objectives, index built in {build_time * 1000:.1f} ms")
+        print_comparison(
+            "complete interaction",
+            time_per_call(lambda: scanning_update(manager, item, action), number),
+            time_per_call(lambda: indexed_update(manager, item, action), number),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+"""Compare parsing repeated commands through the parse cache and without it.
+
+Each command is parsed again and again in one world epoch, where every parse
+after the first is answered by the cache. Walking back and forth between two rooms shows how
+often commands are reused while the world keeps changing.
+
+Run from the project directory with:
+    python -m benchmarks.parse_cache_benchmark
+"""
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from ForkOff import AdventureGame
+from game_repository.memory_save_storage import MemorySaveStorage
+
+commands = [
+    "look",
+    "inventory",
+    "go north",
+    "inspect the flashlight",
+    "use the old brass key with the wine cellar door",
+]
+
+walk = ["look", "inspect flashlight", "south", "look", "inventory", "north"] * 20
+
+
+def main() -> None:
+    """Run the parse cache benchmark."""
+    game = AdventureGame().initialize_game(False, MemorySaveStorage())
+    game.game_repository.try_load_game_state(new=True)
+    parser = game.text_parser
+    number = 20_000
+    for command in commands:
+        print_comparison(
+            command,
+            time_per_call(lambda: parser.parse_new_text(command, True), number),
+            time_per_call(lambda: parser.parse_text(command, True), number),
+        )
+    for command in ["take flashlight", "turn on flashlight"]:
+        game.run_command(command)
+    parser.parse_cache.clear()
+    for command in walk:
+        game.run_command(command)
+    print(parser.parse_cache.statistics())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""Measure what profiling costs a turn, and what it costs once it is turned off.
+
+A game answers the same commands with no profiler, with the profiler attached,
+and after its instruments are removed again, which is how the game runs
+without --profile.
+
+Run from the project directory with:
+    python -m benchmarks.profiler_benchmark
+"""
+
+from benchmarks.benchmark_helpers import time_per_call
+from common.profiler import Profiler
+from ForkOff import AdventureGame
+from game_repository.memory_save_storage import MemorySaveStorage
+
+commands = ["look", "inventory", "inspect flashlight", "north", "south"]
+
+
+def play(game: AdventureGame) -> None:
+    """Answer each of the commands once, ending a turn after each."""
+    for command in commands:
+        game.run_command(command)
+        game.end_turn()
+
+
+def main() -> None:
+    """Run the profiler benchmark."""
+    game = AdventureGame().initialize_game(True, MemorySaveStorage())
+    game.game_repository.try_load_game_state(new=True)
+    number = 2000
+    unprofiled = time_per_call(lambda: play(game), number) / len(commands)
+    profiler = Profiler()
+    game.attach_profiler(profiler)
+    profiled = time_per_call(lambda: play(game), number) / len(commands)
+    profiler.spans.clear()
+    play(game)
+    span_count = len(profiler.spans) / len(commands)
+    profiler.remove_instruments()
+    game.router.register_controllers()
+    game.profiler = None
+    game.game_repository.profiler = None
+    removed = time_per_call(lambda: play(game), number) / len(commands)
+    print(f"{'no profiler':<28} {unprofiled:>8.2f} us a turn")
+    print(
+        f"{'profiling':<28} {profiled:>8.2f} us a turn"
+        f"  ({span_count:.1f} spans a turn)"
+    )
+    print(f"{'profiler removed':<28} {removed:>8.2f} us a turn")
+
+
+if __name__ == "__main__":
+    main()
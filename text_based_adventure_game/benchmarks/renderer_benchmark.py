@@ -0,0 +1,145 @@
+"""Count the writes and sleeps needed to print a screen of game text.
+
+Every write to the raw stream is one write system call.
+
+Run from the project directory with:
+    python -m benchmarks.renderer_benchmark
+"""
+
+import contextlib
+import io
+import textwrap
+import time
+
+from benchmarks.benchmark_helpers import time_per_call
+from common.environment import Environment
+from common.game_message import GameMessage
+from common.game_request import GameRequest
+from common.message_type import MessageType
+from common.request_type import RequestType
+from ForkOff import AdventureGame
+from game_repository.game_repository import GameRepository
+from language.terminal_renderer import TerminalRenderer
+from language.text_parser import TextParser
+
+
+class CountingRawStream(io.RawIOBase):
+    """A raw stream which counts the writes that reach it."""
+
+    def __init__(self: "CountingRawStream") -> None:
+        """Initialize the stream."""
+        self.writes = 0
+
+    def writable(self: "CountingRawStream") -> bool:
+        """Return True because the stream can be written to."""
+        return True
+
+    def write(self: "CountingRawStream", data: bytes) -> int:
+        """Count the write and discard the data."""
+        self.writes += 1
+        return len(data)
+
+
+class FakeClock:
+    """A clock which only moves forward when something sleeps."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.sleeps = 0
+
+    def time(self: "FakeClock") -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self: "FakeClock", seconds: float) -> None:
+        """Move the clock forward."""
+        self.sleeps += 1
+        self.now += seconds
+
+
+class PerCharacterTextParser(TextParser):
+    """A text parser which prints and sleeps once per character."""
+
+    clock = FakeClock()
+
+    def scroll_print(self: "PerCharacterTextParser", text: str) -> None:
+        """Print one character at a time."""
+        for character in text:
+            print(character, end="", flush=True)
+            PerCharacterTextParser.clock.sleep(self.repository.scroll_delay)
+        print()
+
+    def print_single_message(
+        self: "PerCharacterTextParser", message: GameMessage, add_spaces: bool
+    ) -> None:
+        """Print art line by line through scroll_print."""
+        if message.should_print_blank_line():
+            print()
+        elif message.should_wrap():
+            for line in textwrap.wrap(str(message), width=80):
+                self.scroll_print_with_spaces(line, add_spaces)
+        elif message.message_type == MessageType.ART:
+            old_delay = self.repository.scroll_delay
+            self.repository.scroll_delay = 0.002
+            for line in message.contents:
+                self.scroll_print_with_spaces(line, add_spaces)
+            self.repository.scroll_delay = old_delay
+        else:
+            self.scroll_print_with_spaces(str(message), add_spaces)
+
+
+def screen_messages(game: AdventureGame) -> dict[str, list[GameMessage]]:
+    """Return the messages for a room description and for the title art."""
+    router = game.text_parser.router
+    look = router.route(GameRequest(RequestType.LOOK, [None]))
+    art = router.route(GameRequest(RequestType.DRAW, ["intro_art"]))
+    return {"room description": look.messages, "title art": art.messages}
+
+
+def print_screen(parser: TextParser, messages: list[GameMessage]) -> int:
+    """Print the messages through a buffered stdout and return the raw writes."""
+    raw = CountingRawStream()
+    stdout = io.TextIOWrapper(io.BufferedWriter(raw), encoding="utf-8")
+    with contextlib.redirect_stdout(stdout):
+        parser.print_list_of_messages(messages, True)
+    stdout.flush()
+    return raw.writes
+
+
+def main() -> None:
+    """Run the renderer benchmark."""
+    game = AdventureGame().initialize_game(True)
+    game.game_repository.try_load_game_state(new=True)
+    repository = game.game_repository
+    repository.environment = Environment(False)
+    baseline = PerCharacterTextParser(game.text_parser.router, repository)
+    candidate = game.text_parser
+    for screen, messages in screen_messages(game).items():
+        for name, delay in [
+            ("normal", GameRepository.normal_scroll_delay),
+            ("fast", GameRepository.fast_scroll_delay),
+        ]:
+            repository.scroll_delay = delay
+            PerCharacterTextParser.clock = FakeClock()
+            baseline_writes = print_screen(baseline, messages)
+            baseline_clock = PerCharacterTextParser.clock
+            clock = FakeClock()
+            candidate.renderer = TerminalRenderer(None, clock.time, clock.sleep)
+            candidate_writes = print_screen(candidate, messages)
+            print(
+                f"{screen:<18} {name:<6}"
+                + f" baseline {baseline_writes:>5} writes {baseline_clock.sleeps:>5}"
+                + f" sleeps {baseline_clock.now:>6.2f} s"
+                + f"  renderer {candidate_writes:>4} writes {clock.sleeps:>4}"
+                + f" sleeps {clock.now:>6.2f} s"
+            )
+    repository.scroll_delay = GameRepository.off_scroll_delay
+    candidate.renderer = TerminalRenderer(None, time.monotonic, lambda _: None)
+    messages = screen_messages(game)["room description"]
+    cpu = time_per_call(lambda: print_screen(candidate, messages), 100)
+    print(f"room description without a delay: {cpu:.1f} us per screen")
+
+
+if __name__ == "__main__":
+    main()
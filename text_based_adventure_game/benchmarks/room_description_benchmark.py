@@ -0,0 +1,73 @@
+"""Compare rendering room descriptions on every look with rendering them once.
+
+The baseline renders the description the way it was before it was kept,
+looking up each mentioned item in the starting inventory. The candidate is
+the description the room keeps until a mentioned item is found or hidden.
+
+Run from the project directory with:
+    python -m benchmarks.room_description_benchmark
+"""
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.item import Item
+from common.room import Room
+
+sizes = [10, 100, 1_000]
+
+
+def make_room(count: int) -> Room:
+    """Return a room whose description mentions each of its starting items."""
+    items = [
+        Item(f"thing {number}", [], [], {}, True, number % 2 == 0, {})
+        for number in range(count)
+    ]
+    description = {"default": "A room full of things."}
+    description.update({item.name: f"There is {item.name} here." for item in items})
+    return Room("room", description, [], {}, [], items, items, [])
+
+
+def render(room: Room) -> str:
+    """Render the description of the room without keeping it."""
+    description = ""
+    for key in room._description.keys():
+        possible_item = None
+        for item in room.starting_inventory:
+            if item.name == key:
+                possible_item = item
+                break
+        if possible_item is not None:
+            if (
+                possible_item.is_collectible
+                and not possible_item.discovered
+                and not possible_item.hidden
+            ):
+                description += f"{room._description[key]} "
+        else:
+            description += f"{room._description[key]} "
+    return description
+
+
+def main() -> None:
+    """Run the room description benchmark."""
+    for size in sizes:
+        room = make_room(size)
+        assert render(room) == room.description
+        print_comparison(
+            f"describe a room of {size:,} items",
+            time_per_call(lambda: render(room), 200),
+            time_per_call(lambda: room.description, 200),
+        )
+        last = room.starting_inventory[-1]
+
+        def discover_and_describe() -> None:
+            last.hidden = not last.hidden
+            room.description
+
+        print(
+            f"{f'  after a flag changes':<32}"
+            f" {time_per_call(discover_and_describe, 200):>10.3f} us"
+        )
+
+
+if __name__ == "__main__":
+    main()
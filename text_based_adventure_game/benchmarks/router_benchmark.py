@@ -0,0 +1,95 @@
+"""Compare dispatching requests through the table with the chain of controllers.
+
+The chain is how requests were dispatched before: the router looked for the
+action in the request types of each controller in turn, and the controller
+then compared it with each case of its match statement. The services answer
+straight away, so only the cost of dispatching is timed.
+
+Run from the project directory with:
+    python -m benchmarks.router_benchmark
+"""
+
+from typing import Any
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.controller_type import ControllerType
+from common.game_request import GameRequest
+from common.game_response import GameResponse
+from common.request_type import RequestType
+from common.service_type import ServiceType
+from controllers.game_controller import GameController
+from controllers.interaction_controller import InteractionController
+from controllers.inventory_controller import InventoryController
+from controllers.movement_controller import MovementController
+from router.router import Router
+
+answer = GameResponse.success("Done.")
+
+
+class AnsweringService:
+    """A service whose every method answers straight away."""
+
+    def __getattr__(self: "AnsweringService", _: str) -> Any:
+        """Return a method which answers any request."""
+        return lambda request, **_: answer
+
+
+# The request types of a controller, and its cases in the order it matched them.
+Chain = list[tuple[list[RequestType], list[tuple[RequestType, Any]]]]
+
+
+def chained_route(chain: Chain, request: GameRequest) -> GameResponse:
+    """Dispatch a request the way the router and controllers used to."""
+    for request_types, cases in chain:
+        if request.action in request_types:
+            for request_type, handler in cases:
+                if request.action == request_type:
+                    return handler(request)
+    return GameResponse.failure("You are unsure how to do that.")
+
+
+def main() -> None:
+    """Run the router benchmark."""
+    services: dict[ServiceType, Any] = {
+        service_type: AnsweringService() for service_type in ServiceType
+    }
+    controllers = {
+        ControllerType.MOVEMENT: MovementController(services),
+        ControllerType.GAME: GameController(services),
+        ControllerType.INVENTORY: InventoryController(services),
+        ControllerType.INTERACTION: InteractionController(services),
+    }
+    router = Router(controllers)
+    chain = [
+        (controller.request_types, list(controller.handlers().items()))
+        for controller in controllers.values()
+    ]
+    # The chain checked the controllers in this order, so the interaction
+    # requests, which are most of a game, were dispatched last.
+    requests = [
+        GameRequest(request_type, [None])
+        for request_type in [
+            RequestType.MOVE,
+            RequestType.LOOK,
+            RequestType.TAKE,
+            RequestType.HELP,
+            RequestType.USE,
+            RequestType.FLUSH,
+            RequestType.UNKNOWN,
+        ]
+    ]
+    number = 100_000
+    for request in requests:
+        print_comparison(
+            request.action.name.lower(),
+            time_per_call(lambda: chained_route(chain, request), number),
+            time_per_call(lambda: router.route(request), number),
+        )
+    dispatched = time_per_call(
+        lambda: [router.route(request) for request in requests], number // 10
+    )
+    print(f"{'dispatch throughput':<32} {len(requests) / dispatched:,.1f} M/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare the single file save with the four pretty printed JSON files it replaced.
+
+Saves are written to a temporary directory rather than the save_data folder. The
+single file save is timed both until it is written and until the game can go on.
+
+Run from the project directory with:
+    python -m benchmarks.save_benchmark
+"""
+
+import copy
+import json
+import os
+import tempfile
+
+from benchmarks.benchmark_helpers import time_per_call
+from game_repository.file_manager import FileManager
+from game_repository.game_repository import GameRepository
+
+
+def legacy_save(repository: GameRepository, directory: str) -> int:
+    """Save every item, room and objective the old way and return the bytes written."""
+    player = copy.deepcopy(vars(repository.player))
+    player["inventory"] = [item.name for item in repository.player.inventory]
+    player["location"] = repository.player.location.name
+    rooms = []
+    for room in repository.rooms.values():
+        serializable_room = copy.deepcopy(vars(room))
+        serializable_room["inventory"] = room.inventory_item_names
+        serializable_room["starting_inventory"] = [
+            item.name for item in room.starting_inventory
+        ]
+        serializable_room["description"] = serializable_room.pop("_description")
+        rooms.append(serializable_room)
+    items = []
+    for item in repository.items.items.values():
+        serializable_item = copy.deepcopy(vars(item))
+        serializable_item["description"] = serializable_item.pop("_description")
+        items.append(serializable_item)
+    objectives = [
+        {
+            "name": objective.name,
+            "interactions": copy.deepcopy(objective.interactions),
+            "requires": list(objective.requirements),
+            "hints": list(objective._hints),
+        }
+        for objective in repository.objectives.objectives.values()
+    ]
+    written = 0
+    for name, state in [
+        ("player", player),
+        ("rooms", rooms),
+        ("items", items),
+        ("objectives", objectives),
+    ]:
+        with open(os.path.join(directory, f"{name}.json"), "w") as state_file:
+            written += state_file.write(json.dumps(state, indent=4))
+    return written
+
+
+def played_game() -> GameRepository:
+    """Return a new game with a few things changed, as if it had been played."""
+    repository = GameRepository()
+    repository.try_load_game_state(new=True)
+    room = repository.player.location
+    for item in list(room.inventory)[:2]:
+        room.inventory.remove(item)
+        repository.player.inventory.append(item)
+        item.discovered = True
+    objective = next(iter(repository.objectives.objectives.values()))
+    objective.interactions[0]["complete"] = True
+    return repository
+
+
+def main() -> None:
+    """Run the save benchmark."""
+    repository = played_game()
+    with tempfile.TemporaryDirectory() as directory:
+        FileManager.saved_game_file = os.path.join(directory, "game.sav")
+        repository.save_game_state()
+        repository.finish_saving()
+        legacy_bytes = legacy_save(repository, directory)
+        save_bytes = os.path.getsize(FileManager.saved_game_file)
+        legacy = time_per_call(lambda: legacy_save(repository, directory), 20)
+        submit = time_per_call(repository.save_game_state, 200)
+        repository.finish_saving()
+        save = time_per_call(
+            lambda: (repository.save_game_state(), repository.finish_saving()), 200
+        )
+        loaded = GameRepository()
+        load = time_per_call(lambda: loaded.try_load_game_state(new=False), 200)
+        decode = time_per_call(FileManager.get_saved_game, 200)
+    print(f"four JSON files  save {legacy / 1000:>7.3f} ms  {legacy_bytes:>7,} bytes")
+    print(f"single save file save {save / 1000:>7.3f} ms  {save_bytes:>7,} bytes")
+    print(f"turn loop wait on save {submit / 1000:>6.3f} ms")
+    print(f"single save file read {decode / 1000:>7.3f} ms")
+    print(f"load saved game       {load / 1000:>7.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
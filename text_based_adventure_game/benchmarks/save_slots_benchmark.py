@@ -0,0 +1,55 @@
+"""Compare listing saved games from the index with reading every save file.
+
+A directory of saves is written to a temporary directory, as a server hosting
+many players would have. Listing them from the index is compared with reading
+each whole save file, and with rebuilding the index from the start of each one.
+
+Run from the project directory with:
+    python -m benchmarks.save_slots_benchmark
+"""
+
+import os
+import tempfile
+
+from benchmarks.benchmark_helpers import time_per_call
+from benchmarks.save_benchmark import played_game
+from game_repository.file_manager import FileManager
+from game_repository.save_file import SaveFile
+from game_repository.save_slots import SaveSlots
+
+slot_count = 2000
+
+
+def read_every_save() -> list[dict]:
+    """Read and decode every save file, as listing them without metadata would."""
+    states = []
+    for slot in FileManager.get_save_slot_names():
+        with open(FileManager.get_save_slot_file(slot), "rb") as save_file:
+            states.append(SaveFile.decode(save_file.read()))
+    return states
+
+
+def main() -> None:
+    """Run the save slots benchmark."""
+    repository = played_game()
+    with tempfile.TemporaryDirectory() as directory:
+        FileManager.saved_game_file = os.path.join(directory, "game.sav")
+        repository.save_game_state("player-0")
+        repository.finish_saving()
+        state = FileManager.get_saved_game("player-0")
+        metadata = repository.get_save_metadata()
+        for number in range(slot_count):
+            FileManager.save_game_file(state, f"player-{number}", metadata)
+        save_bytes = os.path.getsize(FileManager.get_save_slot_file("player-0"))
+        assert len(SaveSlots.list_slots()) == slot_count
+        read_all = time_per_call(read_every_save, number=1)
+        rebuild = time_per_call(SaveSlots.rebuild_index, number=1)
+        indexed = time_per_call(SaveSlots.list_slots, number=1)
+    print(f"listing {slot_count:,} saves of {save_bytes:,} bytes each")
+    print(f"read every save file     {read_all / 1000:>9.1f} ms")
+    print(f"rebuild from the headers {rebuild / 1000:>9.1f} ms")
+    print(f"list from the index      {indexed / 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Compare the throughput of saving and loading games with each save storage.
+
+Many sessions save and load their own slot at the same time, each on its own
+thread, sharing a single storage as the sessions of a server would. The SQLite
+storage is also timed saving every session in one batch, as a server writing
+its sessions' saves together would. Files are written to a temporary directory
+rather than the save_data folder.
+
+Run from the project directory with:
+    python -m benchmarks.save_storage_benchmark
+"""
+
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from benchmarks.save_benchmark import played_game
+from game_repository.file_manager import FileManager
+from game_repository.memory_save_storage import MemorySaveStorage
+from game_repository.save_storage import FileSaveStorage, SaveStorage
+from game_repository.sqlite_save_storage import SqliteSaveStorage
+
+sessions = 64
+rounds = 10
+
+
+def play_session(
+    storage: SaveStorage, slot: str, state: dict[str, Any], metadata: dict[str, Any]
+) -> None:
+    """Save and load a session's slot a few times, as a player saving often would."""
+    for _ in range(rounds):
+        storage.save_game(state, slot, metadata)
+        storage.get_saved_game(slot)
+
+
+def time_sessions(
+    storage: SaveStorage, state: dict[str, Any], metadata: dict[str, Any]
+) -> float:
+    """Return how many saves and loads the sessions made each second together."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=sessions) as executor:
+        for session in range(sessions):
+            executor.submit(play_session, storage, f"player-{session}", state, metadata)
+    elapsed = time.perf_counter() - start
+    return sessions * rounds * 2 / elapsed
+
+
+def time_batches(
+    storage: SaveStorage, state: dict[str, Any], metadata: dict[str, Any]
+) -> float:
+    """Return how many saves each second are made saving every session together."""
+    batch = [(state, f"player-{session}", metadata) for session in range(sessions)]
+    start = time.perf_counter()
+    for _ in range(rounds):
+        storage.save_games(batch)
+    elapsed = time.perf_counter() - start
+    return sessions * rounds / elapsed
+
+
+def main() -> None:
+    """Run the save storage benchmark."""
+    repository = played_game()
+    with tempfile.TemporaryDirectory() as directory:
+        FileManager.saved_game_file = os.path.join(directory, "files", "game.sav")
+        repository.storage = MemorySaveStorage()
+        repository.save_writer.storage = repository.storage
+        repository.save_game_state()
+        repository.finish_saving()
+        state = repository.storage.get_saved_game(FileManager.default_save_slot)
+        metadata = repository.get_save_metadata()
+        storages: list[tuple[str, SaveStorage]] = [
+            ("files", FileSaveStorage()),
+            ("sqlite", SqliteSaveStorage(os.path.join(directory, "saves.db"))),
+            ("memory", MemorySaveStorage()),
+        ]
+        print(f"{sessions} sessions on their own threads, {rounds} rounds each")
+        print("storage     saves and loads a second   batched saves a second")
+        for name, storage in storages:
+            concurrent = time_sessions(storage, state, metadata)
+            batched = time_batches(storage, state, metadata)
+            print(f"{name:<10} {concurrent:>24,.0f} {batched:>24,.0f}")
+        storages[1][1].close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+"""Measure command latency with many players connected to the game server at once.
+
+Run from the project directory with:
+    python -m benchmarks.server_load_test --sessions 1000 --commands 20
+
+A server is started in a separate process unless --port is given.
+"""
+
+import argparse
+import asyncio
+import json
+import socket
+import subprocess
+import sys
+import time
+
+commands = [
+    "look",
+    "take flashlight",
+    "inventory",
+    "turn on flashlight",
+    "go south",
+    "look at piano",
+    "go north",
+    "drop flashlight",
+]
+
+
+async def play_session(
+    host: str, port: int, command_count: int, latencies: list[float]
+) -> None:
+    """Connect as one player, run the commands and record each round trip."""
+    reader, writer = await asyncio.open_connection(host, port)
+    await reader.readline()
+    for number in range(command_count):
+        command = commands[number % len(commands)]
+        start = time.perf_counter()
+        writer.write(f"{command}\n".encode("utf-8"))
+        response = json.loads(await reader.readline())
+        latencies.append(time.perf_counter() - start)
+        if response["status"] not in ["SUCCESS", "FAILURE"]:
+            raise ValueError(f"Unexpected response: {response}")
+    writer.write(b"exit\n")
+    await reader.readline()
+    writer.close()
+    await writer.wait_closed()
+
+
+async def run_load_test(
+    host: str, port: int, session_count: int, command_count: int
+) -> tuple[list[float], float]:
+    """Run every session at the same time and return the latencies and duration."""
+    latencies: list[float] = []
+    start = time.perf_counter()
+    await asyncio.gather(
+        *[
+            play_session(host, port, command_count, latencies)
+            for _ in range(session_count)
+        ]
+    )
+    return latencies, time.perf_counter() - start
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    """Return the value below which the given fraction of the values fall."""
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def free_port() -> int:
+    """Return a port that nothing is listening on."""
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        return probe.getsockname()[1]
+
+
+def start_server(port: int) -> subprocess.Popen:
+    """Start the game server in another process and wait for it to listen."""
+    server = subprocess.Popen(
+        [sys.executable, "-m", "server.game_server", "--port", str(port)]
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(("127.0.0.1", port), timeout=1).close()
+            return server
+        except OSError:
+            time.sleep(0.1)
+    server.kill()
+    raise RuntimeError("The game server did not start.")
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=None)
+    parser.add_argument("--sessions", type=int, default=1000)
+    parser.add_argument("--commands", type=int, default=20)
+    arguments = parser.parse_args()
+    port = arguments.port
+    server = None
+    if port is None:
+        port = free_port()
+        server = start_server(port)
+    try:
+        latencies, seconds = asyncio.run(
+            run_load_test(arguments.host, port, arguments.sessions, arguments.commands)
+        )
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait()
+    print(
+        f"{arguments.sessions} sessions, {len(latencies)} commands"
+        + f" in {seconds:.2f} s ({len(latencies) / seconds:,.0f} commands per second)"
+    )
+    print(
+        f"latency p50 {percentile(latencies, 0.5) * 1000:.2f} ms"
+        + f"  p99 {percentile(latencies, 0.99) * 1000:.2f} ms"
+        + f"  max {max(latencies) * 1000:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Compare copying the new game template with building a new game from its files.
+
+Run from the project directory with:
+    python -m benchmarks.session_spawn_benchmark
+"""
+
+import json
+
+from benchmarks.benchmark_helpers import time_per_call
+from game_repository.file_manager import FileManager
+from game_repository.game_content import GameContent
+from game_repository.game_repository import GameRepository
+from game_repository.item_manager import ItemManager
+from game_repository.objectives_manager import ObjectiveManager
+
+new_game_files = {
+    "items": FileManager.default_items_file,
+    "rooms": FileManager.default_room_file,
+    "player": FileManager.default_player_file,
+    "objectives": FileManager.default_objectives_file,
+}
+
+
+def read_new_game_text() -> dict[str, str]:
+    """Return the text of each new game file."""
+    text: dict[str, str] = dict()
+    for name, file_name in new_game_files.items():
+        with open(FileManager.join_base_path(file_name), "r") as data_file:
+            text[name] = data_file.read()
+    return text
+
+
+def build_new_game(
+    repository: GameRepository, text: dict[str, str], content: GameContent
+) -> None:
+    """Start a new game by parsing and building every part of the world."""
+    repository.items.items = ItemManager.build_items(json.loads(text["items"]))
+    repository.rooms = dict()
+    repository.apply_room_state(json.loads(text["rooms"]))
+    repository.apply_player_state(json.loads(text["player"]))
+    repository.objectives.objectives = ObjectiveManager.build_objectives(
+        json.loads(text["objectives"])
+    )
+    repository.target_phrases = content.template.target_phrases
+    repository.state_dirty = False
+
+
+def main() -> None:
+    """Run the session spawn benchmark."""
+    content = GameContent()
+    error = content.load()
+    if error is not None:
+        raise RuntimeError(error.message)
+    text = read_new_game_text()
+    repository = content.new_repository()
+    rebuilt = time_per_call(lambda: build_new_game(repository, text, content), 500)
+    copied = time_per_call(lambda: content.start_new_game(repository), 500)
+    spawned = time_per_call(content.new_repository, 500)
+    print(f"build a new game from its files  {rebuilt:>8.1f} us")
+    print(f"copy the new game template       {copied:>8.1f} us")
+    print(f"new session repository           {spawned:>8.1f} us")
+    print(f"speedup                          {rebuilt / copied:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+"""Time the hot paths of the game on the shipped content and on generated worlds.
+
+Each benchmark answers commands the way the game does, without a terminal or
+any sleeping, and states how its time is expected to grow with the world. The
+generated worlds are built from content bundles written to a temporary
+directory, so they are loaded the way the shipped content is.
+
+The results are saved as JSON, so that the results of two commits can be
+compared with --compare.
+
+Run from the project directory with:
+    python -m benchmarks.suite
+    python -m benchmarks.suite --quick --compare benchmarks/results/older.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Any, Callable
+
+from benchmarks.synthetic_world import synthetic_content
+from common.game_request import GameRequest
+from common.request_type import RequestType
+from ForkOff import AdventureGame
+from game_repository.content_bundle import ContentBundle
+from game_repository.file_manager import FileManager
+from game_repository.memory_save_storage import MemorySaveStorage
+
+# The generated worlds, by name, as numbers of rooms, items and objectives.
+worlds = {
+    "small": (100, 1_000, 100),
+    "medium": (1_000, 10_000, 1_000),
+    "large": (10_000, 100_000, 10_000),
+}
+
+# How each benchmark is expected to grow, in the number of rooms (r), items
+# (i) and objectives (o) of the world and the words of a command (w).
+expectations = {
+    "parse": "O(w^2), independent of the world",
+    "route": "O(1), independent of the world",
+    "move": "O(items in the room)",
+    "use/transform": "O(items in the room + objectives using the item)",
+    "look": "O(items in the room)",
+    "save": "O(changes since the last save), one item here",
+    "save everything": "O(r + i + o)",
+    "load": "O(r + i + o)",
+}
+
+
+class WorldCommands:
+    """The commands which exercise a world, two of each to undo the first."""
+
+    def __init__(
+        self: "WorldCommands",
+        parse: str,
+        moves: tuple[str, str],
+        uses: tuple[str, str],
+        setup: list[str] | None = None,
+    ) -> None:
+        """Initialize the commands of a world."""
+        self.parse = parse
+        self.moves = moves
+        self.uses = uses
+        self.setup = setup or []
+
+
+# No transformation of the shipped content can be undone, so turning on the
+# flashlight, which completes an objective, stands in for one.
+shipped_commands = WorldCommands(
+    parse="use the old brass key with the wine cellar door",
+    moves=("south", "north"),
+    uses=("turn on flashlight", "turn on flashlight"),
+    setup=["take flashlight", "turn on flashlight"],
+)
+generated_commands = WorldCommands(
+    parse="use the switch 0 with the thing 0-1",
+    moves=("south", "north"),
+    uses=("use switch 0", "use lit switch 0"),
+)
+
+
+def time_call(function: Callable[[], object], quick: bool) -> float:
+    """Return the best time in microseconds for a call, run for long enough."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    best = min(timer.repeat(repeat=1 if quick else 5, number=number))
+    return best / number * 1_000_000
+
+
+def write_bundle(directory: str, name: str, content: dict[str, Any]) -> str:
+    """Write a content bundle which is current with the data files, for a world."""
+    stamps = {
+        file_name: FileManager.stamp_content_file(file_name)
+        for file_name in FileManager.content_files
+    }
+    content = {"language": FileManager.load_language(), **content}
+    bundle_file = os.path.join(directory, f"{name}.bundle")
+    with open(bundle_file, "wb") as bundle:
+        bundle.write(ContentBundle.encode(stamps, content))
+    return bundle_file
+
+
+def start_game(bundle_file: str | None) -> AdventureGame:
+    """Start a new game of a world, or of the shipped content without a bundle."""
+    if bundle_file is not None:
+        FileManager.content_bundle_file = bundle_file
+    game = AdventureGame().initialize_game(False, MemorySaveStorage())
+    game.game_repository.scroll_delay = 0
+    game.game_repository.try_load_game_state(new=True)
+    return game
+
+
+def run_benchmarks(
+    game: AdventureGame, commands: WorldCommands, quick: bool
+) -> dict[str, float]:
+    """Return the time in microseconds of each benchmark in a game."""
+    repository = game.game_repository
+    for command in commands.setup:
+        game.run_command(command)
+    parser = game.text_parser
+    request = GameRequest(RequestType.HELP, [None])
+
+    def run_pair(pair: tuple[str, str]) -> None:
+        game.run_command(pair[0])
+        game.run_command(pair[1])
+
+    def save() -> None:
+        repository.mark_items_changed(list(repository.current_location.inventory)[:1])
+        repository.save_game_state("suite")
+        repository.finish_saving()
+
+    def save_everything() -> None:
+        repository.forget_saved_changes()
+        save()
+
+    results = {
+        "parse": time_call(lambda: parser.parse_text(commands.parse, True), quick),
+        "route": time_call(lambda: game.router.route(request), quick),
+        "move": time_call(lambda: run_pair(commands.moves), quick) / 2,
+        "use/transform": time_call(lambda: run_pair(commands.uses), quick) / 2,
+        "look": time_call(lambda: game.run_command("look"), quick),
+        "save": time_call(save, quick),
+        "save everything": time_call(save_everything, quick),
+    }
+    results["load"] = time_call(
+        lambda: repository.try_load_game_state(new=False, slot="suite"), quick
+    )
+    return results
+
+
+def current_commit() -> str | None:
+    """Return the commit the benchmarks ran on, if git can say."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except Exception:
+        return None
+
+
+def run_suite(world_names: list[str], quick: bool) -> dict[str, Any]:
+    """Run every benchmark on the shipped content and each named world."""
+    results: list[dict[str, Any]] = []
+    original_bundle_file = FileManager.content_bundle_file
+    with tempfile.TemporaryDirectory() as directory:
+        games = [("shipped", None, None, shipped_commands)]
+        for name in world_names:
+            size = worlds[name]
+            bundle_file = write_bundle(directory, name, synthetic_content(*size))
+            games.append((name, size, bundle_file, generated_commands))
+        for name, size, bundle_file, commands in games:
+            print(f"Timing the {name} world...", file=sys.stderr)
+            game = start_game(bundle_file)
+            repository = game.game_repository
+            for benchmark, microseconds in run_benchmarks(
+                game, commands, quick
+            ).items():
+                results.append(
+                    {
+                        "world": name,
+                        "rooms": len(repository.rooms),
+                        "items": len(repository.items.items),
+                        "objectives": len(repository.objectives.objectives),
+                        "benchmark": benchmark,
+                        "expectation": expectations[benchmark],
+                        "microseconds": round(microseconds, 3),
+                    }
+                )
+            FileManager.content_bundle_file = original_bundle_file
+    return {
+        "commit": current_commit(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "quick": quick,
+        "results": results,
+    }
+
+
+def print_results(report: dict[str, Any], baseline: dict[str, Any] | None) -> None:
+    """Print the results, with the change from a baseline's results if given."""
+    earlier = {}
+    if baseline is not None:
+        earlier = {
+            (result["world"], result["benchmark"]): result["microseconds"]
+            for result in baseline["results"]
+        }
+    for result in report["results"]:
+        line = (
+            f"{result['world']:<8} {result['benchmark']:<16}"
+            f" {result['microseconds']:>12,.2f} us  {result['expectation']}"
+        )
+        before = earlier.get((result["world"], result["benchmark"]))
+        if before:
+            line += f"  ({result['microseconds'] / before:.2f}x the baseline)"
+        print(line)
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse the command line arguments."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--worlds",
+        nargs="*",
+        choices=list(worlds),
+        default=list(worlds),
+        help="The generated worlds to time as well as the shipped content.",
+    )
+    parser.add_argument(
+        "--quick", action="store_true", help="Time each benchmark only once."
+    )
+    parser.add_argument(
+        "--output", help="Where to save the results, in benchmarks/results by default."
+    )
+    parser.add_argument("--compare", help="Results saved earlier to compare with.")
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark suite and save the results."""
+    arguments = parse_arguments()
+    report = run_suite(arguments.worlds, arguments.quick)
+    baseline = None
+    if arguments.compare is not None:
+        with open(arguments.compare, "r") as baseline_file:
+            baseline = json.load(baseline_file)
+    print_results(report, baseline)
+    output = arguments.output
+    if output is None:
+        output = os.path.join(
+            "benchmarks", "results", f"{report['commit'] or 'results'}.json"
+        )
+    os.makedirs(os.path.dirname(output) or ".", exist_ok=True)
+    with open(output, "w") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Saved the results to {output}.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+"""Generate large game worlds for benchmarking."""
+
+import math
+from typing import Any
+
+from common.room import Room
+
+
+def room_name(number: int) -> str:
+    """Return the name of a generated room."""
+    return f"room {number}"
+
+
+def grid_exits(number: int, count: int) -> dict[str, str | None]:
+    """Return the rooms next to a room in a square grid of generated rooms."""
+    width = math.ceil(math.sqrt(count))
+    row, column = divmod(number, width)
+    neighbours = {
+        "north": number - width if row > 0 else None,
+        "south": number + width if number + width < count else None,
+        "west": number - 1 if column > 0 else None,
+        "east": number + 1 if column < width - 1 and number + 1 < count else None,
+    }
+    return {
+        direction: None if neighbour is None else room_name(neighbour)
+        for direction, neighbour in neighbours.items()
+    }
+
+
+def grid_rooms(count: int) -> dict[str, Room]:
+    """Return a square grid of connected rooms, each with a couple of aliases."""
+    rooms: dict[str, Room] = dict()
+    for number in range(count):
+        directional_exits = grid_exits(number, count)
+        rooms[room_name(number)] = Room(
+            name=room_name(number),
+            description={"description1": f"Generated room number {number}."},
+            short_description=f"Room number {number}.",
+            exits=[name for name in directional_exits.values() if name is not None],
+            directional_exits=directional_exits,
+            aliases=[f"chamber {number}", f"hall {number}"],
+            inventory=[],
+            starting_inventory=[],
+            blockers=[],
+        )
+    return rooms
+
+
+def switch_state(name: str, to_name: str, objective: str | None) -> dict[str, Any]:
+    """Return the data of a switch which is turned into another by using it."""
+    interaction: dict[str, Any] = {
+        "message": [f"You flip the {name}."],
+        "transforms": [{"from": name, "to": to_name}],
+    }
+    if objective is not None:
+        interaction["completes"] = [objective]
+    return {
+        "name": name,
+        "alias": [],
+        "description": [f"A generated {name}."],
+        "look_at_message": {"line1": f"It is the {name}."},
+        "is_collectible": False,
+        "discovered": True,
+        "interactions": {"use": interaction},
+    }
+
+
+def synthetic_content(
+    room_count: int, item_count: int, objective_count: int
+) -> dict[str, Any]:
+    """Return the content of a generated game, laid out as in the data files.
+
+    The rooms form a square grid. Each has a switch which using turns into
+    its lit version and back, and shares out the rest of the items. Using a
+    switch completes an objective until every objective has a switch.
+    """
+    items: list[dict[str, Any]] = []
+    rooms: list[dict[str, Any]] = []
+    objectives: list[dict[str, Any]] = []
+    things_per_room = max(0, item_count - 2 * room_count) // room_count
+    for number in range(room_count):
+        objective = f"flip switch {number}" if number < objective_count else None
+        switch = f"switch {number}"
+        items.append(switch_state(switch, f"lit switch {number}", objective))
+        items.append(switch_state(f"lit switch {number}", switch, None))
+        things = [f"thing {number}-{thing}" for thing in range(things_per_room)]
+        for thing in things:
+            items.append(
+                {
+                    "name": thing,
+                    "alias": [],
+                    "description": [f"A generated {thing}."],
+                    "look_at_message": {"line1": f"It is {thing}."},
+                    "is_collectible": True,
+                    "discovered": True,
+                    "interactions": {},
+                }
+            )
+        directional_exits = grid_exits(number, room_count)
+        rooms.append(
+            {
+                "name": room_name(number),
+                "description": {
+                    "description1": f"Generated room number {number}.",
+                    switch: f"There is a {switch} on the wall.",
+                },
+                "short_description": f"Room number {number}.",
+                "exits": [
+                    name for name in directional_exits.values() if name is not None
+                ],
+                "directional_exits": directional_exits,
+                "aliases": [f"chamber {number}", f"hall {number}"],
+                "blockers": [],
+                "starting_inventory": [switch] + things,
+                "inventory": [switch] + things,
+            }
+        )
+    for number in range(objective_count):
+        switch = f"switch {number % room_count}"
+        objectives.append(
+            {
+                "name": f"flip switch {number}",
+                "hints": [f"Use the {switch}."],
+                "requires": [],
+                "interactions": [
+                    {"interaction_type": "use", "item": switch, "complete": False}
+                ],
+            }
+        )
+    player = {
+        "name": "Player 1",
+        "location": room_name(0),
+        "visited_rooms": [room_name(0)],
+        "inventory": [],
+        "won": False,
+        "watched_end_credits": False,
+    }
+    return {"items": items, "rooms": rooms, "player": player, "objectives": objectives}
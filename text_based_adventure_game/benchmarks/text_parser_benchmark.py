@@ -0,0 +1,76 @@
+"""Compare trie based target extraction with trying every word window.
+
+Run from the project directory with:
+    python -m benchmarks.text_parser_benchmark
+"""
+
+import random
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from ForkOff import AdventureGame
+from language.text_parser import TextParser
+
+
+def every_window_targets(parser: TextParser, words: list[str]) -> list[str | None]:
+    """Find targets by looking up every window of words, largest first."""
+    word_count = len(words)
+    min_word = 0
+    max_word = word_count
+    targets: list[str | None] = []
+    while word_count > 0:
+        target = parser.find_valid_target(words[min_word:max_word], True)
+        if target != "":
+            targets.append(target)
+            words = words[:min_word] + words[max_word:]
+            word_count = len(words)
+            min_word = 0
+            max_word = word_count
+            continue
+        if max_word == len(words):
+            min_word = 0
+            max_word = word_count - 1
+            word_count = max_word
+        else:
+            min_word += 1
+            max_word += 1
+    return targets
+
+
+def synthetic_command(parser: TextParser, length: int, seed: int) -> list[str]:
+    """Return a command made of nearby item names, room names and filler words."""
+    generator = random.Random(seed)
+    repository = parser.repository
+    phrases = [item.name for item in repository.current_location.inventory]
+    phrases += [item.name for item in repository.player.inventory]
+    phrases += list(repository.rooms.keys()) + ["north", "quickly", "xyzzy"]
+    words: list[str] = []
+    while len(words) < length:
+        words += generator.choice(phrases).split(" ")
+    return words[:length]
+
+
+def main() -> None:
+    """Run the text parser benchmark."""
+    game = AdventureGame().initialize_game(True)
+    game.game_repository.try_load_game_state(new=True)
+    parser = game.text_parser
+    for length in [4, 8, 16, 32]:
+        commands = [synthetic_command(parser, length, seed) for seed in range(10)]
+        for command in commands:
+            expected = every_window_targets(parser, command)
+            assert parser.find_all_valid_targets(command, True) == expected
+        number = 20 if length < 32 else 2
+        print_comparison(
+            f"{length} word commands",
+            time_per_call(
+                lambda: [every_window_targets(parser, c) for c in commands], number
+            ),
+            time_per_call(
+                lambda: [parser.find_all_valid_targets(c, True) for c in commands],
+                number,
+            ),
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,50 @@
+"""Compare wrapping each printed paragraph with reusing the wrapped lines.
+
+The paragraphs are the messages of looking around the first room of the
+shipped content, printed again and again as a player looking around would.
+
+Run from the project directory with:
+    python -m benchmarks.wrap_cache_benchmark
+"""
+
+import textwrap
+
+from benchmarks.benchmark_helpers import print_comparison, time_per_call
+from common.game_message import GameMessage
+from common.game_request import GameRequest
+from common.request_type import RequestType
+from ForkOff import AdventureGame
+from game_repository.memory_save_storage import MemorySaveStorage
+from language.wrap_cache import WrapCache
+
+
+def look_messages() -> list[GameMessage]:
+    """Return the messages which wrap, from looking around the first room."""
+    game = AdventureGame().initialize_game(False, MemorySaveStorage())
+    game.game_repository.try_load_game_state(new=True)
+    response = game.router.route(GameRequest(RequestType.LOOK, [None]))
+    return [message for message in response.messages if message.should_wrap()]
+
+
+def main() -> None:
+    """Run the wrap cache benchmark."""
+    messages = look_messages()
+    cache = WrapCache()
+
+    def wrap_each() -> None:
+        for message in messages:
+            textwrap.wrap(str(message), width=80)
+
+    def reuse_each() -> None:
+        for message in messages:
+            cache.wrap(str(message), 80)
+
+    print_comparison(
+        "wrap the paragraphs of a look",
+        time_per_call(wrap_each, 1_000),
+        time_per_call(reuse_each, 1_000),
+    )
+
+
+if __name__ == "__main__":
+    main()
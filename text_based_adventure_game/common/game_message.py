@@ -50,10 +50,10 @@ class GameMessage:
         """Return whether the message should print a blank line."""
         return self.message_type == MessageType.BLANK_LINE
 
-    def should_wrap(self: "GameMessage") -> bool:
-        """Return whether the message should be wrapped."""
+    def should_wrap(self: "GameMessage", width: int = 80) -> bool:
+        """Return whether the message should be wrapped to the width."""
         if isinstance(self.contents, str):
-            return len(self.contents) > 80
+            return len(self.contents) > width
         elif self.message_type == MessageType.PARAGRAPH:
             return True
         else:
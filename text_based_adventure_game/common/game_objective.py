@@ -24,13 +24,45 @@ class GameObjective:
         self.requirements = requirements
         # This property requires that the
         self.interactions: list[dict[str, Any]] = interactions
+        # The cached result of is_complete, None until it is next evaluated.
+        self.completed: bool | None = None
+
+    @property
+    def interactions(self: "GameObjective") -> list[dict[str, Any]]:
+        """Return the interactions the player must complete."""
+        return self._interactions
+
+    @interactions.setter
+    def interactions(self: "GameObjective", interactions: list[dict[str, Any]]) -> None:
+        """Set the interactions and index them by item and interaction type."""
+        self._interactions = interactions
+        self.interaction_index: dict[tuple[str, str], list[dict[str, Any]]] = dict()
+        for interaction in interactions:
+            key = (interaction.get("item"), interaction.get("interaction_type"))
+            self.interaction_index.setdefault(key, []).append(interaction)
 
     def __repr__(self: "GameObjective") -> str:
         """Return the string representation of the game objective."""
         return f"{self.name}, {self._hints}, {self.requirements}, {self.interactions}"
 
+    def copy(self: "GameObjective") -> "GameObjective":
+        """Return a copy which shares the hints and requirements of this objective."""
+        objective = GameObjective.__new__(GameObjective)
+        objective.__dict__.update(self.__dict__)
+        objective.interactions = [
+            dict(interaction) for interaction in self.interactions
+        ]
+        objective.invalidate()
+        return objective
+
     def is_complete(self: "GameObjective", player: Player) -> bool:
-        """Return True if the objective is complete."""
+        """Return True if the objective is complete, using the cached result if any."""
+        if self.completed is None:
+            self.completed = self.evaluate(player)
+        return self.completed
+
+    def evaluate(self: "GameObjective", player: Player) -> bool:
+        """Check the requirements and interactions against the player's state."""
         # find out if all required items are near the player.
         for requirement in self.requirements:
             if not self.in_room_inventory(
@@ -46,12 +78,13 @@ class GameObjective:
         self: "GameObjective", item: str, action: str
     ) -> None:
         """Set the interaction objective to complete."""
-        for interaction in self.interactions:
-            if (
-                interaction["item"] == item
-                and interaction["interaction_type"] == action
-            ):
-                interaction["complete"] = True
+        for interaction in self.interaction_index.get((item, action), []):
+            interaction["complete"] = True
+            self.invalidate()
+
+    def invalidate(self: "GameObjective") -> None:
+        """Forget the cached completion so it is evaluated again when next needed."""
+        self.completed = None
 
     def increment_hint_count(self):
         self.hint_count += 1
@@ -63,7 +96,7 @@ class GameObjective:
     @staticmethod
     def in_room_inventory(room: Room, item_name: str) -> bool:
         """Return True if the item is in the room's inventory."""
-        item = next((item for item in room.inventory if item.name == item_name), None)
+        item = room.inventory.get(item_name)
         if item is None or item.is_collectible:
             return False
         return True
@@ -71,5 +104,4 @@ class GameObjective:
     @staticmethod
     def in_player_inventory(player: Player, item_name: str) -> bool:
         """Return True if the item is in the player's inventory."""
-        item = next((item for item in player.inventory if item.name == item_name), None)
-        return item is not None
+        return player.inventory.get(item_name) is not None
@@ -23,6 +23,10 @@ class GameRequest:
         self.action = request_type
         self.targets = targets
 
+    def copy(self: "GameRequest") -> "GameRequest":
+        """Return a copy with its own list of targets."""
+        return GameRequest(self.action, list(self.targets))
+
     def __repr__(self) -> str:
         """Representation of the item."""
         return json.dumps(self.__dict__, indent=4, sort_keys=True)  # pragma: no cover
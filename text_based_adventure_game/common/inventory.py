@@ -0,0 +1,67 @@
+"""The items in a room or carried by the player."""
+
+from typing import Any, Iterable, Iterator
+
+from common.item import Item
+
+
+class Inventory:
+    """The items in a room or carried by the player, in the order they arrived.
+
+    The items are kept in a dictionary by name, so finding, adding and removing
+    an item take constant time however many items there are, while iterating
+    gives the items in the order they were added, as the list it replaces did.
+    An inventory is equal to a list of the same items in the same order.
+    """
+
+    def __init__(self: "Inventory", items: Iterable[Item] = ()) -> None:
+        """Initialize the inventory with the items, in order."""
+        self.items: dict[str, Item] = {item.name: item for item in items}
+
+    def __contains__(self: "Inventory", item: object) -> bool:
+        """Return True if this very item is in the inventory."""
+        found = self.items.get(getattr(item, "name", None))  # type: ignore[arg-type]
+        return found is not None and found is item
+
+    def __iter__(self: "Inventory") -> Iterator[Item]:
+        """Iterate over the items in the order they were added."""
+        return iter(self.items.values())
+
+    def __len__(self: "Inventory") -> int:
+        """Return the number of items."""
+        return len(self.items)
+
+    def __getitem__(self: "Inventory", index: Any) -> Any:
+        """Return the item or items at an index or slice, in linear time."""
+        return list(self.items.values())[index]
+
+    def __eq__(self: "Inventory", other: object) -> bool:
+        """Return True if the other holds the same items in the same order."""
+        if isinstance(other, Inventory):
+            return list(self.items.values()) == list(other.items.values())
+        if isinstance(other, list):
+            return list(self.items.values()) == other
+        return NotImplemented
+
+    def __repr__(self: "Inventory") -> str:
+        """Representation of the inventory."""
+        return f"Inventory({list(self.items.values())!r})"  # pragma: no cover
+
+    def append(self: "Inventory", item: Item) -> None:
+        """Add the item after every other item, unless it is already here."""
+        self.items.setdefault(item.name, item)
+
+    def remove(self: "Inventory", item: Item) -> None:
+        """Remove the item, raising ValueError if it is not here, as a list does."""
+        if item not in self:
+            raise ValueError(f"{item.name} is not in the inventory.")
+        del self.items[item.name]
+
+    def get(self: "Inventory", name: str) -> Item | None:
+        """Return the item with the name, if it is here."""
+        return self.items.get(name)
+
+    @property
+    def names(self: "Inventory") -> list[str]:
+        """Return the names of the items in order."""
+        return list(self.items.keys())
@@ -2,7 +2,10 @@
 
 
 import json
-from typing import Any
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from common.room import Room
 
 
 class Item:
@@ -26,14 +29,70 @@ class Item:
         self._description: list[str] = description
         self.look_at_message: dict[str, str] = look_at_message
         self.is_collectible: bool = is_collectible
-        self.discovered: bool = discovered
+        # The rooms whose description mentions the item while it is not found.
+        self.mentioned_in: list["Room"] = []
+        self._discovered: bool = discovered
         self.interactions: dict[str, Any] = interactions
         self.locked = locked
-        self.hidden = hidden
+        self._hidden: bool = hidden
+        # The items each interaction refers to, filled in when the game is linked.
+        self.links: dict[str, InteractionLinks] = dict()
 
     def __repr__(self) -> str:
         """Representation of the item."""
-        return json.dumps(self.__dict__, indent=4, sort_keys=True)  # pragma: no cover
+        state = {
+            key: value
+            for key, value in self.__dict__.items()
+            if key not in ("links", "mentioned_in")
+        }
+        return json.dumps(state, indent=4, sort_keys=True)  # pragma: no cover
+
+    def copy(self: "Item") -> "Item":
+        """Return a copy which shares this item's text and interactions.
+
+        Play only ever replaces the flags and description of an item, so the
+        shared values are never changed through the copy. The links are
+        shared too, so whoever copies linked items must link the copies. The
+        copy is mentioned in no rooms until rooms holding it are made.
+        """
+        item = Item.__new__(Item)
+        item.__dict__.update(self.__dict__)
+        item.mentioned_in = []
+        return item
+
+    def mention_in(self: "Item", room: "Room") -> None:
+        """Remember a room whose description changes with the item's flags."""
+        if room not in self.mentioned_in:
+            self.mentioned_in.append(room)
+
+    def flags_changed(self: "Item") -> None:
+        """Tell the rooms mentioning the item to describe themselves afresh."""
+        for room in self.mentioned_in:
+            room.invalidate_description()
+
+    @property
+    def discovered(self: "Item") -> bool:
+        """Return True if the item has been found."""
+        return self._discovered
+
+    @discovered.setter
+    def discovered(self: "Item", discovered: bool) -> None:
+        """Set whether the item has been found."""
+        if discovered != self._discovered:
+            self._discovered = discovered
+            self.flags_changed()
+
+    @property
+    def hidden(self: "Item") -> bool:
+        """Return True if the item is hidden."""
+        return self._hidden
+
+    @hidden.setter
+    def hidden(self: "Item", hidden: bool) -> None:
+        """Set whether the item is hidden."""
+        if hidden != self._hidden:
+            self._hidden = hidden
+            self.flags_changed()
 
     @property
     def description(self: "Item") -> str:
@@ -44,3 +103,55 @@ class Item:
     def description(self: "Item", description: list[str]) -> None:
         """Set the description of the item."""
         self._description = description
+
+
+class InteractionLinks:
+    """The items named by an interaction of an item, resolved when the game is linked."""
+
+    def __init__(
+        self: "InteractionLinks",
+        requires: list[Item | None] | None = None,
+        discovers: list[Item] | None = None,
+        unhides: list[Item] | None = None,
+        unlocks: list[Item] | None = None,
+        transforms: list[tuple[Item | None, Item | None]] | None = None,
+    ) -> None:
+        """Initialize the links of an interaction.
+
+        A required item which does not exist is kept as None, so that the
+        interaction can never be used, as it could not be before linking.
+        """
+        self.requires: list[Item | None] = requires or []
+        self.discovers: list[Item] = discovers or []
+        self.unhides: list[Item] = unhides or []
+        self.unlocks: list[Item] = unlocks or []
+        self.transforms: list[tuple[Item | None, Item | None]] = transforms or []
+
+    def copy(self: "InteractionLinks", items: dict[str, Item]) -> "InteractionLinks":
+        """Return the same links to the copies of the items, found by name.
+
+        Links which name no items hold nothing to copy, so they are shared.
+        """
+        if not (
+            self.requires
+            or self.discovers
+            or self.unhides
+            or self.unlocks
+            or self.transforms
+        ):
+            return self
+        return InteractionLinks(
+            requires=[
+                None if item is None else items[item.name] for item in self.requires
+            ],
+            discovers=[items[item.name] for item in self.discovers],
+            unhides=[items[item.name] for item in self.unhides],
+            unlocks=[items[item.name] for item in self.unlocks],
+            transforms=[
+                (
+                    None if from_item is None else items[from_item.name],
+                    None if to_item is None else items[to_item.name],
+                )
+                for from_item, to_item in self.transforms
+            ],
+        )
@@ -2,6 +2,7 @@
 
 import json
 
+from common.inventory import Inventory
 from common.item import Item
 from common.room import Room
 
@@ -25,6 +26,30 @@ class Player:
         self.inventory = inventory
         self.won = won
         self.watched_end_credits = watched_end_credits
+        # The names the player was given which named no room or item.
+        self.missing_location: str | None = None
+        self.missing_item_names: list[str] = []
+
+    @property
+    def inventory(self: "Player") -> Inventory:
+        """Return the items the player carries."""
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self: "Player", items: list[Item] | Inventory) -> None:
+        """Give the player the items, in order."""
+        self._inventory = Inventory(items)
+
+    def copy(
+        self: "Player", rooms: dict[str, Room], items: dict[str, Item]
+    ) -> "Player":
+        """Return a copy of the player, standing in and carrying the given copies."""
+        player = Player.__new__(Player)
+        player.__dict__.update(self.__dict__)
+        player.location = rooms[self.location.name]
+        player.visited_rooms = list(self.visited_rooms)
+        player.inventory = [items[item.name] for item in self.inventory]
+        return player
 
     def __repr__(self) -> str:
         """Representation of the item."""
@@ -0,0 +1,121 @@
+"""Times where each turn of the game spends its time."""
+
+import threading
+import time
+from collections import deque
+from typing import Any, Callable
+
+# The name, start and duration in nanoseconds, turn and thread of a span.
+Span = tuple[str, int, int, int, int]
+
+
+class Profiler:
+    """Times where each turn of the game spends its time.
+
+    Nothing is timed until methods are instrumented, which replaces them with
+    versions that record a span each time they are called. The spans are kept
+    in a ring buffer, so only the most recent ones are kept. Removing the
+    instruments restores the methods, so that the game runs exactly as it
+    does without a profiler.
+    """
+
+    default_capacity = 65536
+
+    def __init__(self: "Profiler", capacity: int = default_capacity) -> None:
+        """Initialize the profiler with an empty ring buffer of spans."""
+        self.spans: deque[Span] = deque(maxlen=capacity)
+        self.turn = 0
+        self.started = time.perf_counter_ns()
+        # Where the spans are exported when the game ends, if anywhere.
+        self.trace_file: str | None = None
+        # The methods which were replaced, so that they can be restored.
+        self._originals: list[tuple[Any, str, Any]] = []
+
+    def time(self: "Profiler", name: str, function: Callable) -> Callable:
+        """Return a version of the function which records a span for each call."""
+        spans = self.spans
+        clock = time.perf_counter_ns
+        thread = threading.get_ident
+
+        def timed(*args: Any, **kwargs: Any) -> Any:
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                spans.append((name, start, clock() - start, self.turn, thread()))
+
+        timed.__wrapped__ = function  # type: ignore[attr-defined]
+        return timed
+
+    def instrument(self: "Profiler", target: Any, names: list[str]) -> None:
+        """Time the named methods of an object or class.
+
+        The spans are named with the name of the class and of the method.
+        """
+        prefix = target.__name__ if isinstance(target, type) else type(target).__name__
+        for name in names:
+            original = vars(target).get(name)
+            self._originals.append((target, name, original))
+            timed = self.time(f"{prefix}.{name}", getattr(target, name))
+            if isinstance(original, staticmethod):
+                timed = staticmethod(timed)
+            setattr(target, name, timed)
+
+    def instrument_public_methods(self: "Profiler", target: Any) -> None:
+        """Time every public method which the class of an object defines."""
+        names = [
+            name
+            for name, value in vars(type(target)).items()
+            if not name.startswith("_")
+            and (callable(value) or isinstance(value, staticmethod))
+        ]
+        self.instrument(target, names)
+
+    def remove_instruments(self: "Profiler") -> None:
+        """Restore every method which was instrumented, most recent first."""
+        for target, name, original in reversed(self._originals):
+            if original is None:
+                delattr(target, name)
+            else:
+                setattr(target, name, original)
+        self._originals = []
+
+    def end_turn(self: "Profiler") -> None:
+        """Start recording the spans of the next turn."""
+        self.turn += 1
+
+    def summary(self: "Profiler") -> list[str]:
+        """Return a line for each span name, with the most total time first."""
+        totals: dict[str, list[int]] = dict()
+        for name, _, duration, _, _ in list(self.spans):
+            total = totals.setdefault(name, [0, 0, 0])
+            total[0] += 1
+            total[1] += duration
+            total[2] = max(total[2], duration)
+        turns = len({span[3] for span in self.spans}) or 1
+        lines = []
+        for name, (count, duration, longest) in sorted(
+            totals.items(), key=lambda total: total[1][1], reverse=True
+        ):
+            lines.append(
+                f"{name} - {count} call{'' if count == 1 else 's'},"
+                f" {duration / 1e6:.2f} ms in all,"
+                f" {duration / count / 1e3:.1f} us each, longest"
+                f" {longest / 1e3:.1f} us, {duration / turns / 1e3:.1f} us a turn"
+            )
+        return lines
+
+    def trace_events(self: "Profiler") -> list[dict[str, Any]]:
+        """Return the spans as complete events of the Chrome trace event format."""
+        return [
+            {
+                "name": name,
+                "ph": "X",
+                "ts": (start - self.started) / 1e3,
+                "dur": duration / 1e3,
+                "pid": 0,
+                "tid": thread,
+                "args": {"turn": turn},
+            }
+            for name, start, duration, turn, thread in list(self.spans)
+        ]
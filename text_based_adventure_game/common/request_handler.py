@@ -0,0 +1,9 @@
+"""Represents what handles a type of game request."""
+
+from typing import Callable
+
+from common.game_request import GameRequest
+from common.game_response import GameResponse
+
+# A callable which answers a game request, such as a bound service method.
+Handler = Callable[[GameRequest], GameResponse]
@@ -36,4 +36,6 @@ class RequestType(Enum):
     PLAY = 27
     FLUSH = 28
     DRAW = 29
+    LIST_SAVES = 30
+    PROFILE = 31
     UNKNOWN = 100
@@ -1,9 +1,14 @@
 """Represents a room in the game."""
 
 import json
+from typing import TYPE_CHECKING
 
+from common.inventory import Inventory
 from common.item import Item
 
+if TYPE_CHECKING:
+    from common.game_objective import GameObjective
+
 
 class Room:
     """A room in the game."""
@@ -28,8 +33,12 @@ class Room:
         self.directional_exits = directional_exits
         self.aliases = aliases
         self.blockers = blockers
+        # The objective and message of each blocker, filled in when the game is linked.
+        self.blocking_objectives: list[tuple[GameObjective, str]] = []
         self.inventory = inventory
         self.starting_inventory = starting_inventory
+        # The names the room's inventories were given which named no item.
+        self.missing_item_names: list[str] = []
 
     def directional_exit(self: "Room", direction: str) -> str | None:
         """Get the room name for the given direction.
@@ -48,6 +57,41 @@ class Room:
         """Representation of the item."""
         return json.dumps(self.__dict__, indent=4, sort_keys=True)  # pragma: no cover
 
+    @property
+    def inventory(self: "Room") -> Inventory:
+        """Return the items in the room."""
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self: "Room", items: list[Item] | Inventory) -> None:
+        """Put the items in the room, in order."""
+        self._inventory = Inventory(items)
+
+    @property
+    def starting_inventory(self: "Room") -> list[Item]:
+        """Return the items the room started with."""
+        return self._starting_inventory
+
+    @starting_inventory.setter
+    def starting_inventory(self: "Room", items: list[Item]) -> None:
+        """Set the starting items and the item each part of the description is about.
+
+        The items mentioned by the description are told about the room, so
+        that the description is rendered again when their flags change.
+        """
+        self._starting_inventory = items
+        self.starting_items: dict[str, Item] = dict()
+        for item in items:
+            self.starting_items.setdefault(item.name, item)
+        self.description_items: list[tuple[str, Item | None]] = [
+            (text, self.starting_items.get(key))
+            for key, text in self._description.items()
+        ]
+        for _, item in self.description_items:
+            if item is not None:
+                item.mention_in(self)
+        self.invalidate_description()
+
     @property
     def description(self: "Room") -> str:
         """Provide a room description.
@@ -56,31 +100,44 @@ class Room:
             str: Use the description of the room and optional item descriptions
             for undiscovered collectible items.
         """
-        description = ""
-        for key in self._description.keys():
-            possible_item = self.get_starting_inventory_item_by_name(key)
-            if possible_item is not None:
-                if (
-                    possible_item.is_collectible
-                    and not possible_item.discovered
-                    and not possible_item.hidden
-                ):
-                    description += f"{self._description[key]} "
-            else:
-                description += f"{self._description[key]} "
-        return description
+        if self._rendered_description is None:
+            self._rendered_description = "".join(
+                f"{text} "
+                for text, item in self.description_items
+                if item is None
+                or (item.is_collectible and not item.discovered and not item.hidden)
+            )
+        return self._rendered_description
+
+    def invalidate_description(self: "Room") -> None:
+        """Render the description again the next time it is needed."""
+        self._rendered_description: str | None = None
 
     def get_starting_inventory_item_by_name(self: "Room", name: str) -> Item | None:
         """Return a starting inventory item by name if found or None."""
-        for item in self.starting_inventory:
-            if item.name == name:
-                return item
-        return None
+        return self.starting_items.get(name)
+
+    def copy(
+        self: "Room", items: dict[str, Item], objectives: dict[str, "GameObjective"]
+    ) -> "Room":
+        """Return a copy which shares this room's text, holding the given items.
+
+        The copy is blocked by the given objectives in place of this room's.
+        """
+        room = Room.__new__(Room)
+        room.__dict__.update(self.__dict__)
+        room.blocking_objectives = [
+            (objectives[objective.name], message)
+            for objective, message in self.blocking_objectives
+        ]
+        room.inventory = [items[item.name] for item in self.inventory]
+        room.starting_inventory = [items[item.name] for item in self.starting_inventory]
+        return room
 
     @property
     def inventory_item_names(self: "Room") -> list[str]:
         """Return the names of all inventory items."""
-        return [item.name for item in self.inventory]
+        return self.inventory.names
 
     @staticmethod
     def default_room() -> "Room":
@@ -1,5 +1,7 @@
 """Manages the game art."""
 
+from collections.abc import Mapping
+
 from game_repository.file_manager import FileManager
 
 
@@ -8,7 +10,7 @@ class ArtManager:
 
     def __init__(self: "ArtManager") -> None:
         """Initialize the art manager."""
-        self.art: dict[str, list[str]] = dict()
+        self.art: Mapping[str, list[str]] = dict()
 
     def load_art(self: "ArtManager") -> None:
         """Load the art to use in the game."""
@@ -0,0 +1,119 @@
+"""Large text assets which are parsed the first time the game uses them."""
+
+import json
+import mmap
+import re
+from collections.abc import Iterator, Mapping
+from typing import Any
+
+
+class AssetStore(Mapping):
+    """The values of a JSON object in a file, each parsed the first time it is read.
+
+    The file is memory mapped when the store is opened, and the offsets of its
+    values are found by skipping over them rather than parsing them, so a
+    damaged file is reported when the game starts. Only a value which is asked
+    for is parsed. Text which is never used is left to the operating system
+    rather than held by the game.
+    """
+
+    structure = re.compile(rb'["\[\]{}]')
+    scalar = re.compile(rb"[^\s,\]}]+")
+    colon = re.compile(rb"\s*:\s*")
+    separator = re.compile(rb"\s*([,}])\s*")
+    start = re.compile(rb"\s*\{\s*")
+
+    def __init__(self: "AssetStore", data: bytes | mmap.mmap) -> None:
+        """Initialize the store with the text of a JSON object, finding its values."""
+        self.data = data
+        self.spans = AssetStore.index_object(data)
+        self.loaded: dict[str, Any] = dict()
+
+    @staticmethod
+    def open(file_name: str) -> "AssetStore":
+        """Open the JSON object in the file, memory mapped where possible."""
+        with open(file_name, "rb") as asset_file:
+            try:
+                data = mmap.mmap(asset_file.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                data = asset_file.read()
+        return AssetStore(data)
+
+    @staticmethod
+    def index_object(data: bytes | mmap.mmap) -> dict[str, tuple[int, int]]:
+        """Return the offsets of the values of the JSON object in the data by key."""
+        start = AssetStore.start.match(data)
+        if start is None:
+            raise ValueError("The assets are not a JSON object.")
+        spans: dict[str, tuple[int, int]] = dict()
+        position = start.end()
+        if data[position : position + 1] == b"}":
+            return spans
+        while True:
+            if data[position : position + 1] != b'"':
+                raise ValueError(f"Expected a key at {position}.")
+            key_end = AssetStore.string_end(data, position)
+            colon = AssetStore.colon.match(data, key_end)
+            if colon is None:
+                raise ValueError(f"Expected a colon at {key_end}.")
+            end = AssetStore.value_end(data, colon.end())
+            spans[json.loads(data[position:key_end])] = (colon.end(), end)
+            separator = AssetStore.separator.match(data, end)
+            if separator is None:
+                raise ValueError(f"Expected a comma or the end at {end}.")
+            if separator.group(1) == b"}":
+                return spans
+            position = separator.end()
+
+    @staticmethod
+    def string_end(data: bytes | mmap.mmap, start: int) -> int:
+        """Return the offset just past the JSON string which begins at the start."""
+        position = data.find(b'"', start + 1)
+        while position >= 0:
+            backslashes = 0
+            while data[position - 1 - backslashes] == ord("\\"):
+                backslashes += 1
+            if backslashes % 2 == 0:
+                return position + 1
+            position = data.find(b'"', position + 1)
+        raise ValueError(f"The string at {start} is incomplete.")
+
+    @staticmethod
+    def value_end(data: bytes | mmap.mmap, start: int) -> int:
+        """Return the offset just past the JSON value which begins at the start.
+
+        The value itself is only checked when it is parsed.
+        """
+        if data[start : start + 1] not in (b'"', b"[", b"{"):
+            scalar = AssetStore.scalar.match(data, start)
+            if scalar is None:
+                raise ValueError(f"Expected a value at {start}.")
+            return scalar.end()
+        depth = 0
+        position = start
+        while True:
+            token = AssetStore.structure.search(data, position)
+            if token is None:
+                raise ValueError(f"The value at {start} is incomplete.")
+            if data[token.start()] == ord('"'):
+                position = AssetStore.string_end(data, token.start())
+            else:
+                depth += 1 if data[token.start()] in b"[{" else -1
+                position = token.end()
+            if depth == 0:
+                return position
+
+    def __getitem__(self: "AssetStore", name: str) -> Any:
+        """Return the value with the name, parsing it if it was not read before."""
+        if name not in self.loaded:
+            start, end = self.spans[name]
+            self.loaded[name] = json.loads(self.data[start:end])
+        return self.loaded[name]
+
+    def __iter__(self: "AssetStore") -> Iterator[str]:
+        """Iterate over the names of the values."""
+        return iter(self.spans)
+
+    def __len__(self: "AssetStore") -> int:
+        """Return the number of values."""
+        return len(self.spans)
@@ -0,0 +1,39 @@
+"""Decides when a game should be saved without the player asking."""
+
+import time
+from typing import Callable
+
+
+class AutosavePolicy:
+    """Saves a game after a number of turns or seconds, whichever comes first."""
+
+    def __init__(
+        self: "AutosavePolicy",
+        turns: int | None = None,
+        seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the policy. A limit of None is never reached."""
+        self.turns = turns
+        self.seconds = seconds
+        self.clock = clock
+        self.turns_since_save = 0
+        self.last_save = clock()
+
+    def record_turn(self: "AutosavePolicy") -> bool:
+        """Count a turn and return True if the game should be saved now."""
+        self.turns_since_save += 1
+        return self.is_due()
+
+    def is_due(self: "AutosavePolicy") -> bool:
+        """Return True if either limit has been reached since the last save."""
+        if self.turns is not None and self.turns_since_save >= self.turns:
+            return True
+        return (
+            self.seconds is not None and self.clock() - self.last_save >= self.seconds
+        )
+
+    def reset(self: "AutosavePolicy") -> None:
+        """Start counting again after the game was saved."""
+        self.turns_since_save = 0
+        self.last_save = self.clock()
@@ -0,0 +1,61 @@
+"""Checks the game data files and compiles them into the content bundle.
+
+The game loads the bundle instead of the data files while it is up to date,
+so run this again after changing them. Run from the project directory with:
+    python -m game_repository.build_content
+"""
+
+import sys
+
+from common.load_error import FileOperationError
+from game_repository.content_validator import ContentValidator
+from game_repository.file_manager import FileManager
+
+
+def build() -> list[str]:
+    """Check the data files and save the content bundle, returning any problems."""
+    stamps = {
+        file_name: FileManager.stamp_content_file(file_name)
+        for file_name in FileManager.content_files
+    }
+    states = [
+        FileManager.get_items_file(new=True),
+        FileManager.get_room_file(new=True),
+        FileManager.get_player_file(new=True),
+        FileManager.get_objectives_file(new=True),
+    ]
+    errors = [
+        state.message for state in states if isinstance(state, FileOperationError)
+    ]
+    if errors:
+        return errors
+    problems = ContentValidator(*states).validate()
+    if problems:
+        return problems
+    content = {
+        "language": FileManager.load_language(),
+        "items": states[0],
+        "rooms": states[1],
+        "player": states[2],
+        "objectives": states[3],
+    }
+    result = FileManager.save_content_bundle(stamps, content)
+    if isinstance(result, FileOperationError):
+        return [result.message]
+    return []
+
+
+def main() -> int:
+    """Build the content bundle and report the outcome."""
+    problems = build()
+    for problem in problems:
+        print(problem)
+    if problems:
+        print("The content bundle was not built.")
+        return 1
+    print(f"Built {FileManager.content_bundle_file}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,33 @@
+"""Records which parts of the game changed since it was last saved."""
+
+from common.game_objective import GameObjective
+from common.item import Item
+from common.room import Room
+
+
+class ChangeTracker:
+    """Records the names of the items, rooms and objectives changed since a save."""
+
+    def __init__(self: "ChangeTracker") -> None:
+        """Initialize the change tracker with nothing changed."""
+        self.items: set[str] = set()
+        self.rooms: set[str] = set()
+        self.objectives: set[str] = set()
+
+    def mark_items(self: "ChangeTracker", items: list[Item]) -> None:
+        """Record that the flags or description of the items may have changed."""
+        self.items.update(item.name for item in items)
+
+    def mark_room(self: "ChangeTracker", room: Room) -> None:
+        """Record that the inventory of the room may have changed."""
+        self.rooms.add(room.name)
+
+    def mark_objective(self: "ChangeTracker", objective: GameObjective) -> None:
+        """Record that the interactions of the objective may have changed."""
+        self.objectives.add(objective.name)
+
+    def clear(self: "ChangeTracker") -> None:
+        """Forget every change, after they have been saved."""
+        self.items.clear()
+        self.rooms.clear()
+        self.objectives.clear()
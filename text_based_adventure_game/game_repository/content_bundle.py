@@ -0,0 +1,68 @@
+"""Encodes and decodes the content bundle which is compiled from the data files."""
+
+import marshal
+import struct
+from typing import Any, Callable
+
+from common.load_error import FileOperationError
+
+# The size, modification time and hash of a data file when it was compiled.
+Stamp = tuple[int, int, str]
+
+
+class ContentBundle:
+    """Encodes and decodes the content bundle which is compiled from the data files.
+
+    The bundle starts with a fixed header holding a magic number, the format
+    versions of the bundle and of marshal, and the length of the stamps of
+    the data files it was compiled from. It is followed by the stamps and the
+    contents of the data files, both marshalled.
+    """
+
+    magic = b"FORKDATA"
+    version = 1
+    header = struct.Struct(">8sHHI")
+
+    @staticmethod
+    def encode(stamps: dict[str, Stamp], content: dict[str, Any]) -> bytes:
+        """Return the bytes of a bundle holding the content and the stamps."""
+        marshalled_stamps = marshal.dumps(stamps)
+        return (
+            ContentBundle.header.pack(
+                ContentBundle.magic,
+                ContentBundle.version,
+                marshal.version,
+                len(marshalled_stamps),
+            )
+            + marshalled_stamps
+            + marshal.dumps(content)
+        )
+
+    @staticmethod
+    def decode(
+        data: bytes, is_current: Callable[[dict[str, Stamp]], bool]
+    ) -> dict[str, Any] | FileOperationError:
+        """Return the content held in the bytes of a bundle which is still current.
+
+        The stamps are read first, so that the content of a bundle compiled
+        from older data files is never read.
+        """
+        if len(data) < ContentBundle.header.size:
+            return FileOperationError("The content bundle is incomplete.")
+        (
+            magic,
+            version,
+            marshal_version,
+            stamps_length,
+        ) = ContentBundle.header.unpack_from(data)
+        if (
+            magic != ContentBundle.magic
+            or version != ContentBundle.version
+            or marshal_version != marshal.version
+        ):
+            return FileOperationError("The content bundle needs to be rebuilt.")
+        content_start = ContentBundle.header.size + stamps_length
+        payload = memoryview(data)
+        if not is_current(marshal.loads(payload[ContentBundle.header.size :])):
+            return FileOperationError("The content bundle is out of date.")
+        return marshal.loads(payload[content_start:])
@@ -0,0 +1,134 @@
+"""Resolves the names used by the items and rooms of a game to what they name."""
+
+from typing import Any
+
+from common.game_objective import GameObjective
+from common.item import InteractionLinks, Item
+from common.player import Player
+from common.room import Room
+from game_repository.item_manager import ItemManager
+
+
+class ContentLinker:
+    """Resolves the names used by the items and rooms of a game to what they name.
+
+    A game is linked once after it is built, so that play follows the linked
+    items and objectives rather than looking up their names, and every name
+    which refers to nothing is reported together. The game data is checked the
+    same way before it is compiled into the content bundle.
+    """
+
+    def __init__(
+        self: "ContentLinker",
+        items: ItemManager,
+        rooms: dict[str, Room],
+        objectives: dict[str, GameObjective],
+        player: Player | None = None,
+    ) -> None:
+        """Initialize the linker with the built game, and its player if it has one."""
+        self.items = items
+        self.rooms = rooms
+        self.objectives = objectives
+        self.player = player
+        self.room_names = {
+            name.lower()
+            for room in rooms.values()
+            for name in [room.name] + room.aliases
+        }
+        self.problems: list[str] = []
+
+    def link(self: "ContentLinker") -> list[str]:
+        """Link the items and rooms, returning a description of every broken name."""
+        self.problems = []
+        for item in self.items.items.values():
+            self.link_item(item)
+        for room in self.rooms.values():
+            self.link_room(room)
+        if self.player is not None:
+            self.check_player(self.player)
+        for objective in self.objectives.values():
+            where = f"The objective {objective.name}"
+            self.resolve_items(where, objective.requirements)
+            self.resolve_items(
+                where,
+                [interaction.get("item") for interaction in objective.interactions],
+            )
+        return self.problems
+
+    def link_item(self: "ContentLinker", item: Item) -> None:
+        """Resolve the names used by each interaction of an item."""
+        item.links = dict()
+        for action, interaction in item.interactions.items():
+            where = f"The {action} interaction of {item.name}"
+            item.links[action] = self.link_interaction(where, interaction)
+
+    def link_interaction(
+        self: "ContentLinker", where: str, interaction: dict[str, Any]
+    ) -> InteractionLinks:
+        """Return the items named by an interaction."""
+        self.resolve_items(where, interaction.get("hides", []))
+        for name in interaction.get("completes", []):
+            if name not in self.objectives:
+                self.problems.append(f"{where} refers to a missing objective, {name}.")
+        transforms: list[tuple[Item | None, Item | None]] = []
+        for transform in interaction.get("transforms", []):
+            from_item, to_item = self.resolve_items(
+                where, [transform["from"], transform["to"]]
+            )
+            transforms.append((from_item, to_item))
+        return InteractionLinks(
+            requires=self.resolve_items(where, interaction.get("requires", [])),
+            discovers=self.found(where, interaction.get("discovers", [])),
+            unhides=self.found(where, interaction.get("unhides", [])),
+            unlocks=self.found(where, interaction.get("unlocks", [])),
+            transforms=transforms,
+        )
+
+    def link_room(self: "ContentLinker", room: Room) -> None:
+        """Resolve the objectives blocking a room and check its exits and items."""
+        where = f"The room {room.name}"
+        for name in room.missing_item_names:
+            self.problems.append(f"{where} refers to a missing item, {name}.")
+        room.blocking_objectives = []
+        for blocker in room.blockers:
+            objective = self.objectives.get(blocker["name"])
+            if objective is None:
+                self.problems.append(
+                    f"{where} refers to a missing objective, {blocker['name']}."
+                )
+            else:
+                room.blocking_objectives.append((objective, blocker["message"]))
+        exits = room.exits + list(room.directional_exits.values())
+        for name in dict.fromkeys(exits):
+            if name and name.lower() not in self.room_names:
+                self.problems.append(f"{where} refers to a missing room, {name}.")
+
+    def check_player(self: "ContentLinker", player: Player) -> None:
+        """Check the room the player was placed in and the items they were given."""
+        where = "The player"
+        if player.missing_location is not None:
+            self.problems.append(
+                f"{where} refers to a missing room, {player.missing_location}."
+            )
+        for name in player.missing_item_names:
+            self.problems.append(f"{where} refers to a missing item, {name}.")
+
+    def resolve_items(
+        self: "ContentLinker", where: str, names: list[str | None]
+    ) -> list[Item | None]:
+        """Return the item for each name, or None where it names nothing.
+
+        An empty name deliberately names nothing, so only other names which
+        refer to no item are reported.
+        """
+        resolved: list[Item | None] = []
+        for name in names:
+            item = self.items.get_item_by_name(name)
+            if item is None and name:
+                self.problems.append(f"{where} refers to a missing item, {name}.")
+            resolved.append(item)
+        return resolved
+
+    def found(self: "ContentLinker", where: str, names: list[str]) -> list[Item]:
+        """Return the items which the names refer to, leaving out missing ones."""
+        return [item for item in self.resolve_items(where, names) if item is not None]
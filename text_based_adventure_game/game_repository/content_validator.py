@@ -0,0 +1,65 @@
+"""Checks the game data files before they are compiled into the content bundle."""
+
+import copy
+from typing import Any
+
+from game_repository.content_linker import ContentLinker
+from game_repository.game_repository import GameRepository
+
+
+class ContentValidator:
+    """Checks the game data files before they are compiled into the content bundle.
+
+    The names used by the data are checked by building a new game from it and
+    linking that game, so they are resolved by the same rules as when the game
+    loads. Only names shared by two things of a kind, which building a game
+    would hide, are checked here.
+    """
+
+    def __init__(
+        self: "ContentValidator",
+        items_state: list[dict[str, Any]],
+        rooms_state: list[dict[str, Any]],
+        player_state: dict[str, Any],
+        objectives_state: list[dict[str, Any]],
+    ) -> None:
+        """Initialize the validator with the contents of the new game files."""
+        self.items_state = items_state
+        self.rooms_state = rooms_state
+        self.player_state = player_state
+        self.objectives_state = objectives_state
+        self.problems: list[str] = []
+
+    def validate(self: "ContentValidator") -> list[str]:
+        """Return a description of every problem found in the game data."""
+        self.problems = []
+        self.check_unique("item", [item["name"] for item in self.items_state])
+        self.check_unique("room", [room["name"] for room in self.rooms_state])
+        self.check_unique(
+            "objective", [objective["name"] for objective in self.objectives_state]
+        )
+        game = GameRepository()
+        # Building a game takes over the data it is built from, so it is given
+        # a copy of the data which is about to be compiled.
+        game.apply_content(
+            copy.deepcopy(
+                {
+                    "items": self.items_state,
+                    "rooms": self.rooms_state,
+                    "player": self.player_state,
+                    "objectives": self.objectives_state,
+                }
+            )
+        )
+        self.problems += ContentLinker(
+            game.items, game.rooms, game.objectives.objectives, game.player
+        ).link()
+        return self.problems
+
+    def check_unique(self: "ContentValidator", kind: str, names: list[str]) -> None:
+        """Check that no two things of a kind share a name."""
+        seen: set[str] = set()
+        for name in names:
+            if name in seen:
+                self.problems.append(f"There is more than one {kind} named {name}.")
+            seen.add(name)
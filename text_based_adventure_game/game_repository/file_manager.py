@@ -1,16 +1,25 @@
-"""Loads and saves the game state using JSON files. Used to help the game repository."""
+"""Loads and saves the game state files. Used to help the game repository."""
 
-import copy
+import hashlib
 import json
 import os
+import stat
 import sys
+import tempfile
+import threading
 from typing import Any, NoReturn
 
-from common.game_objective import GameObjective
-from common.item import Item
 from common.load_error import FileOperationError
-from common.player import Player
-from common.room import Room
+from game_repository.asset_store import AssetStore
+from game_repository.content_bundle import ContentBundle, Stamp
+from game_repository.save_file import SaveFile
+
+
+def current_umask() -> int:
+    """Return the umask of the process, which can only be read by setting it."""
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
 
 
 class FileManager:
@@ -26,11 +35,45 @@ class FileManager:
     saved_items_file = "save_data/items.json"
     default_objectives_file = "data/objectives.json"
     saved_objectives_file = "save_data/objectives.json"
+    saved_game_file = "save_data/game.sav"
+    # The slot whose save file is saved_game_file. Other slots are saved beside it.
+    default_save_slot = "game"
+    save_index_name = "saves.jsonl"
+    # Slots are added to the index by the save writer thread while it is read.
+    save_index_lock = threading.Lock()
+    # The permissions open() gives a new file. The umask is read once, before
+    # the save writer thread could be creating files while it is changed.
+    new_file_mode = 0o666 & ~current_umask()
+    saved_games_database = "save_data/saves.db"
     game_art_file = "data/game_art.json"
+    content_bundle_file = "data/content.bundle"
+    # The data files which are compiled into the content bundle.
+    content_files = [
+        language_file,
+        default_items_file,
+        default_room_file,
+        default_player_file,
+        default_objectives_file,
+    ]
 
     @staticmethod
     def has_saved_game() -> bool:  # pragma: no cover
         """Check to see if a saved game exists."""
+        return (
+            len(FileManager.get_save_slot_names()) > 0
+            or FileManager.has_legacy_saved_game()
+        )
+
+    @staticmethod
+    def has_saved_game_file(
+        slot: str = default_save_slot,
+    ) -> bool:  # pragma: no cover
+        """Check to see if a game was saved in the save file of the slot."""
+        return os.path.exists(FileManager.get_save_slot_file(slot))
+
+    @staticmethod
+    def has_legacy_saved_game() -> bool:  # pragma: no cover
+        """Check to see if a game was saved in the older JSON files."""
         player_file = FileManager.join_base_path(FileManager.saved_player_file)
         room_file = FileManager.join_base_path(FileManager.saved_room_file)
         items_file = FileManager.join_base_path(FileManager.saved_items_file)
@@ -140,117 +183,289 @@ class FileManager:
             FileManager.handle_bad_load("loading", "language")
 
     @staticmethod
-    def load_game_stories() -> dict[str, list[str]]:
-        """Load the game stories."""
+    def load_game_stories() -> AssetStore:
+        """Open the game stories, each of which is read the first time it is told."""
         stories_file_path = FileManager.join_base_path(FileManager.stories_file)
         try:
-            with open(stories_file_path, "r") as stories_file:
-                return json.loads(stories_file.read())
+            return AssetStore.open(stories_file_path)
         except Exception:
             FileManager.handle_bad_load("loading", "stories")
 
     @staticmethod
-    def save_player_file(player: Player) -> None:
-        """Save the player file."""
-        serializable_player = copy.deepcopy(vars(player))
-        serializable_player["inventory"] = [item.name for item in player.inventory]
-        serializable_player["location"] = player.location.name
-        saved_player_file_path = FileManager.join_base_path(
-            FileManager.saved_player_file
-        )
+    def get_save_directory() -> str:
+        """Return the directory which holds the save file of every slot."""
+        return os.path.dirname(FileManager.join_base_path(FileManager.saved_game_file))
+
+    @staticmethod
+    def get_save_slot_file(slot: str) -> str:
+        """Return the path of the save file of a slot."""
+        return f"{FileManager.get_save_directory()}/{slot}.sav"
+
+    @staticmethod
+    def get_save_slot_names() -> list[str]:
+        """Return the name of every slot with a save file."""
         try:
-            # check to see if save_data folder exists
-            if not os.path.exists(FileManager.join_base_path("save_data")):
-                os.makedirs(FileManager.join_base_path("save_data"))
-            with open(saved_player_file_path, "w") as player_file:
-                player_file.write(
-                    json.dumps(serializable_player, indent=4, sort_keys=False)
-                )
+            with os.scandir(FileManager.get_save_directory()) as entries:
+                return [
+                    entry.name[: -len(".sav")]
+                    for entry in entries
+                    if entry.name.endswith(".sav") and entry.is_file()
+                ]
+        except OSError:
+            return []
+
+    @staticmethod
+    def get_saved_game_metadata(slot: str) -> dict[str, Any] | FileOperationError:
+        """Get the metadata of a saved game, reading no more than the start of it.
+
+        The size of the save file and when it was last changed are added to
+        the metadata it holds.
+        """
+        saved_game_file = FileManager.get_save_slot_file(slot)
+        try:
+            with open(saved_game_file, "rb") as save_file:
+                start = save_file.read(SaveFile.header.size)
+                metadata_end = SaveFile.metadata_end(start)
+                if isinstance(metadata_end, FileOperationError):
+                    return metadata_end
+                start += save_file.read(max(0, metadata_end - len(start)))
+                status = os.fstat(save_file.fileno())
         except Exception:
-            FileManager.bad_operation_message("saving", "player")
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game")
+            )
+        metadata = SaveFile.decode_metadata(start)
+        if isinstance(metadata, FileOperationError):
+            return metadata
+        return {
+            "saved_at": status.st_mtime,
+            **metadata,
+            "slot": slot,
+            "size": status.st_size,
+        }
 
     @staticmethod
-    def save_room_file(rooms: dict[str, Room]) -> None:
-        """Save the rooms in the room file."""
-        saved_room_file_path = FileManager.join_base_path(FileManager.saved_room_file)
-        serializable_rooms = []
-        for room in rooms.values():
-            serializable_room = copy.deepcopy(vars(room))
-            serializable_room["inventory"] = [item.name for item in room.inventory]
-            serializable_room["starting_inventory"] = [
-                item.name for item in room.starting_inventory
-            ]
-            serializable_room["description"] = room._description
-            del serializable_room["_description"]
-            serializable_rooms.append(serializable_room)
+    def get_save_index() -> list[dict[str, Any]] | FileOperationError:
+        """Get every entry in the index of saved games, oldest first.
 
+        A line which was only partly written when the game stopped is skipped.
+        """
+        index_file = f"{FileManager.get_save_directory()}/{FileManager.save_index_name}"
+        entries: list[dict[str, Any]] = []
         try:
-            # check to see if save_data folder exists
-            if not os.path.exists(FileManager.join_base_path("save_data")):
-                os.makedirs(FileManager.join_base_path("save_data"))
-            with open(saved_room_file_path, "w") as room_file:
-                room_file.write(
-                    json.dumps(serializable_rooms, indent=4, sort_keys=False)
-                )
+            with open(index_file, "r", encoding="utf-8") as save_index:
+                for line in save_index:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(entry, dict) and "slot" in entry:
+                        entries.append(entry)
         except Exception:
-            FileManager.bad_operation_message("saving", "rooms")
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game index")
+            )
+        return entries
 
     @staticmethod
-    def save_items_file(items: dict[str, Item]) -> None:
-        """Save the items in the items file."""
-        saved_items_file_path = FileManager.join_base_path(FileManager.saved_items_file)
-        serializable_items = []
-        for item in items.values():
-            serializable_item = copy.deepcopy(vars(item))
-            serializable_item["description"] = item._description
-            del serializable_item["_description"]
-            serializable_items.append(serializable_item)
+    def add_save_index_entry(entry: dict[str, Any]) -> None:
+        """Add an entry to the end of the index of saved games.
 
+        If it cannot be added, the index is removed so that it is rebuilt from
+        the save files rather than leaving out the slot.
+        """
+        index_file = f"{FileManager.get_save_directory()}/{FileManager.save_index_name}"
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        with FileManager.save_index_lock:
+            try:
+                with open(index_file, "a", encoding="utf-8") as save_index:
+                    save_index.write(line)
+            except Exception:
+                FileManager.remove_save_index()
+
+    @staticmethod
+    def replace_save_index(entries: list[dict[str, Any]]) -> None | FileOperationError:
+        """Replace the index of saved games with the entries in a single step."""
+        save_directory = FileManager.get_save_directory()
+        index_file = f"{save_directory}/{FileManager.save_index_name}"
+        temporary_file = None
         try:
-            # check to see if save_data folder exists
-            if not os.path.exists(FileManager.join_base_path("save_data")):
-                os.makedirs(FileManager.join_base_path("save_data"))
-            with open(saved_items_file_path, "w") as items_file:
-                items_file.write(
-                    json.dumps(serializable_items, indent=4, sort_keys=False)
-                )
+            os.makedirs(save_directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "w", dir=save_directory, suffix=".tmp", delete=False, encoding="utf-8"
+            ) as save_index:
+                temporary_file = save_index.name
+                for entry in entries:
+                    save_index.write(json.dumps(entry, separators=(",", ":")) + "\n")
+            FileManager.replace_file(temporary_file, index_file)
         except Exception:
-            FileManager.bad_operation_message("saving", "items")
+            if temporary_file is not None and os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            return FileOperationError(
+                FileManager.bad_operation_message("saving", "saved game index")
+            )
 
     @staticmethod
-    def save_objectives_file(objectives: dict[str, GameObjective]) -> None:
-        """Save the objectives to the objectives file."""
-        saved_objectives_file = FileManager.join_base_path(
-            FileManager.saved_objectives_file
+    def replace_file(temporary_file: str, target_file: str) -> None:
+        """Rename a temporary file over the target, keeping the target's permissions.
+
+        Temporary files are made readable only by their owner, so they are
+        given the permissions of the file they replace, or of a new file.
+        """
+        try:
+            mode = stat.S_IMODE(os.stat(target_file).st_mode)
+        except FileNotFoundError:
+            mode = FileManager.new_file_mode
+        os.chmod(temporary_file, mode)
+        os.replace(temporary_file, target_file)
+
+    @staticmethod
+    def remove_save_index() -> None:
+        """Remove the index of saved games, so that it is rebuilt when next read."""
+        index_file = f"{FileManager.get_save_directory()}/{FileManager.save_index_name}"
+        try:
+            os.remove(index_file)
+        except OSError:
+            pass
+
+    @staticmethod
+    def get_saved_game(
+        slot: str = default_save_slot,
+    ) -> dict[str, Any] | FileOperationError:
+        """Get the saved game from the save file of the slot."""
+        saved_game_file = FileManager.get_save_slot_file(slot)
+        try:
+            with open(saved_game_file, "rb") as save_file:
+                return SaveFile.decode(save_file.read())
+        except Exception:
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game")
+            )
+
+    @staticmethod
+    def save_game_file(
+        state: dict[str, Any],
+        slot: str = default_save_slot,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the game state in the save file of the slot, replacing it in a single step.
+
+        The state is written to a temporary file which is renamed over the save
+        file once it is complete, so the save file is never partly written.
+        The slot and its metadata are then added to the index of saved games.
+        """
+        save_directory = FileManager.get_save_directory()
+        saved_game_file = FileManager.get_save_slot_file(slot)
+        temporary_file = None
+        try:
+            os.makedirs(save_directory, exist_ok=True)
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=save_directory, suffix=".tmp", delete=False
+            ) as save_file:
+                temporary_file = save_file.name
+                data = SaveFile.encode(state, metadata)
+                save_file.write(data)
+                save_file.flush()
+                os.fsync(save_file.fileno())
+            FileManager.replace_file(temporary_file, saved_game_file)
+        except Exception:
+            if temporary_file is not None and os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            return FileOperationError(
+                FileManager.bad_operation_message("saving", "saved game")
+            )
+        FileManager.add_save_index_entry(
+            {**(metadata or {}), "slot": slot, "size": len(data)}
         )
-        serializable_objectives = []
-        for objective in objectives.values():
-            serializable_objective = copy.deepcopy(vars(objective))
-            serializable_objective["requires"] = serializable_objective["requirements"]
-            serializable_objective["hints"] = serializable_objective["_hints"]
-            del serializable_objective["_hints"]
-            del serializable_objective["hint_count"]
-            del serializable_objective["requirements"]
-            serializable_objectives.append(serializable_objective)
 
+    @staticmethod
+    def stamp_content_file(file_name: str) -> Stamp:
+        """Return the size, modification time and hash of a data file."""
+        path = FileManager.join_base_path(file_name)
+        with open(path, "rb") as content_file:
+            data = content_file.read()
+        modified = os.stat(path).st_mtime_ns
+        return len(data), modified, hashlib.sha256(data).hexdigest()
+
+    @staticmethod
+    def content_is_current(stamps: dict[str, Stamp]) -> bool:
+        """Check that no data file changed since the stamps were taken.
+
+        A data file is only hashed when its modification time changed, which
+        happens whenever it is checked out again without being changed.
+        """
+        if set(stamps.keys()) != set(FileManager.content_files):
+            return False
+        for file_name, (size, modified, digest) in stamps.items():
+            path = FileManager.join_base_path(file_name)
+            status = os.stat(path)
+            if status.st_size != size:
+                return False
+            if status.st_mtime_ns != modified:
+                if FileManager.stamp_content_file(file_name)[2] != digest:
+                    return False
+        return True
+
+    @staticmethod
+    def get_content_bundle() -> dict[str, Any] | FileOperationError:
+        """Get the compiled content, unless a data file changed since it was built."""
+        bundle_file = FileManager.join_base_path(FileManager.content_bundle_file)
+        if not os.path.exists(bundle_file):
+            return FileOperationError("The content bundle has not been built.")
         try:
-            # check to see if save_data folder exists
-            if not os.path.exists(FileManager.join_base_path("save_data")):
-                os.makedirs(FileManager.join_base_path("save_data"))
-            with open(saved_objectives_file, "w") as objectives_file:
-                objectives_file.write(
-                    json.dumps(serializable_objectives, indent=4, sort_keys=False)
+            with open(bundle_file, "rb") as content_bundle:
+                return ContentBundle.decode(
+                    content_bundle.read(), FileManager.content_is_current
                 )
         except Exception:
-            FileManager.bad_operation_message("saving", "objectives")
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "content bundle")
+            )
+
+    @staticmethod
+    def save_content_bundle(
+        stamps: dict[str, Stamp], content: dict[str, Any]
+    ) -> None | FileOperationError:
+        """Save the compiled content along with the stamps of its data files.
+
+        The bundle is replaced in a single step, so a game starting while it
+        is built never reads a partly written bundle.
+        """
+        bundle_file = FileManager.join_base_path(FileManager.content_bundle_file)
+        temporary_file = None
+        try:
+            with tempfile.NamedTemporaryFile(
+                "wb", dir=os.path.dirname(bundle_file), suffix=".tmp", delete=False
+            ) as content_bundle:
+                temporary_file = content_bundle.name
+                content_bundle.write(ContentBundle.encode(stamps, content))
+            FileManager.replace_file(temporary_file, bundle_file)
+        except Exception:
+            if temporary_file is not None and os.path.exists(temporary_file):
+                os.remove(temporary_file)
+            return FileOperationError(
+                FileManager.bad_operation_message("saving", "content bundle")
+            )
+
+    @staticmethod
+    def save_trace(
+        trace_file: str, events: list[dict[str, Any]]
+    ) -> None | FileOperationError:
+        """Save timed spans as a trace which can be opened in a trace viewer."""
+        try:
+            with open(trace_file, "w", encoding="utf-8") as trace:
+                json.dump({"traceEvents": events}, trace, separators=(",", ":"))
+        except Exception:
+            return FileOperationError(
+                FileManager.bad_operation_message("saving", "profile trace")
+            )
 
     @staticmethod
-    def load_art() -> dict[str, list[str]]:
-        """Load the game_map."""
+    def load_art() -> AssetStore:
+        """Open the game art, each piece of which is read the first time it is shown."""
         game_art_file_path = FileManager.join_base_path(FileManager.game_art_file)
         try:
-            with open(game_art_file_path, "r") as game_art_file:
-                return json.loads(game_art_file.read())
+            return AssetStore.open(game_art_file_path)
         except Exception:
             FileManager.handle_bad_load("loading", "game art")
 
@@ -0,0 +1,58 @@
+"""The game data which is loaded once and shared by every game session."""
+
+from common.load_error import FileOperationError
+from game_repository.art_manager import ArtManager
+from game_repository.file_manager import FileManager
+from game_repository.game_repository import GameRepository
+from language.language_manager import LanguageManager
+from language.story_manager import StoryManager
+
+
+class GameContent:
+    """The game data which is loaded once and shared by every game session."""
+
+    def __init__(self: "GameContent") -> None:
+        """Initialize the game content."""
+        self.language: LanguageManager = LanguageManager()
+        self.stories: StoryManager = StoryManager()
+        self.art_manager: ArtManager = ArtManager()
+        # The new game world is built once and never played. Each session gets
+        # copies of the parts that change during play and shares the rest.
+        self.template: GameRepository = GameRepository()
+
+    def load(self: "GameContent") -> None | FileOperationError:
+        """Load the language, stories, art and the new game world.
+
+        The language and new game world come from the content bundle when it
+        is up to date with the data files, and from the data files otherwise.
+        """
+        self.stories.load_stories()
+        self.art_manager.load_art()
+        # The template's target phrases are shared by every session, so they
+        # must be built from the loaded language.
+        self.template.language = self.language
+        content = FileManager.get_content_bundle()
+        if not isinstance(content, FileOperationError):
+            self.language.language = content["language"]
+            self.template.apply_content(content)
+        else:
+            self.language.load_language()
+            error = self.template.load_game_files(new=True)
+            if isinstance(error, FileOperationError):
+                return error
+            self.template.invalidate_target_phrases()
+        self.template.link_game()
+
+    def new_repository(self: "GameContent") -> GameRepository:
+        """Return a repository for a new game which shares the loaded content."""
+        repository = GameRepository()
+        repository.language = self.language
+        repository.stories = self.stories
+        repository.art_manager = self.art_manager
+        self.start_new_game(repository)
+        return repository
+
+    def start_new_game(self: "GameContent", repository: GameRepository) -> None:
+        """Replace the repository's game state with a new game from the template."""
+        repository.template = self.template
+        repository.start_from_template(self.template)
@@ -1,18 +1,29 @@
 """A repository which manages access to shared game state."""
 
 import sys
-from typing import NoReturn
+import time
+from typing import Any, NoReturn
 
 from common.environment import Environment
+from common.game_objective import GameObjective
 from common.game_response import GameResponse
+from common.item import Item
 from common.load_error import FileOperationError
 from common.player import Player
+from common.profiler import Profiler
 from common.room import Room
 from game_repository.art_manager import ArtManager
+from game_repository.autosave_policy import AutosavePolicy
+from game_repository.change_tracker import ChangeTracker
+from game_repository.content_linker import ContentLinker
 from game_repository.file_manager import FileManager
 from game_repository.item_manager import ItemManager
 from game_repository.objectives_manager import ObjectiveManager
+from game_repository.save_state import SaveState
+from game_repository.save_storage import FileSaveStorage, SaveStorage
+from game_repository.save_writer import SaveWriter
 from language.language_manager import LanguageManager
+from language.phrase_trie import PhraseTrie
 from language.story_manager import StoryManager
 
 
@@ -22,11 +33,14 @@ class GameRepository:
     normal_scroll_delay = 0.01
     slow_scroll_delay = 0.02
     fast_scroll_delay = 0.005
-    art_scroll_delay = 0.002
     off_scroll_delay = 0
 
-    def __init__(self: "GameRepository", is_development: bool = False) -> None:
-        """Initialize the game repository."""
+    def __init__(
+        self: "GameRepository",
+        is_development: bool = False,
+        storage: SaveStorage | None = None,
+    ) -> None:
+        """Initialize the game repository, which keeps saves in files by default."""
         self.game_active: bool = True
         self.state_dirty: bool = False
         self.player: Player = Player.default_player()
@@ -38,60 +52,165 @@ class GameRepository:
         self.environment: Environment = Environment(is_development)
         self.scroll_delay: float = GameRepository.normal_scroll_delay
         self.art_manager: ArtManager = ArtManager()
+        self._target_phrases: PhraseTrie | None = None
+        # Advances whenever something which targets are found in changes, and
+        # counts the targets which were looked for where the player is.
+        self.world_epoch: int = 0
+        self.world_lookups: int = 0
+        # An unplayed new game, with the values from it that saves compare with.
+        self._new_game: GameRepository | None = None
+        self._save_state: SaveState | None = None
+        self.storage: SaveStorage = storage or FileSaveStorage()
+        self.save_writer: SaveWriter = SaveWriter(self.storage)
+        # What changed since the last save, and the changes that save held.
+        self.change_tracker: ChangeTracker = ChangeTracker()
+        self._saved_changes: dict[str, Any] | None = None
+        # Saves the game every few turns or seconds when set.
+        self.autosave: AutosavePolicy | None = None
+        # Whether new games are built from the content bundle, and the bundle
+        # read at startup which the first new game is built from.
+        self.use_content_bundle: bool = False
+        self._bundled_content: dict[str, Any] | None = None
+        # The unplayed game which new games are copied from, when one is shared.
+        self.template: GameRepository | None = None
+        # The names which referred to nothing when the game was last linked.
+        self.link_problems: list[str] = []
+        # The slot which the game was loaded from and is saved in.
+        self.save_slot: str = FileManager.default_save_slot
+        # Times each turn when the game is run with --profile.
+        self.profiler: Profiler | None = None
 
     def load_default_state(self: "GameRepository"):
-        """Try to load the default game state."""
-        self.language.load_language()
+        """Load the content shared by every game.
+
+        When the content bundle is up to date with the data files, the language
+        is taken from it and new games are built from it. Otherwise they are
+        read from the data files.
+        """
+        content = FileManager.get_content_bundle()
+        if isinstance(content, FileOperationError):
+            self.language.load_language()
+        else:
+            self.language.language = content["language"]
+            self.use_content_bundle = True
+            self._bundled_content = content
         self.stories.load_stories()
-        self.items.load_items(new=True)
         self.art_manager.load_art()
+        self.invalidate_target_phrases()
 
     def try_load_game_state(
-        self: "GameRepository", new: bool
+        self: "GameRepository", new: bool, slot: str | None = None
     ) -> GameResponse | NoReturn:
-        """Load the game state."""
-        items_result = self.items.load_items(new=new)
-        if isinstance(items_result, FileOperationError):
+        """Load the game state, from the save file of a slot unless it is new.
+
+        Without a slot, the game is loaded from the slot it was last saved in.
+        """
+        if new and self.template is not None:
+            self.start_from_template(self.template)
+            self.save_slot = FileManager.default_save_slot
+            return GameResponse.success("New game started.")
+        self.invalidate_target_phrases()
+        if slot is None:
+            slot = self.save_slot
+        if not new:
+            # Load the most recent save rather than one still being written.
+            self.save_writer.flush()
+        if not new and self.storage.has_saved_game(slot):
+            result = self.load_saved_game(slot)
+        elif not new and (
+            slot != FileManager.default_save_slot
+            or not isinstance(self.storage, FileSaveStorage)
+        ):
+            result = FileOperationError(f"There is no game saved as {slot}.")
+        else:
+            # Games saved before there were save files are kept in the older
+            # JSON files, which only belong to the storage of save files.
+            result = self.load_game_files(new=new)
+        if isinstance(result, FileOperationError):
             if new:
-                print(items_result.message)
+                print(result.message)
                 sys.exit(1)
-            return GameResponse.failure(items_result.message)
+            return GameResponse.failure(result.message)
+
+        self.link_game()
+        self.forget_saved_changes()
+        self.state_dirty = False
+        self.save_slot = FileManager.default_save_slot if new else slot
+
+        message = "New game started." if new else "Game loaded successfully."
+        return GameResponse.success(message)
+
+    def load_game_files(self: "GameRepository", new: bool) -> None | FileOperationError:
+        """Load the items, rooms, player and objectives from their own files."""
+        if new and self.use_content_bundle:
+            content = self._bundled_content or FileManager.get_content_bundle()
+            self._bundled_content = None
+            if not isinstance(content, FileOperationError):
+                self.apply_content(content)
+                return None
+        items_result = self.items.load_items(new=new)
+        if isinstance(items_result, FileOperationError):
+            return items_result
         room_result = self.load_room_state(new=new)
         if isinstance(room_result, FileOperationError):
-            if new:
-                print(room_result.message)
-                sys.exit(1)
-            return GameResponse.failure(room_result.message)
+            return room_result
         player_result = self.load_player_state(new=new)
         if isinstance(player_result, FileOperationError):
-            if new:
-                print(player_result.message)
-                sys.exit(1)
-            return GameResponse.failure(player_result.message)
-        objectives_result = self.objectives.load_objectives(new=new)
-        if isinstance(objectives_result, FileOperationError):
-            if new:
-                print(objectives_result.message)
-                sys.exit(1)
-            return GameResponse.failure(objectives_result.message)
+            return player_result
+        return self.objectives.load_objectives(new=new)
 
-        self.state_dirty = False
+    def load_saved_game(
+        self: "GameRepository", slot: str = FileManager.default_save_slot
+    ) -> None | FileOperationError:
+        """Load a new game and apply the changes saved in a slot of the storage."""
+        saved_game = self.storage.get_saved_game(slot)
+        if isinstance(saved_game, FileOperationError):
+            return saved_game
+        if not isinstance(saved_game.get("player"), dict):
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game")
+            )
+        new_game = self.get_new_game()
+        if isinstance(new_game, FileOperationError):
+            return new_game
+        self.copy_game_state(new_game)
+        SaveState.apply_changes(
+            saved_game, self.rooms, self.items.items, self.objectives.objectives
+        )
+        self.apply_player_state(saved_game["player"])
 
-        message = "New game started." if new else "Game loaded successfully."
-        return GameResponse.success(message)
+    def get_new_game(self: "GameRepository") -> "GameRepository | FileOperationError":
+        """Return an unplayed new game, which saved games are compared with."""
+        if self._new_game is None:
+            new_game = GameRepository()
+            new_game.use_content_bundle = self.use_content_bundle
+            result = new_game.load_game_files(new=True)
+            if isinstance(result, FileOperationError):
+                return result
+            self._new_game = new_game
+            self._save_state = SaveState(
+                new_game.rooms, new_game.items.items, new_game.objectives.objectives
+            )
+        return self._new_game
 
     def load_room_state(self: "GameRepository", new: bool) -> None | FileOperationError:
         """Load the room state."""
         room_state = FileManager.get_room_file(new)
         if isinstance(room_state, FileOperationError):
             return room_state
+        self.apply_room_state(room_state)
 
+    def apply_room_state(
+        self: "GameRepository", room_state: list[dict[str, Any]]
+    ) -> None:
+        """Build the rooms from their saved state, using the loaded items."""
+        rooms: dict[str, Room] = dict(self.rooms)
         for room in room_state:
             inventory = self.items.get_list_of_items(room["inventory"])
             starting_inventory = self.items.get_list_of_items(
                 room["starting_inventory"]
             )
-            self.rooms[room["name"]] = Room(
+            rooms[room["name"]] = Room(
                 name=room["name"],
                 description=room["description"],
                 short_description=room["short_description"],
@@ -102,6 +221,10 @@ class GameRepository:
                 inventory=inventory,
                 starting_inventory=starting_inventory,
             )
+            rooms[room["name"]].missing_item_names = self.items.missing_names(
+                room["inventory"] + room["starting_inventory"]
+            )
+        self.rooms = rooms
 
     def load_player_state(
         self: "GameRepository", new: bool
@@ -110,39 +233,180 @@ class GameRepository:
         player_state = FileManager.get_player_file(new=new)
         if isinstance(player_state, FileOperationError):
             return player_state
+        self.apply_player_state(player_state)
+
+    def apply_player_state(
+        self: "GameRepository", player_state: dict[str, Any]
+    ) -> None:
+        """Build the player from their saved state, using the loaded rooms."""
         player_location = self.get_room_by_name(player_state["location"])
+        missing_location = None
         if player_location is None:
+            missing_location = player_state["location"]
             player_location = self.rooms.get("entry")
-        player_inventory = self.items.get_list_of_items(
-            player_state.get("inventory", [])
-        )
+        item_names = player_state.get("inventory", [])
         self.player = Player(
             name=player_state.get("name", ""),
             location=player_location,
             visited_rooms=player_state.get("visited_rooms", []),
-            inventory=player_inventory,
+            inventory=self.items.get_list_of_items(item_names),
             won=player_state.get("won", False),
             watched_end_credits=player_state.get("watched_end_credits", False),
         )
+        self.player.missing_location = missing_location
+        self.player.missing_item_names = self.items.missing_names(item_names)
+
+    def apply_content(self: "GameRepository", content: dict[str, Any]) -> None:
+        """Build a new game from the contents of the bundle, which it takes over."""
+        self.items.items = ItemManager.build_items(content["items"])
+        self.rooms = dict()
+        self.apply_room_state(content["rooms"])
+        self.apply_player_state(content["player"])
+        self.objectives.objectives = ObjectiveManager.build_objectives(
+            content["objectives"]
+        )
+
+    def start_from_template(self: "GameRepository", template: "GameRepository") -> None:
+        """Start a new game from a template repository which must not be played.
+
+        The world epoch advances, so that no target found in the old game is
+        used in the new one.
+        """
+        self.copy_game_state(template)
+        self.target_phrases = template.target_phrases
+        self.forget_saved_changes()
+        self.state_dirty = False
+        self.advance_world_epoch()
 
-    def save_game_state(self: "GameRepository") -> None:
-        """Save the game state."""
-        FileManager.save_player_file(self.player)
-        FileManager.save_room_file(self.rooms)
-        FileManager.save_items_file(self.items.items)
-        FileManager.save_objectives_file(self.objectives.objectives)
+    def copy_game_state(self: "GameRepository", template: "GameRepository") -> None:
+        """Copy the game state of a template repository which must not be played.
+
+        Only the state that changes during play is copied, everything else is
+        shared with the template. The copy is linked as the template was.
+        """
+        self.items = template.items.copy()
+        items = self.items.items
+        self.objectives = template.objectives.copy()
+        objectives = self.objectives.objectives
+        self.rooms = {
+            name: room.copy(items, objectives) for name, room in template.rooms.items()
+        }
+        self.player = template.player.copy(self.rooms, items)
+        self.link_problems = template.link_problems
+
+    def link_game(self: "GameRepository") -> None:
+        """Link the items and rooms of the game to the things they name.
+
+        Names which refer to nothing are kept in link_problems, and shown
+        straight away in development.
+        """
+        self.link_problems = ContentLinker(
+            self.items, self.rooms, self.objectives.objectives, self.player
+        ).link()
+        if self.environment.is_development:
+            for problem in self.link_problems:
+                print(problem)
+
+    def save_game_state(
+        self: "GameRepository", slot: str | None = None
+    ) -> None | FileOperationError:
+        """Save the changes from a new game in the background.
+
+        The changes are taken from the game straight away and written to the
+        slot in the storage by the save writer, or to the slot the game was
+        last saved in. A failure is returned by the next save or by
+        finish_saving.
+        """
+        new_game = self.get_new_game()
+        if isinstance(new_game, FileOperationError):
+            return new_game
+        if self._saved_changes is None:
+            changes = self._save_state.changes(
+                self.player, self.rooms, self.items.items, self.objectives.objectives
+            )
+        else:
+            changes = self._save_state.update_changes(
+                self._saved_changes,
+                self.change_tracker,
+                self.player,
+                self.rooms,
+                self.items.items,
+                self.objectives.objectives,
+            )
+        self._saved_changes = changes
+        self.change_tracker.clear()
+        if self.autosave is not None:
+            self.autosave.reset()
+        if slot is not None:
+            self.save_slot = slot
+        error = self.save_writer.take_error()
+        self.save_writer.submit(changes, self.save_slot, self.get_save_metadata())
         self.state_dirty = False
+        return error
+
+    def get_save_metadata(self: "GameRepository") -> dict[str, Any]:
+        """Return what the list of saved games shows about this game."""
+        self.objectives.refresh_objectives(self.player)
+        objectives = len(self.objectives.objectives)
+        return {
+            "player": self.player.name,
+            "location": self.player.location.name,
+            "objectives_done": objectives - len(self.objectives.incomplete_objectives),
+            "objectives": objectives,
+            "saved_at": time.time(),
+        }
+
+    def forget_saved_changes(self: "GameRepository") -> None:
+        """Compare the whole game with a new game at the next save."""
+        self._saved_changes = None
+        self.change_tracker.clear()
+
+    def end_turn(self: "GameRepository") -> None | FileOperationError:
+        """Finish a turn, saving the game if the autosave policy says it is time."""
+        if self.autosave is None or not self.autosave.record_turn():
+            return None
+        if not self.state_dirty:
+            self.autosave.reset()
+            return None
+        return self.save_game_state()
+
+    def finish_saving(self: "GameRepository") -> None | FileOperationError:
+        """Wait for saves to be written and return an error if one failed."""
+        error = self.save_writer.flush()
+        if isinstance(error, FileOperationError):
+            self.state_dirty = True
+        return error
+
+    @property
+    def rooms(self: "GameRepository") -> dict[str, Room]:
+        """Return the rooms by name."""
+        return self._rooms
+
+    @rooms.setter
+    def rooms(self: "GameRepository", rooms: dict[str, Room]) -> None:
+        """Set the rooms and rebuild the room index and map connections."""
+        self._rooms = rooms
+        self.room_index: dict[str, Room] = dict()
+        for room in rooms.values():
+            for name in [room.name] + room.aliases:
+                self.room_index.setdefault(name.lower(), room)
+        self.room_connections: dict[str, set[str]] = dict()
+        self.room_neighbours: dict[str, dict[str, Room]] = dict()
+        for room in rooms.values():
+            self.room_connections[room.name] = set(room.exits)
+            neighbours: dict[str, Room] = dict()
+            for direction, room_name in room.directional_exits.items():
+                if room_name is not None and room_name.lower() in self.room_index:
+                    neighbours[direction] = self.room_index[room_name.lower()]
+            self.room_neighbours[room.name] = neighbours
 
     def room_is_connected(self: "GameRepository", room: Room, target: str) -> bool:
         """Determine if the room is connected to the target room."""
-        return target in room.exits
+        return target in self.room_connections.get(room.name, room.exits)
 
     def get_room_by_name(self: "GameRepository", name: str | None) -> Room | None:
-        """Find the room with the given name."""
-        for room in self.rooms.values():
-            if room.name == name or name in room.aliases:
-                return room
-        return None
+        """Find the room with the given name or alias."""
+        return None if name is None else self.room_index.get(name.lower())
 
     def get_room_by_direction(
         self: "GameRepository", direction: str | None
@@ -153,18 +417,42 @@ class GameRepository:
         parsed_direction = self.language.get_directional_alias(direction)
         if parsed_direction is None:
             return None
-        directional_exit = self.current_location.directional_exit(parsed_direction)
-        return self.get_room_by_name(
-            "" if directional_exit is None else directional_exit
-        )
+        neighbours = self.room_neighbours.get(self.current_location.name, {})
+        return neighbours.get(parsed_direction)
 
     def move_player(self: "GameRepository", room: Room) -> None:
         """Move the player to a new location."""
         has_visited_before = room.name in self.player.visited_rooms
+        previous_location = self.player.location
         self.player.location = room
         if not has_visited_before:
             self.player.visited_rooms.append(room.name)
-        # mark the state as dirty since the player location is updated.
+        # objectives which require items in either room may have changed.
+        items = [*previous_location.inventory, *room.inventory]
+        self.objectives.invalidate_items([item.name for item in items])
+        self.advance_world_epoch()
+        self.state_dirty = True
+
+    def mark_items_moved(self: "GameRepository", items: list[Item]) -> None:
+        """Mark the state as dirty after items moved in or out of the current room."""
+        self.objectives.invalidate_items([item.name for item in items])
+        self.change_tracker.mark_items(items)
+        self.change_tracker.mark_room(self.current_location)
+        self.advance_world_epoch()
+        self.state_dirty = True
+
+    def mark_items_changed(self: "GameRepository", items: list[Item]) -> None:
+        """Mark the state as dirty after the flags or description of items changed."""
+        self.change_tracker.mark_items(items)
+        self.advance_world_epoch()
+        self.state_dirty = True
+
+    def mark_objective_changed(
+        self: "GameRepository", objective: GameObjective
+    ) -> None:
+        """Mark the state as dirty after an interaction of an objective completed."""
+        self.objectives.invalidate_objective(objective)
+        self.change_tracker.mark_objective(objective)
         self.state_dirty = True
 
     def find_target(self: "GameRepository", target: str, from_user: bool) -> str | None:
@@ -183,6 +471,8 @@ class GameRepository:
         if room is not None:
             return room.name
 
+        # What is found from here on depends on where the player is.
+        self.world_lookups += 1
         room = self.get_room_by_direction(target)
         if room is not None:
             return room.name
@@ -193,6 +483,43 @@ class GameRepository:
 
         return None
 
+    @property
+    def target_phrases(self: "GameRepository") -> PhraseTrie:
+        """Return every room, item and command phrase that could be a target.
+
+        The trie is rebuilt the first time it is needed after the game data
+        changes, since names and aliases do not change during play.
+        """
+        if self._target_phrases is None:
+            self._target_phrases = self.build_target_phrases()
+        return self._target_phrases
+
+    @target_phrases.setter
+    def target_phrases(self: "GameRepository", target_phrases: PhraseTrie) -> None:
+        """Use target phrases that were built for another copy of the same game."""
+        self._target_phrases = target_phrases
+
+    def invalidate_target_phrases(self: "GameRepository") -> None:
+        """Rebuild the target phrases the next time they are needed."""
+        self._target_phrases = None
+        self.advance_world_epoch()
+
+    def advance_world_epoch(self: "GameRepository") -> None:
+        """Mark every target found so far as possibly out of date."""
+        self.world_epoch += 1
+
+    def build_target_phrases(self: "GameRepository") -> PhraseTrie:
+        """Build a trie of every phrase find_target is able to resolve."""
+        target_phrases = PhraseTrie()
+        target_phrases.add_all(list(self.language.vocabulary.keys()))
+        for room in self.rooms.values():
+            target_phrases.add(room.name)
+            target_phrases.add_all(room.aliases)
+        for item in self.items.items.values():
+            target_phrases.add(item.name)
+            target_phrases.add_all(item.alias)
+        return target_phrases
+
     @property
     def current_location(self: "GameRepository") -> Room:
         """Return the player's current location."""
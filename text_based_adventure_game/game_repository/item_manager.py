@@ -1,5 +1,8 @@
 """A class to manage the initial list of possible game items."""
 
+from typing import Any
+
+from common.inventory import Inventory
 from common.item import Item
 from common.load_error import FileOperationError
 from game_repository.file_manager import FileManager
@@ -13,12 +16,66 @@ class ItemManager:
         """Initialize the item manager."""
         self.items: dict[str, Item] = dict()
 
+    @property
+    def items(self: "ItemManager") -> dict[str, Item]:
+        """Return the game items by name."""
+        return self._items
+
+    @items.setter
+    def items(self: "ItemManager", items: dict[str, Item]) -> None:
+        """Set the game items and rebuild the name and alias index."""
+        self._items = items
+        self.item_index: dict[str, Item] = dict()
+        # Names shared by more than one item, with the item that wins listed first.
+        self.alias_collisions: dict[str, list[str]] = dict()
+        for item in items.values():
+            self.index_item(item)
+
+    def index_item(self: "ItemManager", item: Item) -> None:
+        """Add the item's name and aliases to the index without replacing others."""
+        for key in dict.fromkeys(name.lower() for name in [item.name] + item.alias):
+            existing = self.item_index.setdefault(key, item)
+            if existing is not item:
+                self.alias_collisions.setdefault(key, [existing.name])
+                self.alias_collisions[key].append(item.name)
+
+    def add_item(self: "ItemManager", item: Item) -> None:
+        """Add an item to the game, replacing any item with the same name."""
+        replaced = self._items.get(item.name)
+        self._items[item.name] = item
+        if replaced is None:
+            self.index_item(item)
+        else:
+            self.items = self._items
+
+    def copy(self: "ItemManager") -> "ItemManager":
+        """Return a manager holding copies of the items, reusing this index."""
+        manager = ItemManager()
+        manager._items = {name: item.copy() for name, item in self._items.items()}
+        for item in manager._items.values():
+            if item.links:
+                item.links = {
+                    action: links.copy(manager._items)
+                    for action, links in item.links.items()
+                }
+        manager.item_index = {
+            key: manager._items[item.name] for key, item in self.item_index.items()
+        }
+        manager.alias_collisions = {
+            key: list(names) for key, names in self.alias_collisions.items()
+        }
+        return manager
+
     def load_items(self: "ItemManager", new: bool) -> None | FileOperationError:
         """Load the initial list of items."""
         items_state = FileManager.get_items_file(new)
         if isinstance(items_state, FileOperationError):
             return items_state
+        self.items = ItemManager.build_items(items_state)
 
+    @staticmethod
+    def build_items(items_state: list[dict[str, Any]]) -> dict[str, Item]:
+        """Build the game items from their saved state."""
         items: dict[str, Item] = dict()
         for item in items_state:
             name = str(item["name"])
@@ -42,27 +99,40 @@ class ItemManager:
                 hidden=hidden,
             )
             items[name] = new_item
-        self.items = items
+        return items
 
     def get_item_by_name(self: "ItemManager", name: str | None) -> Item | None:
-        """Get an item by name."""
-        for items in self.items.values():
-            if items.name == name or name in items.alias:
-                return items
-        return None
+        """Get an item by name or alias."""
+        return None if name is None else self.item_index.get(name.lower())
 
     def get_item_by_name_by_room(
         self: "ItemManager", name: str | None, player: Player
     ) -> Item | None:
-        """Get an item by name per room"""
-        for items in player.inventory:
-            if items.name == name or name in items.alias:
-                return items
-        for items in player.location.inventory:
-            if items.name == name or name in items.alias:
+        """Get an item by name per room, preferring a name to an alias."""
+        item = ItemManager.get_item_by_name_in(name, player.inventory)
+        if item is None:
+            item = ItemManager.get_item_by_name_in(name, player.location.inventory)
+        return item
+
+    @staticmethod
+    def get_item_by_name_in(name: str | None, inventory: Inventory) -> Item | None:
+        """Get an item in an inventory by name, or else by alias."""
+        item = inventory.get(name)  # type: ignore[arg-type]
+        if item is not None:
+            return item
+        for items in inventory:
+            if name in items.alias:
                 return items
         return None
 
+    def missing_names(self: "ItemManager", item_names: list[str]) -> list[str]:
+        """Return each of the names which refers to no item, once."""
+        return [
+            name
+            for name in dict.fromkeys(item_names)
+            if self.get_item_by_name(name) is None
+        ]
+
     def get_list_of_items(self: "ItemManager", item_names: list[str]) -> list[Item]:
         """Get a list of items by name."""
         found_items: list[Item] = []
@@ -0,0 +1,59 @@
+"""Keeps saved games in memory, for tests and for generating load."""
+
+import threading
+import time
+from typing import Any
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.save_file import SaveFile
+from game_repository.save_storage import SaveStorage
+
+
+class MemorySaveStorage(SaveStorage):
+    """Keeps saved games in memory, for tests and for generating load.
+
+    Games are kept encoded as save files would be, so a loaded game never
+    shares anything with the game that was saved. Nothing outlives the storage.
+    """
+
+    def __init__(self: "MemorySaveStorage") -> None:
+        """Initialize the storage with no saved games."""
+        self.saves: dict[str, bytes] = dict()
+        self.metadata: dict[str, dict[str, Any]] = dict()
+        self.lock = threading.Lock()
+
+    def has_saved_game(self: "MemorySaveStorage", slot: str) -> bool:
+        """Check to see if a game was saved in the slot."""
+        return slot in self.saves
+
+    def get_saved_game(
+        self: "MemorySaveStorage", slot: str
+    ) -> dict[str, Any] | FileOperationError:
+        """Get the state of the game saved in the slot."""
+        data = self.saves.get(slot)
+        if data is None:
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game")
+            )
+        return SaveFile.decode(data)
+
+    def save_game(
+        self: "MemorySaveStorage",
+        state: dict[str, Any],
+        slot: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the state of a game and its metadata in the slot."""
+        data = SaveFile.encode(state, metadata)
+        entry = {"saved_at": time.time(), **(metadata or {}), "slot": slot}
+        entry["size"] = len(data)
+        with self.lock:
+            self.saves[slot] = data
+            self.metadata[slot] = entry
+
+    def list_slots(self: "MemorySaveStorage") -> list[dict[str, Any]]:
+        """Return the metadata of every saved slot, most recently saved first."""
+        with self.lock:
+            entries = list(self.metadata.values())
+        return sorted(entries, key=lambda entry: entry["saved_at"], reverse=True)
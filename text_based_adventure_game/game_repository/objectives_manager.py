@@ -1,5 +1,6 @@
 """A class to manage game objectives."""
 
+from typing import Any
 
 from common.game_objective import GameObjective
 from common.item import Item
@@ -7,6 +8,9 @@ from common.load_error import FileOperationError
 from common.player import Player
 from game_repository.file_manager import FileManager
 
+# The objectives with an interaction for each item name and action.
+InteractionIndex = dict[tuple[str, str], list[GameObjective]]
+
 
 class ObjectiveManager:
     """A class to manage game objectives."""
@@ -15,6 +19,77 @@ class ObjectiveManager:
         """Initialize the objective manager."""
         self.objectives: dict[str, GameObjective] = dict()
 
+    @property
+    def objectives(self: "ObjectiveManager") -> dict[str, GameObjective]:
+        """Return the objectives keyed by name."""
+        return self._objectives
+
+    @objectives.setter
+    def objectives(
+        self: "ObjectiveManager", objectives: dict[str, GameObjective]
+    ) -> None:
+        """Set the objectives and mark every one of them for evaluation."""
+        self._objectives = objectives
+        self._requirement_index: dict[str, list[GameObjective]] | None = None
+        self._interaction_index: InteractionIndex | None = None
+        self.incomplete_objectives: set[str] = set()
+        self.stale_objectives: set[str] = set(objectives.keys())
+        for objective in objectives.values():
+            objective.invalidate()
+
+    @property
+    def requirement_index(self: "ObjectiveManager") -> dict[str, list[GameObjective]]:
+        """Return the objectives which require each item, building it when needed."""
+        if self._requirement_index is None:
+            self._requirement_index = self.build_requirement_index(self.objectives)
+        return self._requirement_index
+
+    @property
+    def interaction_index(self: "ObjectiveManager") -> InteractionIndex:
+        """Return the objectives for each item and action, building it when needed."""
+        if self._interaction_index is None:
+            self._interaction_index = self.build_interaction_index(self.objectives)
+        return self._interaction_index
+
+    @staticmethod
+    def build_interaction_index(
+        objectives: dict[str, GameObjective]
+    ) -> InteractionIndex:
+        """Return the objectives keyed by the item and action of their interactions."""
+        index: InteractionIndex = dict()
+        for objective in objectives.values():
+            for key in objective.interaction_index.keys():
+                index.setdefault(key, []).append(objective)
+        return index
+
+    @staticmethod
+    def build_requirement_index(
+        objectives: dict[str, GameObjective]
+    ) -> dict[str, list[GameObjective]]:
+        """Return the objectives which require each item, keyed by item name."""
+        index: dict[str, list[GameObjective]] = dict()
+        for objective in objectives.values():
+            for requirement in dict.fromkeys(objective.requirements):
+                index.setdefault(requirement, []).append(objective)
+        return index
+
+    def copy(self: "ObjectiveManager") -> "ObjectiveManager":
+        """Return a manager holding copies of the objectives, reusing these indexes."""
+        manager = ObjectiveManager()
+        objectives = {
+            name: objective.copy() for name, objective in self.objectives.items()
+        }
+        manager.objectives = objectives
+        manager._requirement_index = {
+            item_name: [objectives[objective.name] for objective in related]
+            for item_name, related in self.requirement_index.items()
+        }
+        manager._interaction_index = {
+            key: [objectives[objective.name] for objective in related]
+            for key, related in self.interaction_index.items()
+        }
+        return manager
+
     def load_objectives(
         self: "ObjectiveManager", new: bool
     ) -> None | FileOperationError:
@@ -22,7 +97,15 @@ class ObjectiveManager:
         objectives_state = FileManager.get_objectives_file(new)
         if isinstance(objectives_state, FileOperationError):
             return objectives_state
+        objectives = ObjectiveManager.build_objectives(objectives_state)
+        self.objectives = objectives
+        self._interaction_index = self.build_interaction_index(objectives)
 
+    @staticmethod
+    def build_objectives(
+        objectives_state: list[dict[str, Any]]
+    ) -> dict[str, GameObjective]:
+        """Build the game objectives from their saved state."""
         objectives: dict[str, GameObjective] = dict()
         for objective in objectives_state:
             name = objective.get("name", "")
@@ -36,22 +119,13 @@ class ObjectiveManager:
                 interactions=interactions,
             )
             objectives[name] = new_objective
-        self.objectives = objectives
+        return objectives
 
     def find_related_objectives(
         self: "ObjectiveManager", item: Item, action: str
     ) -> list[GameObjective]:
         """Find the objectives related to the given item and action."""
-        related_objectives: list[GameObjective] = []
-        for objective in self.objectives.values():
-            interactions = objective.interactions
-            for interaction in interactions:
-                if (
-                    interaction.get("item") == item.name
-                    and interaction.get("interaction_type") == action
-                ):
-                    related_objectives.append(objective)
-        return related_objectives
+        return list(self.interaction_index.get((item.name, action), []))
 
     def get_objective_by_name(
         self: "ObjectiveManager", name: str
@@ -59,9 +133,30 @@ class ObjectiveManager:
         """Find the objective with the given name."""
         return self.objectives.get(name)
 
+    def invalidate_objective(
+        self: "ObjectiveManager", objective: GameObjective
+    ) -> None:
+        """Mark an objective for evaluation after one of its interactions changed."""
+        objective.invalidate()
+        self.stale_objectives.add(objective.name)
+
+    def invalidate_items(self: "ObjectiveManager", item_names: list[str]) -> None:
+        """Mark the objectives which require any of the items for evaluation."""
+        for item_name in item_names:
+            for objective in self.requirement_index.get(item_name, []):
+                self.invalidate_objective(objective)
+
+    def refresh_objectives(self: "ObjectiveManager", player: Player) -> None:
+        """Evaluate the objectives which changed since the last refresh."""
+        for name in self.stale_objectives:
+            objective = self.objectives.get(name)
+            if objective is None or objective.is_complete(player):
+                self.incomplete_objectives.discard(name)
+            else:
+                self.incomplete_objectives.add(name)
+        self.stale_objectives.clear()
+
     def all_objectives_complete(self: "ObjectiveManager", player: Player) -> bool:
         """Return True if all objectives are complete."""
-        for objective in self.objectives.values():
-            if not objective.is_complete(player):
-                return False
-        return True
+        self.refresh_objectives(player)
+        return len(self.incomplete_objectives) == 0
@@ -0,0 +1,99 @@
+"""Encodes and decodes the single file which holds a saved game."""
+
+import json
+import struct
+import zlib
+from typing import Any
+
+from common.load_error import FileOperationError
+
+
+class SaveFile:
+    """Encodes and decodes the single file which holds a saved game.
+
+    The file starts with a fixed header holding a magic number, the format
+    version, a checksum and the lengths of the metadata and the payload. It is
+    followed by the metadata, which describes the save for listing it, and the
+    payload, which is the saved state. Both are compact UTF-8 JSON.
+    """
+
+    magic = b"FORKSAVE"
+    version = 2
+    header = struct.Struct(">8sHIII")
+    # The start of every header, which says how the rest of it is laid out.
+    prefix = struct.Struct(">8sH")
+
+    @staticmethod
+    def encode(state: dict[str, Any], metadata: dict[str, Any] | None = None) -> bytes:
+        """Return the bytes of a save file holding the state and its metadata."""
+        metadata_bytes = json.dumps(metadata or {}, separators=(",", ":")).encode(
+            "utf-8"
+        )
+        payload = json.dumps(state, separators=(",", ":")).encode("utf-8")
+        checksum = zlib.crc32(payload, zlib.crc32(metadata_bytes))
+        return (
+            SaveFile.header.pack(
+                SaveFile.magic,
+                SaveFile.version,
+                checksum,
+                len(metadata_bytes),
+                len(payload),
+            )
+            + metadata_bytes
+            + payload
+        )
+
+    @staticmethod
+    def metadata_end(data: bytes) -> int | FileOperationError:
+        """Return where the metadata ends, given at least the header of a save file."""
+        if len(data) < SaveFile.prefix.size:
+            return FileOperationError("The saved game file is incomplete.")
+        magic, version = SaveFile.prefix.unpack_from(data)
+        if magic != SaveFile.magic:
+            return FileOperationError("The saved game file is not a saved game.")
+        if version != SaveFile.version:
+            return FileOperationError(
+                "The saved game was made by a different version of the game."
+            )
+        if len(data) < SaveFile.header.size:
+            return FileOperationError("The saved game file is incomplete.")
+        metadata_length = SaveFile.header.unpack_from(data)[3]
+        return SaveFile.header.size + metadata_length
+
+    @staticmethod
+    def decode_metadata(data: bytes) -> dict[str, Any] | FileOperationError:
+        """Return the metadata held in the start of a save file.
+
+        Only the header and the metadata are needed, so the rest of the file
+        does not have to be read.
+        """
+        metadata_end = SaveFile.metadata_end(data)
+        if isinstance(metadata_end, FileOperationError):
+            return metadata_end
+        if len(data) < metadata_end:
+            return FileOperationError("The saved game file is incomplete.")
+        try:
+            metadata = json.loads(data[SaveFile.header.size : metadata_end])
+        except ValueError:
+            return FileOperationError("The saved game file is damaged.")
+        if not isinstance(metadata, dict):
+            return FileOperationError("The saved game file is damaged.")
+        return metadata
+
+    @staticmethod
+    def decode(data: bytes) -> dict[str, Any] | FileOperationError:
+        """Return the state held in the bytes of a save file."""
+        metadata_end = SaveFile.metadata_end(data)
+        if isinstance(metadata_end, FileOperationError):
+            return metadata_end
+        if len(data) < metadata_end:
+            return FileOperationError("The saved game file is incomplete.")
+        _, _, checksum, _, length = SaveFile.header.unpack_from(data)
+        expected_checksum = zlib.crc32(data[SaveFile.header.size :])
+        payload = data[metadata_end:]
+        if len(payload) != length or expected_checksum != checksum:
+            return FileOperationError("The saved game file is damaged.")
+        state = json.loads(payload)
+        if not isinstance(state, dict):
+            return FileOperationError("The saved game file is damaged.")
+        return state
@@ -0,0 +1,64 @@
+"""Keeps the index of the named slots that games are saved in."""
+
+import re
+from typing import Any
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+
+
+class SaveSlots:
+    """Keeps the index of the named slots that games are saved in.
+
+    The index is a file beside the save files which has a line of metadata
+    added each time a slot is saved, so listing the slots reads the index
+    rather than any save file. Older lines for a slot are dropped once they
+    outnumber the slots, and a missing index is rebuilt from the metadata
+    at the start of each save file.
+    """
+
+    default_slot = FileManager.default_save_slot
+    name_pattern = re.compile(r"[a-z0-9_-]{1,40}")
+    # How many lines the index may have beyond twice the number of slots.
+    index_allowance = 16
+
+    @staticmethod
+    def slot_name(name: str) -> str | None:
+        """Return the slot that a name given by the player refers to, if it can."""
+        slot = "_".join(name.lower().split())
+        if SaveSlots.name_pattern.fullmatch(slot) is None:
+            return None
+        return slot
+
+    @staticmethod
+    def list_slots() -> list[dict[str, Any]]:
+        """Return the metadata of every saved slot, most recently saved first."""
+        with FileManager.save_index_lock:
+            entries = FileManager.get_save_index()
+            if isinstance(entries, FileOperationError):
+                entries = SaveSlots.rebuild_index()
+            latest = {entry["slot"]: entry for entry in entries}
+            if len(entries) > 2 * len(latest) + SaveSlots.index_allowance:
+                FileManager.replace_save_index(list(latest.values()))
+        return sorted(
+            latest.values(), key=lambda entry: entry.get("saved_at", 0), reverse=True
+        )
+
+    @staticmethod
+    def rebuild_index() -> list[dict[str, Any]]:
+        """Rebuild the index from the metadata at the start of each save file."""
+        entries = []
+        for slot in FileManager.get_save_slot_names():
+            metadata = FileManager.get_saved_game_metadata(slot)
+            if not isinstance(metadata, FileOperationError):
+                entries.append(metadata)
+        entries.sort(key=lambda entry: entry.get("saved_at", 0))
+        if entries:
+            FileManager.replace_save_index(entries)
+        return entries
+
+    @staticmethod
+    def most_recent_slot() -> str | None:
+        """Return the slot which was saved most recently, if any were."""
+        slots = SaveSlots.list_slots()
+        return slots[0]["slot"] if slots else None
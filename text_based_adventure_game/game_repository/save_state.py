@@ -0,0 +1,159 @@
+"""Records how a game differs from a new game, so that only the changes are saved."""
+
+from typing import Any
+
+from common.game_objective import GameObjective
+from common.item import Item
+from common.player import Player
+from common.room import Room
+from game_repository.change_tracker import ChangeTracker
+
+
+class SaveState:
+    """The new game values of the state which changes during play."""
+
+    item_flags = ["discovered", "hidden", "locked"]
+
+    def __init__(
+        self: "SaveState",
+        rooms: dict[str, Room],
+        items: dict[str, Item],
+        objectives: dict[str, GameObjective],
+    ) -> None:
+        """Record the values from the rooms, items and objectives of a new game."""
+        self.items: dict[str, dict[str, Any]] = {
+            item.name: {
+                "discovered": item.discovered,
+                "hidden": item.hidden,
+                "locked": item.locked,
+                "description": item._description,
+            }
+            for item in items.values()
+        }
+        self.room_inventories: dict[str, list[str]] = {
+            room.name: room.inventory_item_names for room in rooms.values()
+        }
+        self.objective_progress: dict[str, list[bool]] = {
+            objective.name: SaveState.progress(objective)
+            for objective in objectives.values()
+        }
+
+    @staticmethod
+    def progress(objective: GameObjective) -> list[bool]:
+        """Return whether each of the objective's interactions is complete."""
+        return [
+            bool(interaction.get("complete", False))
+            for interaction in objective.interactions
+        ]
+
+    def changes(
+        self: "SaveState",
+        player: Player,
+        rooms: dict[str, Room],
+        items: dict[str, Item],
+        objectives: dict[str, GameObjective],
+    ) -> dict[str, Any]:
+        """Return the state which differs from a new game, and the player."""
+        tracker = ChangeTracker()
+        tracker.items.update(items.keys())
+        tracker.rooms.update(rooms.keys())
+        tracker.objectives.update(objectives.keys())
+        empty: dict[str, Any] = {"items": {}, "rooms": {}, "objectives": {}}
+        return self.update_changes(empty, tracker, player, rooms, items, objectives)
+
+    def update_changes(
+        self: "SaveState",
+        changes: dict[str, Any],
+        tracker: ChangeTracker,
+        player: Player,
+        rooms: dict[str, Room],
+        items: dict[str, Item],
+        objectives: dict[str, GameObjective],
+    ) -> dict[str, Any]:
+        """Return saved changes brought up to date for what the tracker recorded.
+
+        Only the items, rooms and objectives the tracker names are compared with
+        a new game, so the cost grows with the number of edits rather than the
+        size of the game. The given changes are left as they were.
+        """
+        item_changes: dict[str, dict[str, Any]] = dict(changes["items"])
+        for name in tracker.items:
+            item = items.get(name)
+            changed = None if item is None else self.item_changes(item)
+            SaveState.set_or_remove(item_changes, name, changed or None)
+        room_changes: dict[str, list[str]] = dict(changes["rooms"])
+        for name in tracker.rooms:
+            room = rooms.get(name)
+            inventory = None if room is None else room.inventory_item_names
+            if inventory == self.room_inventories.get(name):
+                inventory = None
+            SaveState.set_or_remove(room_changes, name, inventory)
+        objective_changes: dict[str, list[bool]] = dict(changes["objectives"])
+        for name in tracker.objectives:
+            objective = objectives.get(name)
+            progress = None if objective is None else SaveState.progress(objective)
+            if progress == self.objective_progress.get(name):
+                progress = None
+            SaveState.set_or_remove(objective_changes, name, progress)
+        return {
+            "player": {
+                "name": player.name,
+                "location": player.location.name,
+                "visited_rooms": list(player.visited_rooms),
+                "inventory": [item.name for item in player.inventory],
+                "won": player.won,
+                "watched_end_credits": player.watched_end_credits,
+            },
+            "items": item_changes,
+            "rooms": room_changes,
+            "objectives": objective_changes,
+        }
+
+    def item_changes(self: "SaveState", item: Item) -> dict[str, Any]:
+        """Return the flags and description of the item which differ from a new game."""
+        new_item = self.items.get(item.name, {})
+        changed = {
+            flag: getattr(item, flag)
+            for flag in SaveState.item_flags
+            if new_item.get(flag) != getattr(item, flag)
+        }
+        if new_item.get("description") != item._description:
+            changed["description"] = item._description
+        return changed
+
+    @staticmethod
+    def set_or_remove(changes: dict[str, Any], name: str, changed: Any) -> None:
+        """Record what changed for the name, or forget it when changed is None."""
+        if changed is not None:
+            changes[name] = changed
+        else:
+            changes.pop(name, None)
+
+    @staticmethod
+    def apply_changes(
+        changes: dict[str, Any],
+        rooms: dict[str, Room],
+        items: dict[str, Item],
+        objectives: dict[str, GameObjective],
+    ) -> None:
+        """Apply saved changes to the rooms, items and objectives of a new game."""
+        for name, changed in changes.get("items", {}).items():
+            item = items.get(name)
+            if item is None:
+                continue
+            for flag in SaveState.item_flags:
+                if flag in changed:
+                    setattr(item, flag, bool(changed[flag]))
+            if "description" in changed:
+                item.description = changed["description"]
+        for name, inventory in changes.get("rooms", {}).items():
+            room = rooms.get(name)
+            if room is not None:
+                room.inventory = [items[item] for item in inventory if item in items]
+        for name, progress in changes.get("objectives", {}).items():
+            objective = objectives.get(name)
+            if objective is None:
+                continue
+            for interaction, complete in zip(objective.interactions, progress):
+                interaction["complete"] = bool(complete)
+            objective.invalidate()
@@ -0,0 +1,93 @@
+"""Where saved games are kept, and the storage which keeps them in save files."""
+
+from abc import ABC, abstractmethod
+from typing import Any
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.save_slots import SaveSlots
+
+# The state, slot and metadata of a game waiting to be saved.
+PendingSave = tuple[dict[str, Any], str, dict[str, Any] | None]
+
+
+class SaveStorage(ABC):
+    """Where saved games are kept, each in a named slot.
+
+    The game repository saves and loads games through a storage, so that they
+    can be kept in save files, in a database or in memory.
+    """
+
+    @abstractmethod
+    def has_saved_game(self: "SaveStorage", slot: str) -> bool:
+        """Check to see if a game was saved in the slot."""
+
+    def has_any_saved_game(self: "SaveStorage") -> bool:
+        """Check to see if a game was saved in any slot."""
+        return len(self.list_slots()) > 0
+
+    @abstractmethod
+    def get_saved_game(
+        self: "SaveStorage", slot: str
+    ) -> dict[str, Any] | FileOperationError:
+        """Get the state of the game saved in the slot."""
+
+    @abstractmethod
+    def save_game(
+        self: "SaveStorage",
+        state: dict[str, Any],
+        slot: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the state of a game and its metadata in the slot."""
+
+    def save_games(
+        self: "SaveStorage", saves: list[PendingSave]
+    ) -> None | FileOperationError:
+        """Save several games, returning the last error if any failed."""
+        error = None
+        for state, slot, metadata in saves:
+            result = self.save_game(state, slot, metadata)
+            if isinstance(result, FileOperationError):
+                error = result
+        return error
+
+    @abstractmethod
+    def list_slots(self: "SaveStorage") -> list[dict[str, Any]]:
+        """Return the metadata of every saved slot, most recently saved first."""
+
+    def most_recent_slot(self: "SaveStorage") -> str | None:
+        """Return the slot which was saved most recently, if any were."""
+        slots = self.list_slots()
+        return slots[0]["slot"] if slots else None
+
+
+class FileSaveStorage(SaveStorage):
+    """Keeps each saved game in its own save file in the save_data folder."""
+
+    def has_saved_game(self: "FileSaveStorage", slot: str) -> bool:
+        """Check to see if a game was saved in the save file of the slot."""
+        return FileManager.has_saved_game_file(slot)
+
+    def has_any_saved_game(self: "FileSaveStorage") -> bool:
+        """Check to see if a game was saved, including in the older JSON files."""
+        return FileManager.has_saved_game()
+
+    def get_saved_game(
+        self: "FileSaveStorage", slot: str
+    ) -> dict[str, Any] | FileOperationError:
+        """Get the state of the game from the save file of the slot."""
+        return FileManager.get_saved_game(slot)
+
+    def save_game(
+        self: "FileSaveStorage",
+        state: dict[str, Any],
+        slot: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the game in the save file of the slot and add it to the index."""
+        return FileManager.save_game_file(state, slot, metadata)
+
+    def list_slots(self: "FileSaveStorage") -> list[dict[str, Any]]:
+        """Return the metadata of every saved slot from the index of save files."""
+        return SaveSlots.list_slots()
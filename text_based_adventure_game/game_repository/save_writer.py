@@ -0,0 +1,65 @@
+"""Writes saved games on a background thread so that play never waits on the disk."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.save_storage import SaveStorage
+
+
+class SaveWriter:
+    """Writes saved games on a background thread, one at a time and in order."""
+
+    def __init__(self: "SaveWriter", storage: SaveStorage) -> None:
+        """Initialize the save writer. The thread is started by the first save."""
+        self.storage = storage
+        self._executor: ThreadPoolExecutor | None = None
+        self.pending: Future | None = None
+        # The error from the most recent save that failed, until it is reported.
+        self.error: FileOperationError | None = None
+
+    def submit(
+        self: "SaveWriter",
+        state: dict[str, Any],
+        slot: str = FileManager.default_save_slot,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Queue a snapshot of the game state to be written to a slot in the storage.
+
+        The state must not be changed after it is submitted.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix="save-writer"
+            )
+        self.pending = self._executor.submit(self.write, state, slot, metadata)
+
+    def write(
+        self: "SaveWriter",
+        state: dict[str, Any],
+        slot: str = FileManager.default_save_slot,
+        metadata: dict[str, Any] | None = None,
+    ) -> None:
+        """Write the state to the slot in the storage, keeping any error for later."""
+        try:
+            result = self.storage.save_game(state, slot, metadata)
+        except Exception:
+            result = FileOperationError(
+                FileManager.bad_operation_message("saving", "saved game")
+            )
+        if isinstance(result, FileOperationError):
+            self.error = result
+
+    def take_error(self: "SaveWriter") -> FileOperationError | None:
+        """Return the error from a failed save once, or None if saves succeeded."""
+        error = self.error
+        self.error = None
+        return error
+
+    def flush(self: "SaveWriter") -> FileOperationError | None:
+        """Wait for every queued save to be written and return any error."""
+        if self.pending is not None:
+            self.pending.result()
+            self.pending = None
+        return self.take_error()
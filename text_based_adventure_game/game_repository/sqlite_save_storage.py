@@ -0,0 +1,134 @@
+"""Keeps saved games in an SQLite database."""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.save_file import SaveFile
+from game_repository.save_storage import PendingSave, SaveStorage
+
+
+class SqliteSaveStorage(SaveStorage):
+    """Keeps saved games in an SQLite database, one row for each slot.
+
+    Each row holds the save file of a game along with its metadata, which is
+    kept in its own column so that slots are listed without reading any save.
+    Several games are saved in a single transaction by save_games. The
+    statements never change, so SQLite prepares each of them once.
+    """
+
+    create_table = (
+        "CREATE TABLE IF NOT EXISTS saves ("
+        "slot TEXT PRIMARY KEY, saved_at REAL NOT NULL, "
+        "metadata TEXT NOT NULL, save_file BLOB NOT NULL)"
+    )
+    insert_save = (
+        "INSERT OR REPLACE INTO saves (slot, saved_at, metadata, save_file) "
+        "VALUES (?, ?, ?, ?)"
+    )
+    select_save = "SELECT save_file FROM saves WHERE slot = ?"
+    select_slot = "SELECT 1 FROM saves WHERE slot = ?"
+    select_metadata = "SELECT metadata FROM saves ORDER BY saved_at DESC"
+
+    def __init__(
+        self: "SqliteSaveStorage", database: str = FileManager.saved_games_database
+    ) -> None:
+        """Open the database, creating it if it does not exist.
+
+        The database is found from the project directory, unless it is
+        ":memory:" for a database which is never written to disk.
+        """
+        if database != ":memory:":
+            database = FileManager.join_base_path(database)
+            os.makedirs(os.path.dirname(database), exist_ok=True)
+        # Games are saved by the save writer thread and loaded by the game.
+        self.connection = sqlite3.connect(database, check_same_thread=False)
+        self.lock = threading.Lock()
+        with self.lock, self.connection:
+            if database != ":memory:":
+                self.connection.execute("PRAGMA journal_mode=WAL")
+                self.connection.execute("PRAGMA synchronous=NORMAL")
+            self.connection.execute(SqliteSaveStorage.create_table)
+
+    def has_saved_game(self: "SqliteSaveStorage", slot: str) -> bool:
+        """Check to see if a game was saved in the slot."""
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    SqliteSaveStorage.select_slot, (slot,)
+                ).fetchone()
+        except sqlite3.Error:
+            return False
+        return row is not None
+
+    def get_saved_game(
+        self: "SqliteSaveStorage", slot: str
+    ) -> dict[str, Any] | FileOperationError:
+        """Get the state of the game saved in the slot."""
+        try:
+            with self.lock:
+                row = self.connection.execute(
+                    SqliteSaveStorage.select_save, (slot,)
+                ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            return FileOperationError(
+                FileManager.bad_operation_message("loading", "saved game")
+            )
+        return SaveFile.decode(row[0])
+
+    def save_game(
+        self: "SqliteSaveStorage",
+        state: dict[str, Any],
+        slot: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the state of a game and its metadata in the slot."""
+        return self.save_games([(state, slot, metadata)])
+
+    def save_games(
+        self: "SqliteSaveStorage", saves: list[PendingSave]
+    ) -> None | FileOperationError:
+        """Save several games in a single transaction, so either all or none are."""
+        rows = []
+        for state, slot, metadata in saves:
+            save_file = SaveFile.encode(state, metadata)
+            entry = {"saved_at": time.time(), **(metadata or {}), "slot": slot}
+            entry["size"] = len(save_file)
+            rows.append(
+                (
+                    slot,
+                    entry["saved_at"],
+                    json.dumps(entry, separators=(",", ":")),
+                    save_file,
+                )
+            )
+        try:
+            with self.lock, self.connection:
+                self.connection.executemany(SqliteSaveStorage.insert_save, rows)
+        except sqlite3.Error:
+            return FileOperationError(
+                FileManager.bad_operation_message("saving", "saved game")
+            )
+
+    def list_slots(self: "SqliteSaveStorage") -> list[dict[str, Any]]:
+        """Return the metadata of every saved slot, most recently saved first."""
+        try:
+            with self.lock:
+                rows = self.connection.execute(
+                    SqliteSaveStorage.select_metadata
+                ).fetchall()
+        except sqlite3.Error:
+            return []
+        return [json.loads(metadata) for (metadata,) in rows]
+
+    def close(self: "SqliteSaveStorage") -> None:
+        """Close the database once no more games will be saved or loaded."""
+        with self.lock:
+            self.connection.close()
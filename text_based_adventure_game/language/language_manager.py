@@ -2,229 +2,182 @@
 
 from common.request_type import RequestType
 from game_repository.file_manager import FileManager
+from language.vocabulary_entry import VocabularyEntry
 
 
 class LanguageManager:
     """Manages the language of the game."""
 
+    # The order of each table decides which meaning wins when a phrase appears in
+    # more than one language group, e.g. "s" is both south and fast.
+    request_type_groups: list[tuple[str, RequestType]] = [
+        ("move_requests", RequestType.MOVE),
+        ("look_requests", RequestType.LOOK),
+        ("take_requests", RequestType.TAKE),
+        ("drop_requests", RequestType.DROP),
+        ("exit_requests", RequestType.EXIT),
+        ("inspect_requests", RequestType.INSPECT),
+        ("save_requests", RequestType.SAVE_GAME),
+        ("load_requests", RequestType.LOAD_GAME),
+        ("list_saves_requests", RequestType.LIST_SAVES),
+        ("new_game_requests", RequestType.NEW_GAME),
+        ("inventory_requests", RequestType.INVENTORY),
+        ("game_story_requests", RequestType.GAME_STORY),
+        ("help_requests", RequestType.HELP),
+        ("use_requests", RequestType.USE),
+        ("chew_requests", RequestType.CHEW),
+        ("pull_requests", RequestType.PULL),
+        ("objective_requests", RequestType.OBJECTIVES),
+        ("profile_requests", RequestType.PROFILE),
+        ("alias", RequestType.ALIAS),
+        ("sit_requests", RequestType.SIT),
+        ("scroll_requests", RequestType.SCROLL),
+        ("clean_requests", RequestType.CLEAN),
+        ("drink_requests", RequestType.DRINK),
+        ("hints", RequestType.HINT),
+        ("game_map", RequestType.GAME_MAP),
+        ("climb_requests", RequestType.CLIMB),
+        ("turn_on_requests", RequestType.TURN_ON),
+        ("open_requests", RequestType.OPEN),
+        ("play_requests", RequestType.PLAY),
+        ("flush_requests", RequestType.FLUSH),
+        ("draw_requests", RequestType.DRAW),
+    ]
+
+    command_target_groups: list[tuple[str, str]] = [
+        ("move_requests", "move"),
+        ("look_requests", "look"),
+        ("take_requests", "take"),
+        ("drop_requests", "drop"),
+        ("exit_requests", "exit"),
+        ("inspect_requests", "inspect"),
+        ("save_requests", "save"),
+        ("load_requests", "load"),
+        ("list_saves_requests", "saves"),
+        ("new_game_requests", "new"),
+        ("inventory_requests", "inventory"),
+        ("help_requests", "help"),
+        ("use_requests", "use"),
+        ("chew_requests", "chew"),
+        ("pull_requests", "pull"),
+        ("alias", "alias"),
+        ("sit_requests", "sit"),
+        ("move_west", "west"),
+        ("move_east", "east"),
+        ("move_south", "south"),
+        ("move_north", "north"),
+        ("yes_words", "yes"),
+        ("fast_words", "fast"),
+        ("medium_words", "medium"),
+        ("slow_words", "slow"),
+        ("scroll_requests", "scroll"),
+        ("off_words", "off"),
+        ("clean_requests", "clean"),
+        ("drink_requests", "drink"),
+        ("hints", "hint"),
+        ("game_map", "game_map"),
+        ("climb_requests", "climb"),
+        ("turn_on_requests", "turn on"),
+        ("open_requests", "open"),
+        ("play_requests", "play"),
+        ("flush_requests", "flush"),
+    ]
+
+    alias_groups: list[str] = [
+        "help_requests",
+        "move_requests",
+        "inspect_requests",
+        "look_requests",
+        "take_requests",
+        "drop_requests",
+        "exit_requests",
+        "save_requests",
+        "load_requests",
+        "list_saves_requests",
+        "new_game_requests",
+        "chew_requests",
+        "pull_requests",
+        "yes_words",
+        "move_west",
+        "move_east",
+        "move_north",
+        "move_south",
+        "sit_requests",
+        "use_requests",
+        "alias",
+        "inventory_requests",
+        "fast_words",
+        "slow_words",
+        "medium_words",
+        "scroll_requests",
+        "off_words",
+        "clean_requests",
+        "drink_requests",
+        "hints",
+        "game_map",
+        "climb_requests",
+        "turn_on_requests",
+        "open_requests",
+        "play_requests",
+        "flush_requests",
+    ]
+
     def __init__(self: "LanguageManager") -> None:
         """Initialize the language manager."""
         self.language: dict[str, list[str]] = dict()
 
+    @property
+    def language(self: "LanguageManager") -> dict[str, list[str]]:
+        """Return the language values."""
+        return self._language
+
+    @language.setter
+    def language(self: "LanguageManager", language: dict[str, list[str]]) -> None:
+        """Set the language values and rebuild the vocabulary index."""
+        self._language = language
+        self.vocabulary = self.build_vocabulary(language)
+
     def load_language(self: "LanguageManager") -> None:
         """Load the language file."""
         self.language = FileManager.load_language()
 
+    def build_vocabulary(
+        self: "LanguageManager", language: dict[str, list[str]]
+    ) -> dict[str, VocabularyEntry]:
+        """Index every phrase in the language by everything it can mean."""
+        vocabulary: dict[str, VocabularyEntry] = dict()
+        for group, request_type in self.request_type_groups:
+            for phrase in language.get(group, []):
+                entry = vocabulary.setdefault(phrase, VocabularyEntry())
+                if entry.request_type == RequestType.UNKNOWN:
+                    entry.request_type = request_type
+        for group, command_target in self.command_target_groups:
+            for phrase in language.get(group, []):
+                entry = vocabulary.setdefault(phrase, VocabularyEntry())
+                if entry.command_target is None:
+                    entry.command_target = command_target
+        for group in self.alias_groups:
+            aliases = language.get(group, [])
+            for phrase in aliases:
+                entry = vocabulary.setdefault(phrase, VocabularyEntry())
+                if len(entry.aliases) == 0:
+                    entry.aliases = aliases
+        return vocabulary
+
     def find_command_target(self: "LanguageManager", command: str) -> str | None:
         """Find the target of the command."""
-        if command in self.move_requests:
-            return "move"
-        elif command in self.look_requests:
-            return "look"
-        elif command in self.take_requests:
-            return "take"
-        elif command in self.drop_requests:
-            return "drop"
-        elif command in self.exit_requests:
-            return "exit"
-        elif command in self.inspect_requests:
-            return "inspect"
-        elif command in self.save_requests:
-            return "save"
-        elif command in self.load_requests:
-            return "load"
-        elif command in self.new_game_requests:
-            return "new"
-        elif command in self.inventory_requests:
-            return "inventory"
-        elif command in self.help_requests:
-            return "help"
-        elif command in self.use_requests:
-            return "use"
-        elif command in self.chew_requests:
-            return "chew"
-        elif command in self.pull_requests:
-            return "pull"
-        elif command in self.alias_requests:
-            return "alias"
-        elif command in self.sit_requests:
-            return "sit"
-        elif command in self.west_requests:
-            return "west"
-        elif command in self.east_requests:
-            return "east"
-        elif command in self.south_requests:
-            return "south"
-        elif command in self.north_requests:
-            return "north"
-        elif command in self.yes_words:
-            return "yes"
-        elif command in self.fast_words:
-            return "fast"
-        elif command in self.medium_words:
-            return "medium"
-        elif command in self.slow_words:
-            return "slow"
-        elif command in self.scroll_requests:
-            return "scroll"
-        elif command in self.off_words:
-            return "off"
-        elif command in self.clean_requests:
-            return "clean"
-        elif command in self.drink_requests:
-            return "drink"
-        elif command in self.hints:
-            return "hint"
-        elif command in self.game_map:
-            return "game_map"
-        elif command in self.climb_requests:
-            return "climb"
-        elif command in self.turn_on_requests:
-            return "turn on"
-        elif command in self.open_requests:
-            return "open"
-        elif command in self.play_requests:
-            return "play"
-        elif command in self.flush_requests:
-            return "flush"
-        return None
+        entry = self.vocabulary.get(command)
+        return None if entry is None else entry.command_target
 
     def get_request_type_aliases(self: "LanguageManager", item_name) -> list[str]:
         """Get aliases for a request type."""
-        if item_name in self.help_requests:
-            return self.help_requests
-        if item_name in self.move_requests:
-            return self.move_requests
-        if item_name in self.inspect_requests:
-            return self.inspect_requests
-        if item_name in self.look_requests:
-            return self.look_requests
-        if item_name in self.take_requests:
-            return self.take_requests
-        if item_name in self.drop_requests:
-            return self.drop_requests
-        if item_name in self.exit_requests:
-            return self.exit_requests
-        if item_name in self.save_requests:
-            return self.save_requests
-        if item_name in self.load_requests:
-            return self.load_requests
-        if item_name in self.new_game_requests:
-            return self.new_game_requests
-        if item_name in self.chew_requests:
-            return self.chew_requests
-        if item_name in self.pull_requests:
-            return self.pull_requests
-        if item_name in self.yes_words:
-            return self.yes_words
-        if item_name in self.west_requests:
-            return self.west_requests
-        if item_name in self.east_requests:
-            return self.east_requests
-        if item_name in self.north_requests:
-            return self.north_requests
-        if item_name in self.south_requests:
-            return self.south_requests
-        if item_name in self.sit_requests:
-            return self.sit_requests
-        if item_name in self.use_requests:
-            return self.use_requests
-        if item_name in self.alias_requests:
-            return self.alias_requests
-        if item_name in self.inventory_requests:
-            return self.inventory_requests
-        if item_name in self.fast_words:
-            return self.fast_words
-        if item_name in self.slow_words:
-            return self.slow_words
-        if item_name in self.medium_words:
-            return self.medium_words
-        if item_name in self.scroll_requests:
-            return self.scroll_requests
-        if item_name in self.off_words:
-            return self.off_words
-        if item_name in self.clean_requests:
-            return self.clean_requests
-        if item_name in self.drink_requests:
-            return self.drink_requests
-        if item_name in self.hints:
-            return self.hints
-        if item_name in self.game_map:
-            return self.game_map
-        if item_name in self.climb_requests:
-            return self.climb_requests
-        if item_name in self.turn_on_requests:
-            return self.turn_on_requests
-        if item_name in self.open_requests:
-            return self.open_requests
-        if item_name in self.play_requests:
-            return self.play_requests
-        if item_name in self.flush_requests:
-            return self.flush_requests
-        return []
+        entry = self.vocabulary.get(item_name)
+        return [] if entry is None else entry.aliases
 
     def get_request_type(self: "LanguageManager", request_text: str) -> RequestType:
         """Convert the request text to a request type."""
-        if request_text in self.move_requests:
-            return RequestType.MOVE
-        elif request_text in self.look_requests:
-            return RequestType.LOOK
-        elif request_text in self.take_requests:
-            return RequestType.TAKE
-        elif request_text in self.drop_requests:
-            return RequestType.DROP
-        elif request_text in self.exit_requests:
-            return RequestType.EXIT
-        elif request_text in self.inspect_requests:
-            return RequestType.INSPECT
-        elif request_text in self.save_requests:
-            return RequestType.SAVE_GAME
-        elif request_text in self.load_requests:
-            return RequestType.LOAD_GAME
-        elif request_text in self.new_game_requests:
-            return RequestType.NEW_GAME
-        elif request_text in self.inventory_requests:
-            return RequestType.INVENTORY
-        elif request_text in self.game_story_requests:
-            return RequestType.GAME_STORY
-        elif request_text in self.help_requests:
-            return RequestType.HELP
-        elif request_text in self.use_requests:
-            return RequestType.USE
-        elif request_text in self.chew_requests:
-            return RequestType.CHEW
-        elif request_text in self.pull_requests:
-            return RequestType.PULL
-        elif request_text in self.objective_requests:
-            return RequestType.OBJECTIVES
-        elif request_text in self.alias_requests:
-            return RequestType.ALIAS
-        elif request_text in self.sit_requests:
-            return RequestType.SIT
-        elif request_text in self.scroll_requests:
-            return RequestType.SCROLL
-        elif request_text in self.clean_requests:
-            return RequestType.CLEAN
-        elif request_text in self.drink_requests:
-            return RequestType.DRINK
-        elif request_text in self.hints:
-            return RequestType.HINT
-        elif request_text in self.game_map:
-            return RequestType.GAME_MAP
-        elif request_text in self.climb_requests:
-            return RequestType.CLIMB
-        elif request_text in self.turn_on_requests:
-            return RequestType.TURN_ON
-        elif request_text in self.open_requests:
-            return RequestType.OPEN
-        elif request_text in self.play_requests:
-            return RequestType.PLAY
-        elif request_text in self.flush_requests:
-            return RequestType.FLUSH
-        elif request_text in self.draw_requests:
-            return RequestType.DRAW
-        else:
-            return RequestType.UNKNOWN
+        entry = self.vocabulary.get(request_text)
+        return RequestType.UNKNOWN if entry is None else entry.request_type
 
     def get_directional_alias(self: "LanguageManager", direction: str) -> str | None:
         """Get the directional name for given aliases."""
@@ -0,0 +1,74 @@
+"""Remembers the requests which recent commands were parsed into."""
+
+from collections import OrderedDict
+
+from common.game_request import GameRequest
+
+# The text of a command and whether it came from the player.
+ParseKey = tuple[str, bool]
+
+
+class ParseCache:
+    """Remembers the requests which recent commands were parsed into.
+
+    The least recently used command is forgotten once the cache is full. A
+    request whose targets were found where the player is, among the items
+    they carry or can see, is kept with the world epoch it was parsed in and
+    is out of date once the epoch changes. Requests found from the language
+    and room names alone are kept until they are the least recently used.
+    Copies of the requests are kept and returned, so that a request changed by
+    whatever handles it never changes the cache.
+    """
+
+    default_capacity = 256
+
+    def __init__(self: "ParseCache", capacity: int = default_capacity) -> None:
+        """Initialize an empty cache which holds up to the capacity of requests."""
+        self.capacity = capacity
+        # Each request, with the world epoch it depends on if it depends on one.
+        self.requests: OrderedDict[
+            ParseKey, tuple[GameRequest, int | None]
+        ] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self: "ParseCache", key: ParseKey, epoch: int) -> GameRequest | None:
+        """Return the request the command was parsed into, if it is up to date."""
+        entry = self.requests.get(key)
+        if entry is not None and entry[1] is not None and entry[1] != epoch:
+            del self.requests[key]
+            self.invalidations += 1
+            entry = None
+        if entry is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        self.requests.move_to_end(key)
+        return entry[0].copy()
+
+    def put(
+        self: "ParseCache", key: ParseKey, request: GameRequest, epoch: int | None
+    ) -> None:
+        """Remember the request, which depends on the epoch unless it is None."""
+        self.requests[key] = (request.copy(), epoch)
+        self.requests.move_to_end(key)
+        if len(self.requests) > self.capacity:
+            self.requests.popitem(last=False)
+
+    def clear(self: "ParseCache") -> None:
+        """Forget every request and reset the statistics."""
+        self.requests.clear()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def statistics(self: "ParseCache") -> str:
+        """Return a line describing how often parsed commands were reused."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups > 0 else 0
+        return (
+            f"Parse cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hits),"
+            f" {len(self.requests)} of {self.capacity} commands kept,"
+            f" {self.invalidations} out of date as the world changed."
+        )
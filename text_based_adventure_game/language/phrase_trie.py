@@ -0,0 +1,58 @@
+"""A word-by-word trie of every phrase the player could use as a target."""
+
+
+class PhraseTrie:
+    """A word-by-word trie of every phrase the player could use as a target."""
+
+    def __init__(self: "PhraseTrie") -> None:
+        """Initialize an empty phrase trie."""
+        self.children: dict[str, "PhraseTrie"] = dict()
+        self.is_phrase: bool = False
+
+    def add(self: "PhraseTrie", phrase: str) -> None:
+        """Add a phrase to the trie, one node per word."""
+        node = self
+        for word in phrase.lower().split(" "):
+            node = node.children.setdefault(word, PhraseTrie())
+        node.is_phrase = True
+
+    def add_all(self: "PhraseTrie", phrases: list[str]) -> None:
+        """Add every phrase in the list to the trie."""
+        for phrase in phrases:
+            self.add(phrase)
+
+    def __contains__(self: "PhraseTrie", phrase: str) -> bool:
+        """Return True if the whole phrase was added to the trie."""
+        node: PhraseTrie | None = self
+        for word in phrase.lower().split(" "):
+            node = node.children.get(word)
+            if node is None:
+                return False
+        return node.is_phrase
+
+    def match_lengths(self: "PhraseTrie", words: list[str], start: int) -> list[int]:
+        """Return the lengths of every phrase that begins at words[start].
+
+        Args:
+            words: The words entered by the player.
+            start: The index of the first word of the phrase.
+
+        Returns:
+            The number of words in each matching phrase, shortest first.
+        """
+        lengths: list[int] = []
+        node: PhraseTrie | None = self
+        for index in range(start, len(words)):
+            node = node.children.get(words[index].lower())
+            if node is None:
+                break
+            if node.is_phrase:
+                lengths.append(index - start + 1)
+        return lengths
+
+    @staticmethod
+    def from_phrases(phrases: list[str]) -> "PhraseTrie":
+        """Return a phrase trie that contains the given phrases."""
+        trie = PhraseTrie()
+        trie.add_all(phrases)
+        return trie
@@ -1,5 +1,7 @@
 """A class designed to handle the stories of the game."""
 
+from collections.abc import Mapping
+
 from game_repository.file_manager import FileManager
 
 
@@ -8,7 +10,7 @@ class StoryManager:
 
     def __init__(self: "StoryManager") -> None:
         """Initialize the story manager."""
-        self.stories: dict[str, list[str]] = dict()
+        self.stories: Mapping[str, list[str]] = dict()
 
     def load_stories(self: "StoryManager") -> None:
         """Load the game stories."""
@@ -0,0 +1,67 @@
+"""Writes game text to the terminal with a frame paced typewriter effect."""
+
+import sys
+import time
+from typing import Callable, TextIO
+
+
+class TerminalRenderer:
+    """Writes game text to the terminal with a frame paced typewriter effect."""
+
+    frames_per_second = 60
+
+    def __init__(
+        self: "TerminalRenderer",
+        stream: TextIO | None = None,
+        clock: Callable[[], float] = time.monotonic,
+        sleep: Callable[[float], None] = time.sleep,
+        typewriter: bool = True,
+    ) -> None:
+        """Initialize the renderer, writing to stdout unless given a stream."""
+        self._stream = stream
+        self.clock = clock
+        self.sleep = sleep
+        # When False, every line is written at once regardless of the delay.
+        self.typewriter = typewriter
+
+    @property
+    def stream(self: "TerminalRenderer") -> TextIO:
+        """Return the stream to write to, looking up stdout when it is needed."""
+        return sys.stdout if self._stream is None else self._stream
+
+    def write_block(self: "TerminalRenderer", text: str) -> None:
+        """Write the text and a new line in a single write."""
+        self.stream.write(f"{text}\n")
+        self.stream.flush()
+
+    def type_line(self: "TerminalRenderer", text: str, delay: float) -> None:
+        """Type the text at one character per delay seconds, then a new line.
+
+        Characters are written in chunks, at most once per frame, and each
+        chunk holds every character that is due according to the clock.
+
+        Args:
+            text: The text to type.
+            delay: The number of seconds between characters.
+
+        Returns:
+            None
+        """
+        if not self.typewriter or delay <= 0 or len(text) == 0:
+            self.write_block(text)
+            return
+        frame_length = 1 / TerminalRenderer.frames_per_second
+        start = self.clock()
+        written = 0
+        while True:
+            now = self.clock()
+            due = min(len(text), int((now - start) / delay) + 1)
+            if due == len(text):
+                self.write_block(text[written:])
+                return
+            if due > written:
+                self.stream.write(text[written:due])
+                self.stream.flush()
+                written = due
+            wake_at = max(start + written * delay, now + frame_length)
+            self.sleep(max(0, wake_at - self.clock()))
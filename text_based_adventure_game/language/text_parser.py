@@ -1,7 +1,6 @@
 """A text parser that converts human language into game instructions."""
 
-import textwrap
-import time
+from typing import TextIO
 
 from common.game_message import GameMessage
 from common.game_request import GameRequest
@@ -10,18 +9,38 @@ from common.message_type import MessageType
 from common.request_status import RequestStatus
 from common.request_type import RequestType
 from game_repository.game_repository import GameRepository
+from language.parse_cache import ParseCache
+from language.terminal_renderer import TerminalRenderer
+from language.wrap_cache import WrapCache
 from router.router import Router
 
 
 class TextParser:
     """A class that represents the text parser."""
 
+    # The requests whose target is a name chosen by the player, such as the
+    # name of a saved game, rather than something in the game.
+    named_requests = [RequestType.SAVE_GAME, RequestType.LOAD_GAME]
+
+    # The requests which depend on the player's answer to a question, and so
+    # are parsed again each time.
+    uncached_requests = [RequestType.LOAD_GAME, RequestType.LOAD_GAME_DENIED]
+
+    # The number of columns paragraphs are wrapped to, unless told otherwise.
+    default_width = 80
+
     def __init__(
         self: "TextParser", router: Router, repository: GameRepository
     ) -> None:
         """Initialize the text parser."""
         self.router = router
         self.repository = repository
+        self.renderer = TerminalRenderer()
+        # When set, input is read from this script instead of the keyboard.
+        self.script: TextIO | None = None
+        self.parse_cache = ParseCache()
+        self.width = TextParser.default_width
+        self.wrap_cache = WrapCache()
 
     def is_empty(self: "TextParser", text: list[str]) -> bool:
         """Return True if the text is empty.
@@ -52,7 +71,7 @@ class TextParser:
         elif request_type == RequestType.GAME_STORY:
             if from_user:
                 return RequestType.UNKNOWN
-        elif request_type == RequestType.OBJECTIVES:
+        elif request_type in [RequestType.OBJECTIVES, RequestType.PROFILE]:
             if not self.repository.environment.is_development:
                 return RequestType.UNKNOWN
         return request_type
@@ -60,6 +79,10 @@ class TextParser:
     def parse_text(self: "TextParser", text: str, from_user: bool) -> GameRequest:
         """Parse the given text and return the parsed text.
 
+        Players repeat the same commands often, so a command is parsed again
+        only if it was not parsed recently, or if its targets were found where
+        the player is and the world has changed since.
+
         Args:
             text: The user input text to be parsed into a game request.
             from_user: True if the text is from the user, False otherwise.
@@ -67,6 +90,20 @@ class TextParser:
         Returns:
             A GameRequest object with the action and target.
         """
+        key = (text, from_user)
+        epoch = self.repository.world_epoch
+        request = self.parse_cache.get(key, epoch)
+        if request is not None:
+            return request
+        world_lookups = self.repository.world_lookups
+        request = self.parse_new_text(text, from_user)
+        if request.action not in TextParser.uncached_requests:
+            depends_on_world = self.repository.world_lookups != world_lookups
+            self.parse_cache.put(key, request, epoch if depends_on_world else None)
+        return request
+
+    def parse_new_text(self: "TextParser", text: str, from_user: bool) -> GameRequest:
+        """Parse the given text without looking for it in the parse cache."""
         # split the text into an array of words without the common articles
         # and prepositions
         split_text = self.remove_unnecessary_words(text.split(" "))
@@ -107,6 +144,8 @@ class TextParser:
         target = ""
         if request_type == RequestType.UNKNOWN:
             request_type = self.get_request_type(words[0], from_user)
+            if request_type in TextParser.named_requests:
+                return GameRequest(request_type, [words[1]])
             target = self.find_valid_target(words[1:], from_user)
             if request_type == RequestType.ALIAS and target == "":
                 target = words[1]
@@ -126,6 +165,8 @@ class TextParser:
         targets = self.find_all_valid_targets(words[2:], from_user)
         if request_type == RequestType.UNKNOWN:
             request_type = self.get_request_type(words[0], from_user)
+            if request_type in TextParser.named_requests:
+                return GameRequest(request_type, [" ".join(words[1:])])
             targets = self.find_all_valid_targets(words[1:], from_user)
             if request_type == RequestType.ALIAS and len(targets) == 0:
                 targets = [" ".join(words[1:])]
@@ -138,29 +179,45 @@ class TextParser:
     def find_all_valid_targets(
         self: "TextParser", words: list[str], from_user: bool
     ) -> list[str | None]:
-        """Return a list of all the valid targets present in the given list of words."""
-        word_count = len(words)
-        min_word = 0
-        max_word = word_count
-        targets = []
-        while word_count > 0:
-            target = self.find_valid_target(words[min_word:max_word], from_user)
-            if target != "":
-                targets.append(target)
-                words = words[:min_word] + words[max_word:]
-                word_count = len(words)
-                min_word = 0
-                max_word = word_count
-                continue
-            if max_word == len(words):
-                min_word = 0
-                max_word = word_count - 1
-                word_count = max_word
-            else:
-                min_word += 1
-                max_word += 1
+        """Return a list of all the valid targets present in the given list of words.
+
+        The longest valid phrase is taken first (the leftmost one when there is a
+        tie) and removed from the words before looking for the next target.
+        """
+        if not from_user:
+            target = self.find_valid_target(words, from_user)
+            return [] if target == "" else [target]
+
+        targets: list[str | None] = []
+        match = self.find_longest_target(words)
+        while match is not None:
+            start, end, target = match
+            targets.append(target)
+            words = words[:start] + words[end:]
+            match = self.find_longest_target(words)
         return targets
 
+    def find_longest_target(
+        self: "TextParser", words: list[str]
+    ) -> tuple[int, int, str] | None:
+        """Return the start, end and name of the longest valid target in the words.
+
+        Only the phrases known to the repository are checked, so the number of
+        target lookups depends on the matches rather than every word window.
+        """
+        target_phrases = self.repository.target_phrases
+        candidates = [
+            (length, start)
+            for start in range(len(words))
+            for length in target_phrases.match_lengths(words, start)
+        ]
+        candidates.sort(key=lambda candidate: (-candidate[0], candidate[1]))
+        for length, start in candidates:
+            target = self.find_valid_target(words[start : start + length], True)
+            if target != "":
+                return (start, start + length, target)
+        return None
+
     def remove_unnecessary_words(self: "TextParser", words: list[str]) -> list[str]:
         """Return the given list of words without articles.
 
@@ -171,7 +228,7 @@ class TextParser:
             The given list of words without articles.
         """
         words_to_remove = self.repository.language.unnecessary_words
-        return list(filter(lambda word: word.lower() not in words_to_remove, words))
+        return [word for word in words if word.lower() not in words_to_remove]
 
     def find_valid_target(self: "TextParser", words: list[str], from_user: bool) -> str:
         """Check the list of words for a valid target.
@@ -198,7 +255,7 @@ class TextParser:
             GameMessage.single_line("What would you like to do?"),
         ]
         self.print_list_of_messages(messages, False)
-        user_input = input("    ")
+        user_input = self.read_input()
         request = self.parse_text(user_input.strip(), True)
         if request.action == RequestType.UNKNOWN and request.targets == [""]:
             return
@@ -208,6 +265,12 @@ class TextParser:
         response = self.router.route(request)
         self.print_response(response, True)
 
+    def read_input(self: "TextParser") -> str:
+        """Read a line from the player, or the next line of the script if there is one."""
+        if self.script is None:
+            return input("    ")
+        return self.script.readline().rstrip("\n")
+
     def scroll_print(self: "TextParser", text: str) -> None:
         """Print the text to the console as if it's being typed.
 
@@ -217,11 +280,10 @@ class TextParser:
         Returns:
             None
         """
-        for character in text:
-            print(character, end="", flush=True)
-            if not self.repository.environment.is_development:
-                time.sleep(self.repository.scroll_delay)
-        print()
+        if self.repository.environment.is_development:
+            self.renderer.write_block(text)
+        else:
+            self.renderer.type_line(text, self.repository.scroll_delay)
 
     def print_response(
         self: "TextParser", game_response: GameResponse, add_spaces: bool
@@ -248,17 +310,15 @@ class TextParser:
     ) -> None:
         """Print a GameResponse message that is only a string."""
         if message.should_print_blank_line():
-            print()
-        elif message.should_wrap():
-            wrapped_message = textwrap.wrap(str(message), width=80)
-            for line in wrapped_message:
+            self.renderer.write_block("")
+        elif message.should_wrap(self.width):
+            for line in self.wrap_cache.wrap(str(message), self.width):
                 self.scroll_print_with_spaces(line, add_spaces)
         elif message.message_type == MessageType.ART:
-            old_delay = self.repository.scroll_delay
-            self.repository.scroll_delay = GameRepository.art_scroll_delay
-            for line in message.contents:
-                self.scroll_print_with_spaces(line, add_spaces)
-            self.repository.scroll_delay = old_delay
+            indent = "    " if add_spaces else ""
+            self.renderer.write_block(
+                "\n".join(f"{indent}{line}" for line in message.contents)
+            )
         else:
             self.scroll_print_with_spaces(str(message), add_spaces)
 
@@ -301,7 +361,7 @@ class TextParser:
             GameMessage.single_line("Are you sure you want to load a saved game?"),
         ]
         self.print_list_of_messages(messages, False)
-        user_input = input("    ")
+        user_input = self.read_input()
         return self.repository.language.is_confirmed(user_input.lower())
 
     def handle_load_game_denied(self: "TextParser") -> GameResponse:
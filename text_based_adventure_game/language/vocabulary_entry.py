@@ -0,0 +1,22 @@
+"""Represents everything a single phrase can mean in the game language."""
+
+from common.request_type import RequestType
+
+
+class VocabularyEntry:
+    """Represents everything a single phrase can mean in the game language."""
+
+    def __init__(
+        self: "VocabularyEntry",
+        request_type: RequestType = RequestType.UNKNOWN,
+        command_target: str | None = None,
+        aliases: list[str] | None = None,
+    ) -> None:
+        """Initialize the vocabulary entry."""
+        self.request_type = request_type
+        self.command_target = command_target
+        self.aliases: list[str] = [] if aliases is None else aliases
+
+    def __repr__(self: "VocabularyEntry") -> str:
+        """Return the string representation of the vocabulary entry."""
+        return f"{self.request_type}, {self.command_target}, {self.aliases}"
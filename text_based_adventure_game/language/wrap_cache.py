@@ -0,0 +1,56 @@
+"""Remembers how recently printed paragraphs were wrapped."""
+
+import textwrap
+from collections import OrderedDict
+
+# The text of a paragraph and the width it was wrapped to.
+WrapKey = tuple[str, int]
+
+
+class WrapCache:
+    """Remembers how recently printed paragraphs were wrapped.
+
+    The same room and item descriptions are printed again and again, so each
+    is wrapped once for each width it is printed at. The least recently used
+    paragraph is forgotten once the cache is full. The lines are kept as a
+    tuple, so that whoever prints them cannot change the cache.
+    """
+
+    default_capacity = 1024
+
+    def __init__(self: "WrapCache", capacity: int = default_capacity) -> None:
+        """Initialize an empty cache which holds up to the capacity of paragraphs."""
+        self.capacity = capacity
+        self.paragraphs: OrderedDict[WrapKey, tuple[str, ...]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def wrap(self: "WrapCache", text: str, width: int) -> tuple[str, ...]:
+        """Return the lines of the text wrapped to the width."""
+        key = (text, width)
+        lines = self.paragraphs.get(key)
+        if lines is not None:
+            self.hits += 1
+            self.paragraphs.move_to_end(key)
+            return lines
+        self.misses += 1
+        lines = tuple(textwrap.wrap(text, width=width))
+        self.paragraphs[key] = lines
+        if len(self.paragraphs) > self.capacity:
+            self.paragraphs.popitem(last=False)
+        return lines
+
+    def clear(self: "WrapCache") -> None:
+        """Forget every paragraph and reset the statistics."""
+        self.paragraphs.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def statistics(self: "WrapCache") -> str:
+        """Return a line describing how often wrapped paragraphs were reused."""
+        lookups = self.hits + self.misses
+        rate = self.hits / lookups * 100 if lookups > 0 else 0
+        return (
+            f"Wrap cache: {self.hits} hits, {self.misses} misses ({rate:.0f}% hits),"
+            f" {len(self.paragraphs)} of {self.capacity} paragraphs kept."
+        )
@@ -5,6 +5,8 @@ from typing import Any
 from common.controller_type import ControllerType
 from common.game_request import GameRequest
 from common.game_response import GameResponse
+from common.request_handler import Handler
+from common.request_type import RequestType
 from controllers.game_controller import GameController
 from controllers.interaction_controller import InteractionController
 from controllers.inventory_controller import InventoryController
@@ -12,24 +14,43 @@ from controllers.movement_controller import MovementController
 
 
 class Router:
-    """A class that represents the router."""
+    """A class that represents the router.
+
+    Requests are dispatched through a single table from each request type to
+    the service method which handles it, built once from the handlers of every
+    controller. A request type can only be registered once, so two controllers
+    which claim the same type are found when the game starts.
+    """
 
     def __init__(self: "Router", controllers: dict[ControllerType, Any]) -> None:
-        """Initialize the router."""
+        """Initialize the router and its dispatch table."""
         self.controllers = controllers
+        self.handlers: dict[RequestType, Handler] = dict()
+        self.register_controllers()
+
+    def register_controllers(self: "Router") -> None:
+        """Build the dispatch table from the handlers of every controller.
+
+        Call this again after the services are replaced or instrumented, since
+        the table holds their methods rather than looking them up each time.
+        """
+        self.handlers = dict()
+        for controller in self.controllers.values():
+            for request_type, handler in controller.handlers().items():
+                self.register(request_type, handler)
+
+    def register(self: "Router", request_type: RequestType, handler: Handler) -> None:
+        """Handle a type of request with the handler, which must be the only one."""
+        if request_type in self.handlers:
+            raise ValueError(f"{request_type.name} requests already have a handler.")
+        self.handlers[request_type] = handler
 
     def route(self: "Router", request: GameRequest) -> GameResponse:
         """Route the given game request and return the game response."""
-        if request.action in self.movement_controller.request_types:
-            return self.movement_controller.route(request)
-        elif request.action in self.game_controller.request_types:
-            return self.game_controller.route(request)
-        elif request.action in self.inventory_controller.request_types:
-            return self.inventory_controller.route(request)
-        elif request.action in self.interaction_controller.request_types:
-            return self.interaction_controller.route(request)
-        else:
+        handler = self.handlers.get(request.action)
+        if handler is None:
             return self.dont_know_how_to_do_that_message
+        return handler(request)
 
     @property
     def game_controller(self: "Router") -> GameController:
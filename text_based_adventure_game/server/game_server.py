@@ -0,0 +1,146 @@
+"""A line based TCP server which hosts a separate game for every connection.
+
+Run from the project directory with:
+    python -m server.game_server --port 7777
+
+Each line sent by a client is a command, and each reply is a single line of
+JSON in the same format as the headless script mode.
+"""
+
+import argparse
+import asyncio
+import io
+import json
+import sys
+
+from common.game_request import GameRequest
+from common.game_response import GameResponse
+from common.request_type import RequestType
+from ForkOff import AdventureGame
+from game_repository.game_content import GameContent
+from language.terminal_renderer import TerminalRenderer
+
+
+class DiscardedOutput(io.TextIOBase):
+    """A text stream which throws away everything written to it."""
+
+    def write(self: "DiscardedOutput", text: str) -> int:
+        """Discard the text."""
+        return len(text)
+
+
+class GameSession:
+    """A single player's game, with state that is not shared with anyone else."""
+
+    unsupported_requests = [
+        RequestType.SAVE_GAME,
+        RequestType.LOAD_GAME,
+        RequestType.LOAD_GAME_DENIED,
+        RequestType.LIST_SAVES,
+    ]
+
+    def __init__(self: "GameSession", content: GameContent) -> None:
+        """Start a new game using the shared content."""
+        self.content = content
+        self.game = AdventureGame().initialize_game_with_repository(
+            content.new_repository()
+        )
+        # Sessions never prompt, so confirmations read an empty script and the
+        # prompts themselves are discarded.
+        self.game.text_parser.script = io.StringIO()
+        self.game.text_parser.renderer = TerminalRenderer(
+            DiscardedOutput(), typewriter=False
+        )
+
+    @property
+    def active(self: "GameSession") -> bool:
+        """Return True until the player exits the game."""
+        return self.game.game_repository.game_active
+
+    def start(self: "GameSession") -> GameResponse:
+        """Return the description of the room the player starts in."""
+        return self.game.router.route(GameRequest(RequestType.LOOK, [None]))
+
+    def handle_command(self: "GameSession", command: str) -> GameResponse:
+        """Run a single command from the player and return the response."""
+        request = self.game.text_parser.parse_text(command, True)
+        if request.action in GameSession.unsupported_requests:
+            return self.unsupported_request_response
+        response = self.game.router.route(request)
+        self.game.check_for_game_over()
+        return response
+
+    @property
+    def unsupported_request_response(self: "GameSession") -> GameResponse:
+        """The response for requests which are not available on the server."""
+        return GameResponse.failure("Saving and loading aren't available online.")
+
+
+class GameServer:
+    """Accept connections and give each of them a game session."""
+
+    def __init__(self: "GameServer", content: GameContent) -> None:
+        """Initialize the server with the content shared by every session."""
+        self.content = content
+        self.session_count = 0
+
+    async def handle_connection(
+        self: "GameServer", reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        """Play a game with one client until it exits or disconnects."""
+        session = GameSession(self.content)
+        self.session_count += 1
+        try:
+            self.write_response(writer, session.start())
+            while session.active:
+                line = await reader.readline()
+                if line == b"":
+                    break
+                command = line.decode("utf-8", errors="replace").strip()
+                self.write_response(writer, session.handle_command(command))
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self.session_count -= 1
+            writer.close()
+
+    def write_response(
+        self: "GameServer", writer: asyncio.StreamWriter, response: GameResponse
+    ) -> None:
+        """Write the response as a single line of JSON."""
+        writer.write(json.dumps(response.dictionary()).encode("utf-8") + b"\n")
+
+    async def start(
+        self: "GameServer", host: str, port: int, backlog: int = 4096
+    ) -> asyncio.Server:
+        """Start listening for connections."""
+        return await asyncio.start_server(
+            self.handle_connection, host, port, backlog=backlog
+        )
+
+
+async def serve(content: GameContent, host: str, port: int) -> None:
+    """Serve games until the process is stopped."""
+    server = await GameServer(content).start(host, port)
+    print(f"Serving games on {host}:{port}", file=sys.stderr)
+    async with server:
+        await server.serve_forever()
+
+
+def main() -> None:
+    """Load the content once and serve games."""
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--host", default="127.0.0.1", help="The address to bind.")
+    parser.add_argument("--port", default=7777, type=int, help="The port to bind.")
+    arguments = parser.parse_args()
+    content = GameContent()
+    error = content.load()
+    if error is not None:
+        print(error.message, file=sys.stderr)
+        sys.exit(1)
+    asyncio.run(serve(content, arguments.host, arguments.port))
+
+
+if __name__ == "__main__":
+    main()
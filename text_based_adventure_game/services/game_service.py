@@ -1,17 +1,24 @@
 """The service that handles game events."""
 
-from typing import Tuple
+import time
+from typing import Any, Tuple
 
 from common.game_message import GameMessage
 from common.game_request import GameRequest
 from common.game_response import GameResponse
+from common.load_error import FileOperationError
 from common.request_status import RequestStatus
 from game_repository.game_repository import GameRepository
+from game_repository.save_slots import SaveSlots
 
 
 class GameService:
     """The service that handles game events."""
 
+    bad_slot_message = (
+        "Saved games can only be named with letters, numbers, dashes and underscores."
+    )
+
     def __init__(self: "GameService", game_repository: GameRepository) -> None:
         """Initialize the game service."""
         self.repository = game_repository
@@ -38,19 +45,58 @@ class GameService:
             messages.append(GameMessage.paragraph(story))
         return GameResponse(messages, status)
 
-    def save_game(self: "GameService", _: GameRequest) -> GameResponse:
-        """Save the game."""
+    def save_game(self: "GameService", request: GameRequest) -> GameResponse:
+        """Save the game, in the slot named by the request if it names one."""
+        name = request.targets[0] if len(request.targets) > 0 else None
+        slot = SaveSlots.slot_name(name) if name else None
+        if name and slot is None:
+            return GameResponse.failure(GameService.bad_slot_message)
         try:
-            self.repository.save_game_state()
+            result = self.repository.save_game_state(slot)
+            if isinstance(result, FileOperationError):
+                return GameResponse.failure(result.message)
+            if slot is not None:
+                return GameResponse.success(f"Your game was saved as {slot}.")
             return GameResponse.success("Your game was saved successfully.")
         except Exception as e:
             return GameResponse.failure(
                 f"An error occurred while saving your game: {e}"
             )
 
-    def load_game(self: "GameService", _: GameRequest, new: bool) -> GameResponse:
-        """Load the game."""
-        return self.repository.try_load_game_state(new=new)
+    def load_game(self: "GameService", request: GameRequest, new: bool) -> GameResponse:
+        """Load the game, from the slot named by the request if it names one."""
+        name = request.targets[0] if len(request.targets) > 0 else None
+        slot = SaveSlots.slot_name(name) if name and not new else None
+        if name and not new and slot is None:
+            return GameResponse.failure(GameService.bad_slot_message)
+        return self.repository.try_load_game_state(new=new, slot=slot)
+
+    def list_saves(self: "GameService", _: GameRequest) -> GameResponse:
+        """List the saved games, most recently saved first, once saves are written."""
+        error = self.repository.finish_saving()
+        if isinstance(error, FileOperationError):
+            return GameResponse.failure(error.message)
+        saves = self.repository.storage.list_slots()
+        if len(saves) == 0:
+            return GameResponse.failure("You have no saved games.")
+        descriptions = [GameService.describe_save(save) for save in saves]
+        return GameResponse.success_with_header_and_strings(
+            "Saved Games:", descriptions
+        )
+
+    @staticmethod
+    def describe_save(save: dict[str, Any]) -> str:
+        """Return a line describing a saved game from its metadata."""
+        saved_at = time.strftime(
+            "%Y-%m-%d %H:%M", time.localtime(save.get("saved_at", 0))
+        )
+        description = f"{save['slot']} - saved {saved_at}"
+        if "player" in save:
+            description += (
+                f", {save['player']} in {save['location']} with"
+                f" {save['objectives_done']} of {save['objectives']} objectives done"
+            )
+        return f"{description}."
 
     def provide_help(self: "GameService", _: GameRequest) -> GameResponse:
         """Provide help contents."""
@@ -68,6 +114,20 @@ class GameService:
             )
         return GameResponse.success_with_header_and_strings(header, messages)
 
+    def profile(self: "GameService", _: GameRequest) -> GameResponse:
+        """Summarize where the time of each turn went, if the game is profiled."""
+        profiler = self.repository.profiler
+        if profiler is None:
+            return GameResponse.failure(
+                "The game is not being profiled. Start it with --profile."
+            )
+        lines = profiler.summary()
+        if len(lines) == 0:
+            return GameResponse.failure("Nothing has been timed yet.")
+        return GameResponse.success_with_header_and_strings(
+            "Where the time went:", lines
+        )
+
     def give_aliases(self: "GameService", request: GameRequest) -> GameResponse:
         """Get aliases for specified target."""
         if len(request.targets) == 0:
@@ -1,11 +1,9 @@
 """The service that handles item and player interactions."""
 
-from typing import Any
-
 from common.game_message import GameMessage
 from common.game_request import GameRequest
 from common.game_response import GameResponse
-from common.item import Item
+from common.item import InteractionLinks, Item
 from game_repository.game_repository import GameRepository
 
 
@@ -109,17 +107,13 @@ class InteractionService:
         self: "InteractionService", item: Item, action: str
     ) -> None:
         """Transform an existing item into another one after use."""
-        transformations = self.get_transformations(item, action)
-        for transformation in transformations:
-            self.transform_item(transformation["from"], transformation["to"])
+        for from_item, to_item in self.get_links(item, action).transforms:
+            self.transform_item(from_item, to_item)
 
     def transform_item(
-        self: "InteractionService", from_item_name: str | None, to_item_name: str | None
+        self: "InteractionService", from_item: Item | None, to_item: Item | None
     ) -> None:
         """Transform an item into another item."""
-        from_item = self.repository.items.get_item_by_name(from_item_name)
-        to_item = self.repository.items.get_item_by_name(to_item_name)
-
         # if both are None, then nothing happens.
         if from_item is None and to_item is None:
             return
@@ -128,7 +122,7 @@ class InteractionService:
         elif from_item is None and to_item is not None:
             self.repository.player.inventory.append(to_item)
             to_item.discovered = True
-            self.repository.state_dirty = True
+            self.repository.mark_items_moved([to_item])
 
         # if to_item is None, then the item is removed from the player's
         # inventory or the room.
@@ -137,7 +131,7 @@ class InteractionService:
                 self.repository.player.inventory.remove(from_item)
             elif from_item in self.repository.current_location.inventory:
                 self.repository.current_location.inventory.remove(from_item)
-            self.repository.state_dirty = True
+            self.repository.mark_items_moved([from_item])
 
         # if both are not None, then the item is transformed into another item.
         elif from_item is not None and to_item is not None:
@@ -147,32 +141,20 @@ class InteractionService:
                 self.repository.current_location.inventory.remove(from_item)
             self.repository.player.inventory.append(to_item)
             to_item.discovered = True
-            self.repository.state_dirty = True
+            self.repository.mark_items_moved([from_item, to_item])
 
-    def get_transformations(
+    def get_links(
         self: "InteractionService", item: Item, action: str
-    ) -> list[dict[str, str]]:
-        """Return the transformations that occur after using the item."""
-        use_interaction = item.interactions.get(action)
-        if use_interaction is None:
-            return []
-        transformations = use_interaction.get("transforms")
-        return [] if transformations is None else transformations
+    ) -> InteractionLinks:
+        """Return the items named by an interaction, as linked when the game loaded."""
+        links = item.links.get(action)
+        return InteractionLinks() if links is None else links
 
     def get_interaction_requirements(
         self: "InteractionService", item: Item, action: str
     ) -> list[Item | None]:
         """Return the requirements for the given item."""
-        interaction = item.interactions.get(action)
-        if interaction is None:
-            return []
-        requirements = interaction.get("requires")
-        if requirements is None:
-            return []
-        return [
-            self.repository.items.get_item_by_name(item_name)
-            for item_name in requirements
-        ]
+        return list(self.get_links(item, action).requires)
 
     def is_discovered(self: "InteractionService", item: Item | None) -> bool:
         """Return true if the item has been discovered."""
@@ -281,43 +263,21 @@ class InteractionService:
 
     def discover_items(self: "InteractionService", item: Item, action: str) -> None:
         """Discover an item after an interaction."""
-        interaction = item.interactions.get(action)
-        if interaction is None:
-            return
-        discovers = interaction.get("discovers")
-        if discovers is None:
-            return
-        for item_name in discovers:
-            possible_item = self.repository.items.get_item_by_name(item_name)
-            if possible_item is not None:
-                possible_item.discovered = True
+        for possible_item in self.get_links(item, action).discovers:
+            possible_item.discovered = True
+            self.repository.mark_items_changed([possible_item])
 
     def unhide_items(self: "InteractionService", item: Item, action: str) -> None:
         """Unhide an item after it has been interacted with."""
-        # figure out if the interaction defines unhides
-        interaction = item.interactions.get(action)
-        if interaction is None:
-            return
-        unhides = interaction.get("unhides")
-        if unhides is None:
-            return
-        for item_name in unhides:
-            possible_item = self.repository.items.get_item_by_name(item_name)
-            if possible_item is not None:
-                possible_item.hidden = False
+        for possible_item in self.get_links(item, action).unhides:
+            possible_item.hidden = False
+            self.repository.mark_items_changed([possible_item])
 
     def unlock_items(self: "InteractionService", item: Item, action: str) -> None:
         """Unlock an item after it has been interacted with."""
-        interaction = item.interactions.get(action)
-        if interaction is None:
-            return
-        unlocks = interaction.get("unlocks")
-        if unlocks is None:
-            return
-        for item_name in unlocks:
-            possible_item = self.repository.items.get_item_by_name(item_name)
-            if possible_item is not None:
-                possible_item.locked = False
+        for possible_item in self.get_links(item, action).unlocks:
+            possible_item.locked = False
+            self.repository.mark_items_changed([possible_item])
 
     def update_interaction_objectives(
         self: "InteractionService", item: Item, action: str
@@ -326,6 +286,7 @@ class InteractionService:
         objectives = self.repository.objectives.find_related_objectives(item, action)
         for objective in objectives:
             objective.complete_interaction_objective(item.name, action)
+            self.repository.mark_objective_changed(objective)
 
     def interact_multiple_items(
         self: "InteractionService", items: list[Item], action: str
@@ -360,6 +321,7 @@ class InteractionService:
         new_description = interaction.get("new_description")
         if new_description is not None:
             item.description = new_description
+            self.repository.mark_items_changed([item])
 
     def get_interaction_message_response(
         self: "InteractionService", item: Item, action: str
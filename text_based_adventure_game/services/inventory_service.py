@@ -121,7 +121,7 @@ class InventoryService:
         room.inventory.remove(item)
         player.inventory.append(item)
         item.discovered = True
-        self.repository.state_dirty = True
+        self.repository.mark_items_moved([item])
 
     def remove_item_from_player_and_add_to_room(
         self: "InventoryService", player: Player, room: Room, item: Item
@@ -129,7 +129,7 @@ class InventoryService:
         """Remove an item from the player's inventory and add it to the room."""
         player.inventory.remove(item)
         room.inventory.append(item)
-        self.repository.state_dirty = True
+        self.repository.mark_items_moved([item])
 
     def handle_pickup_validation(
         self: "InventoryService", player: Player, room: Room, item: Item
@@ -1,7 +1,6 @@
 """The service which handles movement in the game."""
 
 from common.game_message import GameMessage
-from common.game_objective import GameObjective
 from common.game_request import GameRequest
 from common.game_response import GameResponse
 from common.request_status import RequestStatus
@@ -86,33 +85,18 @@ class MovementService:
 
     def is_blocked(self: "MovementService", room: Room) -> bool:
         """Determine if the room is blocked."""
-        blockers = room.blockers
-        if len(blockers) == 0:
-            return False
-        objectives: list[GameObjective] = []
-        for blocker in blockers:
-            objective = self.repository.objectives.get_objective_by_name(
-                blocker["name"]
-            )
-            if objective is not None:
-                objectives.append(objective)
         return not all(
-            objective.is_complete(self.repository.player) for objective in objectives
+            objective.is_complete(self.repository.player)
+            for objective, _ in room.blocking_objectives
         )
 
     def get_blocked_message(self: "MovementService", room: Room) -> str:
         """Get the message to display when the room is blocked."""
-        blockers = room.blockers
-        if len(blockers) == 0:
+        if len(room.blockers) == 0:
             return ""
-        for blocker in blockers:
-            objective = self.repository.objectives.get_objective_by_name(
-                blocker["name"]
-            )
-            if objective is not None and not objective.is_complete(
-                self.repository.player
-            ):
-                return blocker["message"]
+        for objective, message in room.blocking_objectives:
+            if not objective.is_complete(self.repository.player):
+                return message
         return "Tell the developer that they messed up..."
 
     def can_move(self: "MovementService", room_name: str | None) -> bool:
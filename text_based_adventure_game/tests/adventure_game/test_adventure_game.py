@@ -1,26 +1,37 @@
+import argparse
 import builtins
+import io
+import json
+import sys
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from common.controller_type import ControllerType
+from common.environment import Environment
+from common.game_request import GameRequest
 from common.game_response import GameResponse
+from common.load_error import FileOperationError
 from common.player import Player
+from common.profiler import Profiler
 from common.request_status import RequestStatus
+from common.request_type import RequestType
 from common.service_type import ServiceType
 from controllers.game_controller import GameController
 from controllers.inventory_controller import InventoryController
 from controllers.movement_controller import MovementController
 from ForkOff import AdventureGame
-from game_repository.file_manager import FileManager
 from game_repository.game_repository import GameRepository
+from game_repository.memory_save_storage import MemorySaveStorage
 from game_repository.objectives_manager import ObjectiveManager
+from game_repository.save_storage import SaveStorage
 from language.language_manager import LanguageManager
 from language.text_parser import TextParser
 from router.router import Router
 from services.game_service import GameService
 from services.inventory_service import InventoryService
 from services.movement_service import MovementService
+from tests.test_helpers import any_message_contents
 
 
 def get_mock_services():
@@ -36,6 +47,7 @@ def get_mock_repo():
     mock_repo.game_active = False
     mock_repo.state_dirty = False
     mock_repo.game_won = False
+    mock_repo.environment = Environment(False)
     return mock_repo
 
 
@@ -143,10 +155,14 @@ def test_it_should_handle_load_requests():
                 name="handle_game_input", return_value=response
             )
             game.user_confirmed = MagicMock(name="user_confirmed", return_value=True)
-            FileManager.has_saved_game = MagicMock(return_value=True)
+            game.game_repository = MagicMock(GameRepository)
+            game.game_repository.storage = MagicMock(SaveStorage)
+            game.game_repository.storage.has_any_saved_game.return_value = True
+            game.game_repository.storage.most_recent_slot.return_value = "castle"
             game.try_handle_load_request()
+            game.game_repository.finish_saving.assert_called_once()
             game.text_parser.handle_game_input.assert_called_once_with(
-                "loadgame", False
+                "loadgame castle", False
             )
             game.user_confirmed.assert_called_once_with("y")
 
@@ -155,8 +171,9 @@ def test_it_should_handle_new_game_requests():
     """Test to see if the adventure game can handle load requests."""
     with patch.object(AdventureGame, "initialize_game", return_value=None):
         with patch.object(builtins, "input", return_value="n") as mock_input:
-            FileManager.has_saved_game = MagicMock(return_value=False)
             game = AdventureGame()
+            game.game_repository = MagicMock(GameRepository)
+            game.game_repository.storage = MemorySaveStorage()
             game.text_parser = MagicMock(TextParser)
             response = GameResponse.success("new game")
             game.text_parser.handle_game_input = MagicMock(
@@ -285,6 +302,7 @@ def test_it_should_exit_the_game():
     with patch.object(AdventureGame, "initialize_game", return_value=None):
         game = AdventureGame()
         game.game_repository = MagicMock(GameRepository)
+        game.game_repository.environment = Environment(False)
         game.game_repository.game_won = False
         game.print_exit_message = MagicMock(
             name="print_exit_message", return_value=None
@@ -294,11 +312,31 @@ def test_it_should_exit_the_game():
         game.print_exit_message.assert_called_once()
 
 
+def test_it_should_report_a_failed_save_when_exiting():
+    """Test to make sure a save that failed in the background is reported on exit."""
+    with patch.object(AdventureGame, "initialize_game", return_value=None):
+        game = AdventureGame()
+        game.game_repository = MagicMock(GameRepository)
+        game.game_repository.environment = Environment(False)
+        error = FileOperationError("a message")
+        game.game_repository.finish_saving = MagicMock(return_value=error)
+        game.text_parser = MagicMock(TextParser)
+        game.print_exit_message = MagicMock(
+            name="print_exit_message", return_value=None
+        )
+        with pytest.raises(SystemExit):
+            game.exit_game()
+        messages = game.text_parser.print_list_of_messages.call_args.args[0]
+        assert any_message_contents(messages, "a message")
+        game.print_exit_message.assert_called_once()
+
+
 def test_it_should_exit_the_game_and_not_print_ending_when_won():
     """Test to make sure it exits the game when called."""
     with patch.object(AdventureGame, "initialize_game", return_value=None):
         game = AdventureGame()
         game.game_repository = MagicMock(GameRepository)
+        game.game_repository.environment = Environment(False)
         game.game_repository.player = MagicMock(Player)
         game.game_repository.player.won = True
         game.text_parser = MagicMock(TextParser)
@@ -322,9 +360,8 @@ def test_it_should_handle_new_game_when_player_wants_new_but_has_saved_game():
             game.game_repository = MagicMock(GameRepository)
             game.game_repository.language = MagicMock(LanguageManager)
             game.game_repository.language.yes_words = ["y"]
-            FileManager.has_saved_game = MagicMock(
-                name="has_saved_game", return_value=True
-            )
+            game.game_repository.storage = MemorySaveStorage()
+            game.game_repository.storage.save_game({}, "game")
             status = game.try_handle_load_request()
             assert status == RequestStatus.SUCCESS
 
@@ -370,3 +407,106 @@ def test_it_should_roll_end_credits():
         game.roll_end_credits()
         game.print_ending.assert_called_once()
         assert game.game_repository.player.watched_end_credits == True
+
+
+def get_script_game() -> AdventureGame:
+    """Return a game with mock parts for running scripts."""
+    with patch.object(AdventureGame, "initialize_game", return_value=None):
+        game = AdventureGame()
+    game.game_repository = get_mock_repo()
+    game.game_repository.game_active = True
+    game.game_repository.player = MagicMock(Player)
+    game.game_repository.objectives = MagicMock(ObjectiveManager)
+    game.game_repository.objectives.all_objectives_complete.return_value = False
+    game.text_parser = get_mock_parser()
+    game.text_parser.parse_text.return_value = GameRequest(RequestType.LOOK, [None])
+    game.router = MagicMock(Router)
+    game.router.route.return_value = GameResponse.success("looked")
+    return game
+
+
+def test_it_should_write_a_json_line_for_each_scripted_command():
+    """Test to make sure a script is run without printing through the parser."""
+    game = get_script_game()
+    output = io.StringIO()
+    count = game.run_script(io.StringIO("look\n\nlook\n"), output)
+    assert count == 2
+    lines = output.getvalue().splitlines()
+    assert [json.loads(line) for line in lines] == [
+        {"messages": ["", "looked"], "status": "SUCCESS"},
+        {"messages": ["", "looked"], "status": "SUCCESS"},
+    ]
+    game.text_parser.parse_text.assert_any_call("newgame", False)
+    game.text_parser.print_response.assert_not_called()
+
+
+def test_it_should_profile_the_game_and_export_a_trace(tmp_path):
+    """Test to make sure a profiled game times each part and exports the spans."""
+    game = AdventureGame().initialize_game(True, MemorySaveStorage())
+    profiler = Profiler()
+    profiler.trace_file = str(tmp_path / "trace.json")
+    game.attach_profiler(profiler)
+    try:
+        game.run_script(io.StringIO("look\nprofile\n"), io.StringIO())
+    finally:
+        profiler.remove_instruments()
+    names = {span[0] for span in profiler.spans}
+    assert {"TextParser.parse_text", "Router.route", "MovementService.look"} <= names
+    assert "FileManager.get_items_file" in names or (
+        "FileManager.get_content_bundle" in names
+    )
+    assert profiler.turn == 2
+    trace = json.loads((tmp_path / "trace.json").read_text())
+    assert len(trace["traceEvents"]) == len(profiler.spans)
+
+
+def test_it_should_stop_the_script_when_the_game_exits():
+    """Test to make sure commands after exit are not run."""
+    game = get_script_game()
+
+    def route(request: GameRequest) -> GameResponse:
+        if request.action == RequestType.EXIT:
+            game.game_repository.game_active = False
+        return GameResponse([], RequestStatus.SUCCESS)
+
+    game.text_parser.parse_text.side_effect = [
+        GameRequest(RequestType.NEW_GAME, []),
+        GameRequest(RequestType.EXIT, []),
+        GameRequest(RequestType.LOOK, [None]),
+    ]
+    game.router.route.side_effect = route
+    output = io.StringIO()
+    assert game.run_script(io.StringIO("exit\nlook\n"), output) == 1
+
+
+def test_it_should_respond_to_denied_scripted_loads():
+    """Test to make sure a denied load is answered without routing."""
+    game = get_script_game()
+    game.text_parser.parse_text.return_value = GameRequest(
+        RequestType.LOAD_GAME_DENIED, []
+    )
+    denied = GameResponse.failure("denied")
+    game.text_parser.handle_load_game_denied.return_value = denied
+    assert game.run_command("loadgame") == denied
+    game.router.route.assert_not_called()
+
+
+def test_it_should_report_the_parse_cache_after_a_script_in_development(capsys):
+    """Test to make sure reused commands are reported after a script in development."""
+    game = AdventureGame().initialize_game(True, MemorySaveStorage())
+    game.run_script(io.StringIO("look\nlook\ninventory\n"), io.StringIO())
+    assert "Parse cache: 1 hits, 3 misses" in capsys.readouterr().err
+
+
+def test_it_should_only_accept_widths_of_at_least_one_column():
+    """Test to make sure a width paragraphs cannot be wrapped to is refused."""
+    assert AdventureGame.terminal_width("60") == 60
+    for value in ["0", "-5", "wide"]:
+        with pytest.raises(argparse.ArgumentTypeError):
+            AdventureGame.terminal_width(value)
+    with patch.object(sys, "argv", ["ForkOff.py", "--width", "0"]):
+        with patch.object(sys, "stderr", io.StringIO()):
+            with pytest.raises(SystemExit):
+                AdventureGame.parse_arguments()
+    with patch.object(sys, "argv", ["ForkOff.py", "--width", "60"]):
+        assert AdventureGame.parse_arguments().width == 60
@@ -40,6 +40,13 @@ def test_if_it_should_wrap():
     assert message.should_wrap()
 
 
+def test_it_should_wrap_lines_longer_than_the_width():
+    """Test to make sure a line is only wrapped when it is wider than the width."""
+    message = GameMessage(MessageType.SINGLE_LINE, "A" * 60)
+    assert not message.should_wrap()
+    assert message.should_wrap(40)
+
+
 def test_it_should_have_dict():
     """Test to make sure the dict method works correctly."""
     message = GameMessage(MessageType.SINGLE_LINE, "Hello World")
@@ -3,6 +3,7 @@
 from unittest.mock import MagicMock
 
 from common.game_objective import GameObjective
+from common.inventory import Inventory
 from common.item import Item
 from common.player import Player
 from common.room import Room
@@ -78,7 +79,7 @@ def test_in_room_inventory():
     item = MagicMock(Item)
     item.name = "flashlight"
     item.is_collectible = False
-    room.inventory = [item]
+    room.inventory = Inventory([item])
     assert GameObjective.in_room_inventory(room, "flashlight") is True
 
 
@@ -102,3 +103,68 @@ def test_for_list_of_hints():
     assert objective.hints == ["test1", "test2", "test3"]
     objective.increment_hint_count()
     assert objective.hints == ["test1", "test2", "test3"]
+
+
+def test_it_should_cache_completion_until_invalidated():
+    """Make sure it only evaluates again after being invalidated."""
+    player = MagicMock(Player)
+    objective = GameObjective("test", [], ["test"], [])
+    objective.evaluate = MagicMock(return_value=False)
+    assert not objective.is_complete(player)
+    assert not objective.is_complete(player)
+    objective.evaluate.assert_called_once_with(player)
+    objective.evaluate.return_value = True
+    objective.invalidate()
+    assert objective.is_complete(player)
+
+
+def test_completing_an_interaction_should_invalidate_completion():
+    """Make sure completing an interaction forgets the cached completion."""
+    player = MagicMock(Player)
+    player.inventory = []
+    objective = GameObjective(
+        "test",
+        [],
+        [],
+        [{"interaction_type": "use", "item": "flashlight", "complete": False}],
+    )
+    assert not objective.is_complete(player)
+    objective.complete_interaction_objective("flashlight", "use")
+    assert objective.is_complete(player)
+
+
+def test_complete_interaction_objective_should_only_complete_matches():
+    """Make sure only interactions with the same item and action are completed."""
+    objective = GameObjective(
+        "test",
+        [],
+        [],
+        [
+            {"interaction_type": "use", "item": "flashlight", "complete": False},
+            {"interaction_type": "drop", "item": "flashlight", "complete": False},
+            {"interaction_type": "use", "item": "fork", "complete": False},
+        ],
+    )
+    objective.complete_interaction_objective("flashlight", "use")
+    assert [interaction["complete"] for interaction in objective.interactions] == [
+        True,
+        False,
+        False,
+    ]
+
+
+def test_it_should_copy_interactions_without_changing_the_original():
+    """Make sure completing an interaction on a copy leaves the original alone."""
+    objective = GameObjective(
+        "test",
+        ["hint"],
+        ["test"],
+        [{"interaction_type": "use", "item": "flashlight", "complete": False}],
+    )
+    objective.completed = True
+    copied = objective.copy()
+    copied.complete_interaction_objective("flashlight", "use")
+    assert copied.interactions[0]["complete"] is True
+    assert objective.interactions[0]["complete"] is False
+    assert copied.completed is None
+    assert copied.requirements is objective.requirements
@@ -0,0 +1,62 @@
+"""Test the inventory of a room or the player."""
+
+import pytest
+
+from common.inventory import Inventory
+from common.player import Player
+from common.room import Room
+from tests.test_helpers import make_item
+
+
+def test_it_should_keep_the_items_in_the_order_they_were_added():
+    """Make sure iterating gives the items in the order of a list."""
+    fork, spoon, knife = make_item("fork"), make_item("spoon"), make_item("knife")
+    inventory = Inventory([fork, spoon])
+    inventory.append(knife)
+    inventory.remove(spoon)
+    inventory.append(spoon)
+    assert list(inventory) == [fork, knife, spoon]
+    assert inventory == [fork, knife, spoon]
+    assert inventory.names == ["fork", "knife", "spoon"]
+    assert inventory[0] is fork
+    assert len(inventory) == 3
+
+
+def test_it_should_only_contain_the_very_items_added():
+    """Make sure an item is found by name, but only the same item is in it."""
+    fork = make_item("fork")
+    inventory = Inventory([fork])
+    assert fork in inventory
+    assert make_item("fork") not in inventory
+    assert None not in inventory
+    assert inventory.get("fork") is fork
+    assert inventory.get("spoon") is None
+
+
+def test_it_should_not_add_an_item_twice():
+    """Make sure adding an item which is already there does not move it."""
+    fork, spoon = make_item("fork"), make_item("spoon")
+    inventory = Inventory([fork, spoon])
+    inventory.append(fork)
+    assert inventory == [fork, spoon]
+
+
+def test_it_should_refuse_to_remove_an_item_which_is_not_there():
+    """Make sure removing a missing item fails as it does for a list."""
+    inventory = Inventory([make_item("fork")])
+    with pytest.raises(ValueError):
+        inventory.remove(make_item("fork"))
+
+
+def test_rooms_and_players_should_keep_their_items_in_inventories():
+    """Make sure lists given to a room or player become inventories."""
+    fork = make_item("fork")
+    room = Room.default_room()
+    room.inventory = [fork]
+    player = Player("Player", room, [], [fork], False, False)
+    assert isinstance(room.inventory, Inventory)
+    assert isinstance(player.inventory, Inventory)
+    copy = player.copy({room.name: room}, {"fork": fork})
+    assert isinstance(copy.inventory, Inventory)
+    assert copy.inventory == [fork]
+    assert room.inventory_item_names == ["fork"]
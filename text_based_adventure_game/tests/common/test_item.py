@@ -14,3 +14,22 @@ def test_it_should_set_item_descriptions():
     )
     item.description = ["updated description"]
     assert item.description == "updated description"
+
+
+def test_it_should_copy_flags_without_changing_the_original():
+    """Test to make sure a copied item shares its text but not its flags."""
+    item = Item(
+        name="Test Item",
+        alias=["Test Alias"],
+        description=["This is a test description."],
+        look_at_message={"line1": "a look at message"},
+        is_collectible=True,
+        discovered=False,
+        interactions={"use": {}},
+    )
+    copied = item.copy()
+    copied.discovered = True
+    copied.description = ["updated description"]
+    assert item.discovered is False
+    assert item.description == "This is a test description."
+    assert copied.interactions is item.interactions
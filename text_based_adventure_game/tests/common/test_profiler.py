@@ -0,0 +1,85 @@
+"""Test the profiler which times each turn of the game."""
+
+from common.profiler import Profiler
+from game_repository.file_manager import FileManager
+
+
+class Counter:
+    """A small class to instrument."""
+
+    def add(self: "Counter", number: int) -> int:
+        """Return the number plus one."""
+        return number + 1
+
+    @staticmethod
+    def double(number: int) -> int:
+        """Return twice the number."""
+        return number * 2
+
+
+def test_it_should_record_a_span_for_each_call():
+    """Make sure instrumented methods still work and are timed."""
+    profiler = Profiler()
+    counter = Counter()
+    profiler.instrument(counter, ["add"])
+    profiler.instrument(Counter, ["double"])
+    assert counter.add(1) == 2
+    profiler.end_turn()
+    assert Counter.double(2) == 4
+    names = [(span[0], span[3]) for span in profiler.spans]
+    assert names == [("Counter.add", 0), ("Counter.double", 1)]
+    assert all(span[2] >= 0 for span in profiler.spans)
+
+
+def test_it_should_restore_the_methods_it_instrumented():
+    """Make sure nothing is timed once the instruments are removed."""
+    profiler = Profiler()
+    counter = Counter()
+    original = vars(Counter)["double"]
+    profiler.instrument_public_methods(counter)
+    profiler.instrument(Counter, ["double"])
+    profiler.remove_instruments()
+    assert "add" not in vars(counter)
+    assert vars(Counter)["double"] is original
+    counter.add(1)
+    Counter.double(1)
+    assert len(profiler.spans) == 0
+
+
+def test_it_should_keep_only_the_most_recent_spans():
+    """Make sure the ring buffer drops the oldest spans once it is full."""
+    profiler = Profiler(capacity=3)
+    counter = Counter()
+    profiler.instrument(counter, ["add"])
+    for turn in range(5):
+        counter.add(turn)
+        profiler.end_turn()
+    assert [span[3] for span in profiler.spans] == [2, 3, 4]
+    assert profiler.summary()[0].startswith("Counter.add - 3 calls,")
+
+
+def test_it_should_record_spans_which_raise():
+    """Make sure a method which raises is still timed."""
+    profiler = Profiler()
+    counter = Counter()
+    profiler.instrument(counter, ["add"])
+    try:
+        counter.add(None)
+    except TypeError:
+        pass
+    assert len(profiler.spans) == 1
+
+
+def test_it_should_export_a_trace(tmp_path):
+    """Make sure the spans are exported in the trace event format."""
+    profiler = Profiler()
+    counter = Counter()
+    profiler.instrument(counter, ["add"])
+    counter.add(1)
+    events = profiler.trace_events()
+    assert events[0]["name"] == "Counter.add"
+    assert events[0]["ph"] == "X"
+    assert events[0]["ts"] >= 0
+    trace_file = tmp_path / "trace.json"
+    assert FileManager.save_trace(str(trace_file), events) is None
+    assert '"traceEvents"' in trace_file.read_text()
@@ -1,5 +1,6 @@
 """Test the room class."""
 
+from common.game_objective import GameObjective
 from common.item import Item
 from common.room import Room
 
@@ -46,3 +47,58 @@ def test_it_should_get_room_description_with_item_description():
     """It should get an item description."""
     room = get_mock_room()
     assert room.description == "Test Description. Test description for the item. "
+
+
+def test_it_should_copy_with_the_given_items():
+    """Test to make sure a copied room holds the given copies of its items."""
+    room = get_mock_room()
+    item = room.inventory[0].copy()
+    copied = room.copy({item.name: item}, {})
+    copied.inventory.remove(item)
+    assert copied.starting_inventory == [item]
+    assert room.inventory_item_names == ["Test Item"]
+    assert copied.exits is room.exits
+
+
+def test_it_should_copy_with_the_given_blocking_objectives():
+    """Test to make sure a copied room is blocked by the given objectives."""
+    room = get_mock_room()
+    objective = GameObjective("light", [], [], [])
+    room.blocking_objectives = [(objective, "Too dark.")]
+    copied_objective = GameObjective("light", [], [], [])
+    item = room.inventory[0]
+    copied = room.copy({item.name: item}, {"light": copied_objective})
+    assert copied.blocking_objectives == [(copied_objective, "Too dark.")]
+    assert room.blocking_objectives == [(objective, "Too dark.")]
+
+
+def test_it_should_describe_the_room_again_when_an_item_is_discovered():
+    """Test to make sure discovering a mentioned item changes the description."""
+    room = get_mock_room()
+    assert room.description == "Test Description. Test description for the item. "
+    room.starting_inventory[0].discovered = True
+    assert room.description == "Test Description. "
+    room.starting_inventory[0].discovered = False
+    room.starting_inventory[0].hidden = True
+    assert room.description == "Test Description. "
+
+
+def test_it_should_keep_the_rendered_description_until_a_flag_changes():
+    """Test to make sure the description is only rendered when it may change."""
+    room = get_mock_room()
+    rendered = room.description
+    assert room.description is rendered
+    room.starting_inventory[0].locked = True
+    assert room.description is rendered
+    room.starting_inventory[0].discovered = True
+    assert room.description is not rendered
+
+
+def test_it_should_describe_a_copy_from_its_own_items():
+    """Test to make sure a copied room follows the flags of the copied items."""
+    room = get_mock_room()
+    item = room.inventory[0].copy()
+    copied = room.copy({item.name: item}, {})
+    item.discovered = True
+    assert copied.description == "Test Description. "
+    assert room.description == "Test Description. Test description for the item. "
@@ -13,6 +13,11 @@ from services.interaction_service import InteractionService
 from tests.test_helpers import any_message_contents
 
 
+def route(controller: Any, request: GameRequest) -> GameResponse:
+    """Dispatch the request to the controller's handler, as the router does."""
+    return controller.handlers()[request.action](request)
+
+
 def mock_interaction_service() -> dict[ServiceType, Any]:
     """Return a mock inventory service for test setup."""
     mock_service = MagicMock(InteractionService)
@@ -46,7 +51,7 @@ def test_it_should_route_use_requests():
     """Test to ensure it routes an item use request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.USE, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You used the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.use.assert_called_once_with(request)
@@ -56,7 +61,7 @@ def test_it_should_route_pull_requests():
     """Test to ensure it routes an item pull request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.PULL, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You pulled the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.pull.assert_called_once_with(request)
@@ -66,7 +71,7 @@ def test_it_should_route_chew_requests():
     """Test to ensure it routes an item chew request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.CHEW, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You chewed the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.chew.assert_called_once_with(request)
@@ -76,16 +81,14 @@ def test_it_should_not_route_unknown_requests():
     """Test to ensure it does not route an unknown request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.UNKNOWN, ["random item"])
-    response = interaction_controller.route(request)
-    assert any_message_contents(response.messages, "You are unsure how to do that.")
-    assert response.status == RequestStatus.FAILURE
+    assert request.action not in interaction_controller.handlers()
 
 
 def test_it_should_route_sit_requests():
     """Test to ensure it routes a sit request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.SIT, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You sat on an item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.sit.assert_called_once_with(request)
@@ -95,7 +98,7 @@ def test_it_should_route_drink_requests():
     """Test to ensure it routes a drink request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.DRINK, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You drank the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.drink.assert_called_once_with(request)
@@ -105,7 +108,7 @@ def test_it_should_route_clean_requests():
     """Test to ensure it routes a clean request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.CLEAN, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You cleaned the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.clean.assert_called_once_with(request)
@@ -115,7 +118,7 @@ def test_it_should_route_climb_requests():
     """Test to ensure it routes a climb request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.CLIMB, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You climbed the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.climb.assert_called_once_with(request)
@@ -125,7 +128,7 @@ def test_it_should_route_turn_on_requests():
     """Test to ensure it routes a turn on request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.TURN_ON, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You turned on the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.turn_on.assert_called_once_with(request)
@@ -135,7 +138,7 @@ def test_it_should_route_open_requests():
     """Test to ensure it routes an open request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.OPEN, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You opened the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.open.assert_called_once_with(request)
@@ -145,7 +148,7 @@ def test_it_should_route_play_requests():
     """Test to ensure it routes a play request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.PLAY, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You played the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.play.assert_called_once_with(request)
@@ -155,7 +158,7 @@ def test_it_should_route_flush_requests():
     """Test to ensure it routes a flush request."""
     interaction_controller = InteractionController(mock_interaction_service())
     request = GameRequest(RequestType.FLUSH, ["random item"])
-    response = interaction_controller.route(request)
+    response = route(interaction_controller, request)
     assert any_message_contents(response.messages, "You flushed the item.")
     assert response.status == RequestStatus.SUCCESS
     interaction_controller.interaction_service.flush.assert_called_once_with(request)
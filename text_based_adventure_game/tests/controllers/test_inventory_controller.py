@@ -13,6 +13,11 @@ from services.inventory_service import InventoryService
 from tests.test_helpers import any_message_contents
 
 
+def route(controller: Any, request: GameRequest) -> GameResponse:
+    """Dispatch the request to the controller's handler, as the router does."""
+    return controller.handlers()[request.action](request)
+
+
 def mock_inventory_service() -> dict[ServiceType, Any]:
     """Return a mock inventory service for test setup."""
     mock_service = MagicMock(InventoryService)
@@ -36,7 +41,7 @@ def test_it_should_pick_up_items():
     """Test to ensure the inventory controller can route TAKE requests."""
     inventory_controller = InventoryController(mock_inventory_service())
     request = GameRequest(RequestType.TAKE, "random item")
-    response = inventory_controller.route(request)
+    response = route(inventory_controller, request)
     assert any_message_contents(response.messages, "Picked up item")
     assert response.status == RequestStatus.SUCCESS
     inventory_controller.inventory_service.pick_up.assert_called_once_with(request)
@@ -46,7 +51,7 @@ def test_it_should_drop_items():
     """Test to ensure the inventory controller can route DROP requests."""
     inventory_controller = InventoryController(mock_inventory_service())
     request = GameRequest(RequestType.DROP, "random item")
-    response = inventory_controller.route(request)
+    response = route(inventory_controller, request)
     assert any_message_contents(response.messages, "Dropped item")
     assert response.status == RequestStatus.SUCCESS
     inventory_controller.inventory_service.drop.assert_called_once_with(request)
@@ -56,7 +61,7 @@ def test_it_should_show_inventory_contents():
     """Test to ensure it returns the contents of the inventory."""
     inventory_controller = InventoryController(mock_inventory_service())
     request = GameRequest(RequestType.INVENTORY, "random item")
-    response = inventory_controller.route(request)
+    response = route(inventory_controller, request)
     assert any_message_contents(response.messages, "You have no items")
     assert response.status == RequestStatus.SUCCESS
     inventory_controller.inventory_service.open_inventory.assert_called_once_with(
@@ -68,17 +73,14 @@ def test_it_should_not_route_unknown_requests():
     """Test to ensure it returns an error for unknown requests."""
     inventory_controller = InventoryController(mock_inventory_service())
     request = GameRequest(RequestType.UNKNOWN, "random item")
-    response = inventory_controller.route(request)
-    assert any_message_contents(response.messages, "You are unsure how to do that.")
-    assert response.status == RequestStatus.FAILURE
-    inventory_controller.inventory_service.open_inventory.assert_not_called()
+    assert request.action not in inventory_controller.handlers()
 
 
 def test_it_should_route_look_at_requests():
     """Test to make sure look at/inspect requests are routed."""
     inventory_controller = InventoryController(mock_inventory_service())
     request = GameRequest(RequestType.INSPECT, "random item")
-    response = inventory_controller.route(request)
+    response = route(inventory_controller, request)
     assert any_message_contents(response.messages, "You looked at the item!")
     assert response.status == RequestStatus.SUCCESS
     inventory_controller.inventory_service.look_at.assert_called_once_with(request)
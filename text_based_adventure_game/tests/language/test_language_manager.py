@@ -307,3 +307,30 @@ def test_it_should_get_request_type_aliases():
     assert manager.get_request_type_aliases("play") == manager.play_requests
     assert manager.get_request_type_aliases("flush") == manager.flush_requests
     assert manager.get_request_type_aliases("not a request") == []
+
+
+def test_it_should_resolve_shared_phrases_in_lookup_order():
+    """Test to make sure phrases in several groups keep the original precedence."""
+    manager = LanguageManager()
+    manager.language = mock_language_helper()
+    assert manager.find_command_target("s") == "south"
+    assert manager.get_request_type_aliases("s") == manager.south_requests
+    assert manager.get_request_type("s") == RequestType.UNKNOWN
+    assert manager.find_command_target("scroll") == "scroll"
+    assert manager.get_request_type("scroll") == RequestType.SCROLL
+
+
+def test_it_should_rebuild_vocabulary_when_language_reloaded():
+    """Test to make sure the vocabulary index follows the loaded language."""
+    language = mock_language_helper()
+    language["look_requests"] = ["look", "peek"]
+    with patch.object(FileManager, "load_language", return_value=language):
+        manager = LanguageManager()
+        manager.load_language()
+        assert manager.get_request_type("peek") == RequestType.LOOK
+    with patch.object(
+        FileManager, "load_language", return_value=mock_language_helper()
+    ):
+        manager.load_language()
+        assert manager.get_request_type("peek") == RequestType.UNKNOWN
+        assert manager.find_command_target("peek") is None
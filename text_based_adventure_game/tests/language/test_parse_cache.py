@@ -0,0 +1,54 @@
+"""Test the parse cache."""
+
+from common.game_request import GameRequest
+from common.request_type import RequestType
+from language.parse_cache import ParseCache
+
+
+def test_it_should_return_a_copy_of_a_request_parsed_in_the_same_epoch():
+    """Test to make sure a cached request is returned without being shared."""
+    cache = ParseCache()
+    assert cache.get(("take key", True), 0) is None
+    cache.put(("take key", True), GameRequest(RequestType.TAKE, ["key"]), 0)
+    request = cache.get(("take key", True), 0)
+    assert request is not None
+    assert request.action == RequestType.TAKE
+    request.targets.append("door")
+    assert cache.get(("take key", True), 0).targets == ["key"]  # type: ignore
+    assert (cache.hits, cache.misses) == (2, 1)
+
+
+def test_it_should_forget_requests_which_depend_on_an_earlier_epoch():
+    """Test to make sure only requests parsed in an earlier epoch are forgotten."""
+    cache = ParseCache()
+    cache.put(("take key", True), GameRequest(RequestType.TAKE, ["key"]), 0)
+    cache.put(("north", True), GameRequest(RequestType.MOVE, ["north"]), None)
+    assert cache.get(("take key", True), 1) is None
+    assert cache.get(("north", True), 1) is not None
+    assert list(cache.requests) == [("north", True)]
+    assert cache.invalidations == 1
+
+
+def test_it_should_forget_the_least_recently_used_request_when_full():
+    """Test to make sure the cache holds no more than its capacity."""
+    cache = ParseCache(capacity=2)
+    cache.get(("look", True), 0)
+    cache.put(("look", True), GameRequest(RequestType.LOOK, [None]), None)
+    cache.put(("north", True), GameRequest(RequestType.MOVE, ["north"]), None)
+    cache.get(("look", True), 0)
+    cache.put(("help", True), GameRequest(RequestType.HELP, [None]), None)
+    assert list(cache.requests) == [("look", True), ("help", True)]
+
+
+def test_it_should_describe_how_often_requests_were_reused():
+    """Test to make sure the statistics count the hits and misses."""
+    cache = ParseCache(capacity=8)
+    cache.get(("look", True), 0)
+    cache.put(("look", True), GameRequest(RequestType.LOOK, [None]), None)
+    cache.get(("look", True), 0)
+    assert cache.statistics() == (
+        "Parse cache: 1 hits, 1 misses (50% hits), 1 of 8 commands kept,"
+        " 0 out of date as the world changed."
+    )
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache.requests)) == (0, 0, 0)
@@ -0,0 +1,32 @@
+"""Test the phrase trie."""
+
+from language.phrase_trie import PhraseTrie
+
+
+def test_it_should_contain_added_phrases():
+    """Test to make sure only whole phrases are contained in the trie."""
+    trie = PhraseTrie.from_phrases(["wine cellar", "Wine", "pick up"])
+    assert "wine cellar" in trie
+    assert "wine" in trie
+    assert "WINE CELLAR" in trie
+    assert "pick" not in trie
+    assert "cellar" not in trie
+    assert "wine cellar door" not in trie
+
+
+def test_it_should_find_every_phrase_starting_at_a_word():
+    """Test to make sure it finds the length of each phrase starting at a word."""
+    trie = PhraseTrie.from_phrases(["wine", "wine cellar", "wine cellar door", "key"])
+    words = ["use", "key", "on", "Wine", "cellar", "door"]
+    assert trie.match_lengths(words, 0) == []
+    assert trie.match_lengths(words, 1) == [1]
+    assert trie.match_lengths(words, 3) == [1, 2, 3]
+    assert trie.match_lengths(words, 4) == []
+    assert trie.match_lengths(words, 6) == []
+
+
+def test_it_should_start_empty():
+    """Test to make sure a new trie has no phrases."""
+    trie = PhraseTrie()
+    assert trie.match_lengths(["anything"], 0) == []
+    assert "anything" not in trie
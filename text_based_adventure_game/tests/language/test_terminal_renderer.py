@@ -0,0 +1,89 @@
+"""Test the terminal renderer."""
+
+import io
+
+from language.terminal_renderer import TerminalRenderer
+
+
+class FakeClock:
+    """A clock which only moves forward when something sleeps."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+        self.sleeps: list[float] = []
+
+    def time(self: "FakeClock") -> float:
+        """Return the current time."""
+        return self.now
+
+    def sleep(self: "FakeClock", seconds: float) -> None:
+        """Move the clock forward."""
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+class CountingStream(io.StringIO):
+    """A stream which counts the number of writes."""
+
+    def __init__(self: "CountingStream") -> None:
+        """Initialize the stream."""
+        super().__init__()
+        self.writes = 0
+
+    def write(self: "CountingStream", text: str) -> int:
+        """Count and write the text."""
+        self.writes += 1
+        return super().write(text)
+
+
+def make_renderer() -> tuple[TerminalRenderer, CountingStream, FakeClock]:
+    """Return a renderer writing to a counting stream with a fake clock."""
+    stream = CountingStream()
+    clock = FakeClock()
+    return TerminalRenderer(stream, clock.time, clock.sleep), stream, clock
+
+
+def test_it_should_write_blocks_in_one_write():
+    """Make sure a block is written with a single write."""
+    renderer, stream, _ = make_renderer()
+    renderer.write_block("line one\nline two")
+    assert stream.getvalue() == "line one\nline two\n"
+    assert stream.writes == 1
+
+
+def test_it_should_write_the_whole_line_without_a_delay():
+    """Make sure a line is not typed when there is no delay."""
+    renderer, stream, clock = make_renderer()
+    renderer.type_line("hello", 0)
+    assert stream.getvalue() == "hello\n"
+    assert clock.sleeps == []
+
+
+def test_it_should_type_a_line_in_frame_sized_chunks():
+    """Make sure a line is typed at the delay with one write per frame."""
+    renderer, stream, clock = make_renderer()
+    text = "x" * 120
+    renderer.type_line(text, 0.001)
+    assert stream.getvalue() == text + "\n"
+    # 120 characters at 1ms each take about 7 frames rather than 120 writes.
+    assert stream.writes <= 9
+    assert 0.119 <= clock.now <= 0.119 + 1 / TerminalRenderer.frames_per_second
+
+
+def test_it_should_type_slow_text_one_character_at_a_time():
+    """Make sure slow text still appears one character per delay."""
+    renderer, stream, clock = make_renderer()
+    renderer.type_line("abc", 0.1)
+    assert stream.getvalue() == "abc\n"
+    assert stream.writes == 3
+    assert round(clock.now, 6) == 0.2
+
+
+def test_it_should_catch_up_when_the_clock_jumps():
+    """Make sure every due character is written after a long pause."""
+    renderer, stream, clock = make_renderer()
+    renderer.sleep = lambda _: clock.sleep(1)
+    renderer.type_line("abcdef", 0.01)
+    assert stream.getvalue() == "abcdef\n"
+    assert stream.writes == 2
@@ -1,8 +1,8 @@
 """Test the text parser."""
 
 import builtins
+import io
 import textwrap
-import time
 from typing import Any
 from unittest.mock import MagicMock, call, patch
 
@@ -16,11 +16,18 @@ from common.request_type import RequestType
 from common.room import Room
 from game_repository.game_repository import GameRepository
 from game_repository.item_manager import ItemManager
+from language.phrase_trie import PhraseTrie
+from language.terminal_renderer import TerminalRenderer
 from language.text_parser import TextParser
 from router.router import Router
 from tests.test_helpers import any_message_contents
 
 
+def every_window(words: list[str], start: int) -> list[int]:
+    """Treat every window of words as a possible target phrase."""
+    return list(range(1, len(words) - start + 1))
+
+
 def default_repo() -> MagicMock:
     """Returns a default repository with some mock data."""
     rooms = {
@@ -74,10 +81,14 @@ def default_repo() -> MagicMock:
     repo.language.objective_requests = ["objective", "goal", "objectives", "goals"]
     repo.rooms = rooms
     repo.find_target = MagicMock(name="find_target", return_value="valid target")
+    repo.target_phrases = MagicMock(PhraseTrie)
+    repo.target_phrases.match_lengths = MagicMock(side_effect=every_window)
     repo.player = MagicMock(Player)
     repo.player.location = repo.rooms["kitchen"]
     repo.environment = Environment(False)
     repo.scroll_delay = 0
+    repo.world_epoch = 0
+    repo.world_lookups = 0
     return repo
 
 
@@ -113,7 +124,8 @@ def test_parser_should_parse_two_words():
     repo = default_repo()
     text_parser = TextParser(MagicMock, repo)
     text_parser.handle_two_word_request = MagicMock(
-        name="handle_two_word_request", return_value=None
+        name="handle_two_word_request",
+        return_value=GameRequest(RequestType.MOVE, ["north"]),
     )
     text_parser.parse_text("go north", True)
     text_parser.handle_two_word_request.assert_called_once()
@@ -138,21 +150,27 @@ def test_parser_should_print_responses():
     text_parser.scroll_print.assert_called_once_with("    Test response")
 
 
-def test_scroll_print_should_sleep():
-    """The scroll print method should sleep."""
+def test_scroll_print_should_type_the_line():
+    """The scroll print method should type the text at the scroll delay."""
+    repo = default_repo()
+    repo.scroll_delay = 0.01
+    repo.environment = Environment(False)
+    text_parser = TextParser(MagicMock, repo)
+    text_parser.renderer = MagicMock(TerminalRenderer)
+    text_parser.scroll_print("Test text")
+    text_parser.renderer.type_line.assert_called_once_with("Test text", 0.01)
 
-    with patch.object(time, "sleep", return_value=None) as mock_sleep:
-        with patch.object(builtins, "print", return_value=None) as mock_print:
-            repo = default_repo()
-            repo.scroll_delay = 0.01
-            repo.environment = Environment(False)
-            text_parser = TextParser(MagicMock, repo)
-            input_text = "Test text"
-            text_parser.scroll_print(input_text)
-            # It should sleep each time a letter is printed
-            assert mock_sleep.call_count == len(input_text)
-            # It should print each letter and then a new line at the end
-            assert mock_print.call_count == len(input_text) + 1
+
+def test_scroll_print_should_not_type_in_development():
+    """The scroll print method should write the whole line in development mode."""
+    repo = default_repo()
+    repo.scroll_delay = 0.01
+    repo.environment = Environment(True)
+    text_parser = TextParser(MagicMock, repo)
+    text_parser.renderer = MagicMock(TerminalRenderer)
+    text_parser.scroll_print("Test text")
+    text_parser.renderer.write_block.assert_called_once_with("Test text")
+    text_parser.renderer.type_line.assert_not_called()
 
 
 def test_it_should_handle_invalid_input():
@@ -352,6 +370,17 @@ def test_it_should_deny_load_requests_when_user_denies():
     text_parser.confirm_load_game.assert_called_once()
 
 
+def test_it_should_only_profile_in_development():
+    """Test to make sure the profile is only summarized in development mode."""
+    repo = default_repo()
+    repo.language.get_request_type = MagicMock(return_value=RequestType.PROFILE)
+    text_parser = TextParser(MagicMock, repo)
+    repo.environment = Environment(False)
+    assert text_parser.get_request_type("profile", True) == RequestType.UNKNOWN
+    repo.environment = Environment(True)
+    assert text_parser.get_request_type("profile", True) == RequestType.PROFILE
+
+
 def test_it_should_understand_new_game_requests():
     """Test to make sure the text parser can understand new game requests."""
     repo = default_repo()
@@ -447,10 +476,10 @@ def test_print_single_message_can_handle_spaces():
 
 def test_print_single_message_can_handle_art():
     text_parser = TextParser(MagicMock, default_repo())
-    text_parser.scroll_print = MagicMock(name="scroll_print", return_value=None)
-    message = GameMessage.art(["test instructions"])
-    text_parser.print_single_message(message, False)
-    text_parser.scroll_print.assert_called_once_with("test instructions")
+    text_parser.renderer = MagicMock(TerminalRenderer)
+    message = GameMessage.art(["test", "art"])
+    text_parser.print_single_message(message, True)
+    text_parser.renderer.write_block.assert_called_once_with("    test\n    art")
 
 
 def test_print_list_of_messages_should_print_multiple_messages():
@@ -577,6 +606,26 @@ def test_it_should_handle_multi_word_requests():
         assert request.targets == ["wine cellar"]
 
 
+def test_it_should_keep_the_names_given_to_saved_games():
+    """Test to make sure the name of a saved game is kept rather than looked up."""
+
+    def get_request_type_mocker(self: Any, words: str, from_user: bool):
+        """Mocker for the get_request_type method."""
+        return RequestType.SAVE_GAME if words == "save" else RequestType.UNKNOWN
+
+    text_parser = TextParser(MagicMock, default_repo())
+    with patch.object(TextParser, "get_request_type", get_request_type_mocker):
+        text_parser.find_valid_target = MagicMock(name="find_valid_target")
+        two_words = text_parser.handle_two_word_request(["save", "kitchen"], True)
+        text_parser.find_valid_target.assert_not_called()
+        many_words = text_parser.handle_multi_word_request(
+            ["save", "my", "castle"], True
+        )
+    assert two_words.action == RequestType.SAVE_GAME
+    assert two_words.targets == ["kitchen"]
+    assert many_words.targets == ["my castle"]
+
+
 def test_it_should_handle_multiword_map_requests():
     text_parser = TextParser(MagicMock, default_repo())
     text_parser.get_request_type = MagicMock(
@@ -608,14 +657,31 @@ def test_it_should_handle_unknown_multi_word_requests():
 
 def test_it_should_print_wrapped_text():
     """Test to make sure it prints wrapped text."""
-    textwrap.wrap = MagicMock(name="wrap", return_value=["test"])
     repo = default_repo()
     repo.scroll_delay = 0
     text_parser = TextParser(MagicMock, repo)
     message = GameMessage.paragraph("test")
     message.should_wrap = MagicMock(name="should_wrap", return_value=True)
-    text_parser.print_single_message(message, False)
-    textwrap.wrap.assert_called()
+    with patch.object(textwrap, "wrap", return_value=["test"]) as wrap:
+        text_parser.print_single_message(message, False)
+    wrap.assert_called()
+
+
+def test_it_should_wrap_a_paragraph_once_for_each_width():
+    """Test to make sure a paragraph printed again is not wrapped again."""
+    repo = default_repo()
+    repo.scroll_delay = 0
+    text_parser = TextParser(MagicMock, repo)
+    text_parser.scroll_print_with_spaces = MagicMock(name="scroll_print_with_spaces")
+    message = GameMessage.paragraph("word " * 30)
+    with patch.object(textwrap, "wrap", wraps=textwrap.wrap) as wrap:
+        text_parser.print_single_message(message, False)
+        text_parser.print_single_message(message, False)
+        assert wrap.call_count == 1
+        text_parser.width = 40
+        text_parser.print_single_message(message, False)
+        assert wrap.call_count == 2
+    assert text_parser.scroll_print_with_spaces.call_count == 2 + 2 + 4
 
 
 def test_it_should_just_scroll_print():
@@ -720,3 +786,103 @@ def test_it_should_not_error_when_enter_pressed_by_accident():
         text_parser.print_list_of_messages.assert_called()
         text_parser.print_response.assert_not_called()
         text_parser.router.route_request.assert_not_called()
+
+
+def test_find_all_valid_targets_should_only_check_known_phrases():
+    """Test to make sure only phrases in the target trie are looked up."""
+    repo = default_repo()
+    repo.target_phrases = PhraseTrie.from_phrases(
+        ["kitchen", "living room", "really long room name"]
+    )
+    repo.find_target = MagicMock(side_effect=lambda target, _: target)
+    text_parser = TextParser(MagicMock, repo)
+    targets = text_parser.find_all_valid_targets(
+        ["Kitchen", "living", "room", "really", "long", "room", "name"], True
+    )
+    assert targets == ["really long room name", "living room", "kitchen"]
+    looked_up = [call.args[0] for call in repo.find_target.call_args_list]
+    assert looked_up == ["really long room name", "living room", "kitchen"]
+
+
+def test_find_all_valid_targets_should_prefer_leftmost_of_equal_length():
+    """Test to make sure the leftmost of two equally long targets comes first."""
+    repo = default_repo()
+    repo.target_phrases = PhraseTrie.from_phrases(["fork", "key", "door"])
+    repo.find_target = MagicMock(
+        side_effect=lambda target, _: None if target == "door" else target
+    )
+    text_parser = TextParser(MagicMock, repo)
+    targets = text_parser.find_all_valid_targets(["key", "door", "fork"], True)
+    assert targets == ["key", "fork"]
+
+
+def test_find_all_valid_targets_should_join_words_around_removed_targets():
+    """Test to make sure words on either side of a target can form a new target."""
+    repo = default_repo()
+    repo.target_phrases = PhraseTrie.from_phrases(["wine cellar", "key"])
+    repo.find_target = MagicMock(side_effect=lambda target, _: target)
+    text_parser = TextParser(MagicMock, repo)
+    targets = text_parser.find_all_valid_targets(["wine", "key", "cellar"], True)
+    assert targets == ["key", "wine cellar"]
+
+
+def test_find_all_valid_targets_should_use_whole_phrase_when_not_from_user():
+    """Test to make sure game input is passed through as a single target."""
+    repo = default_repo()
+    repo.find_target = MagicMock(side_effect=lambda target, _: target)
+    text_parser = TextParser(MagicMock, repo)
+    assert text_parser.find_all_valid_targets(["wax", "lyrical"], False) == [
+        "wax lyrical"
+    ]
+    assert text_parser.find_all_valid_targets([], False) == []
+
+
+def test_it_should_read_input_from_the_script_when_there_is_one():
+    """Make sure confirmations are read from the script when running one."""
+    text_parser = TextParser(MagicMock, default_repo())
+    text_parser.script = io.StringIO("yes\n")
+    with patch.object(builtins, "input", return_value="no") as mock_input:
+        assert text_parser.read_input() == "yes"
+        mock_input.assert_not_called()
+
+
+def test_parser_should_reuse_requests_until_the_world_changes():
+    """The text parser should parse a repeated command once for each world epoch."""
+    repo = default_repo()
+
+    def find_target(target: str, from_user: bool) -> str:
+        repo.world_lookups += 1
+        return "valid target"
+
+    repo.find_target = MagicMock(side_effect=find_target)
+    text_parser = TextParser(MagicMock, repo)
+    first = text_parser.parse_text("take valid target", True)
+    second = text_parser.parse_text("take valid target", True)
+    assert second.action == first.action
+    assert second.targets == first.targets
+    assert second is not first
+    assert repo.find_target.call_count == 1
+    repo.world_epoch = 1
+    text_parser.parse_text("take valid target", True)
+    assert repo.find_target.call_count == 2
+    assert (text_parser.parse_cache.hits, text_parser.parse_cache.misses) == (1, 2)
+
+
+def test_parser_should_not_reuse_load_requests():
+    """The text parser should ask again each time a game is loaded."""
+    repo = default_repo()
+    repo.language.get_request_type = MagicMock(return_value=RequestType.LOAD_GAME)
+    text_parser = TextParser(MagicMock, repo)
+    text_parser.confirm_load_game = MagicMock(side_effect=[True, False])
+    assert text_parser.parse_text("load", True).action == RequestType.LOAD_GAME
+    assert text_parser.parse_text("load", True).action == (RequestType.LOAD_GAME_DENIED)
+
+
+def test_parser_should_reuse_requests_which_do_not_depend_on_the_world():
+    """The text parser should keep requests found without looking around."""
+    repo = default_repo()
+    text_parser = TextParser(MagicMock, repo)
+    text_parser.parse_text("take valid target", True)
+    repo.world_epoch = 1
+    text_parser.parse_text("take valid target", True)
+    assert repo.find_target.call_count == 1
@@ -0,0 +1,36 @@
+"""Test the wrap cache."""
+
+from language.wrap_cache import WrapCache
+
+
+def test_it_should_wrap_a_paragraph_once_for_each_width():
+    """Test to make sure wrapped lines are reused for the same text and width."""
+    cache = WrapCache()
+    text = "The quick brown fox jumps over the lazy dog."
+    lines = cache.wrap(text, 20)
+    assert lines == ("The quick brown fox", "jumps over the lazy", "dog.")
+    assert cache.wrap(text, 20) is lines
+    assert cache.wrap(text, 80) == (text,)
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+def test_it_should_forget_the_least_recently_used_paragraph_when_full():
+    """Test to make sure the cache holds no more than its capacity."""
+    cache = WrapCache(capacity=2)
+    cache.wrap("look", 80)
+    cache.wrap("north", 80)
+    cache.wrap("look", 80)
+    cache.wrap("help", 80)
+    assert list(cache.paragraphs) == [("look", 80), ("help", 80)]
+
+
+def test_it_should_describe_and_clear_its_statistics():
+    """Test to make sure the statistics describe the reuse of paragraphs."""
+    cache = WrapCache(capacity=4)
+    cache.wrap("look", 80)
+    cache.wrap("look", 80)
+    assert cache.statistics() == (
+        "Wrap cache: 1 hits, 1 misses (50% hits), 1 of 4 paragraphs kept."
+    )
+    cache.clear()
+    assert (cache.hits, cache.misses, len(cache.paragraphs)) == (0, 0, 0)
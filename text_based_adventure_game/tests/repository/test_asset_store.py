@@ -0,0 +1,60 @@
+"""Test the lazily parsed asset store."""
+
+import json
+
+import pytest
+
+from game_repository.asset_store import AssetStore
+from game_repository.file_manager import FileManager
+
+
+def test_it_should_read_the_same_values_as_the_game_files():
+    """Make sure every shipped asset file reads the same as when it is parsed."""
+    for file_name in [FileManager.game_art_file, FileManager.stories_file]:
+        path = FileManager.join_base_path(file_name)
+        with open(path, "r") as asset_file:
+            expected = json.loads(asset_file.read())
+        assert dict(AssetStore.open(path)) == expected
+
+
+def test_it_should_parse_only_the_values_that_are_read():
+    """Make sure nothing is parsed until it is asked for."""
+    store = AssetStore(b'{"title": ["a title"], "ending": ["the end"]}')
+    assert store.loaded == {}
+    assert store["title"] == ["a title"]
+    assert store.loaded == {"title": ["a title"]}
+    assert store["title"] is store["title"]
+
+
+def test_it_should_skip_over_nested_values_and_escaped_quotes():
+    """Make sure values of any kind are found by their offsets."""
+    data = {
+        "quoted": ['a "quote" and a \\', "]}"],
+        "nested": {"a": [1, {"b": None}], "c": "{"},
+        "number": -1.5e3,
+        "flag": True,
+        "unicode": ["café ☃"],
+        "": [],
+    }
+    for text in [json.dumps(data), json.dumps(data, indent=4)]:
+        store = AssetStore(text.encode("utf-8"))
+        assert list(store) == list(data)
+        assert dict(store) == data
+
+
+def test_it_should_act_like_a_dictionary():
+    """Make sure the store answers the lookups the game makes."""
+    store = AssetStore(b" {} ")
+    assert len(store) == 0
+    assert store.get(None, []) == []
+    store = AssetStore(b'{"game_map": ["map"]}')
+    assert "game_map" in store
+    assert store.get("missing", []) == []
+    assert store == {"game_map": ["map"]}
+
+
+def test_it_should_reject_files_that_are_not_objects():
+    """Make sure a damaged file is reported when it is opened."""
+    for text in [b"[]", b'{"a" ["b"]}', b'{"a": ["b"]', b'{"a": "b', b'{"a": 1 "b"}']:
+        with pytest.raises(ValueError):
+            AssetStore(text)
@@ -0,0 +1,41 @@
+"""Test the autosave policy."""
+
+from game_repository.autosave_policy import AutosavePolicy
+
+
+class FakeClock:
+    """A clock which only moves when told to."""
+
+    def __init__(self: "FakeClock") -> None:
+        """Start the clock at zero."""
+        self.now = 0.0
+
+    def time(self: "FakeClock") -> float:
+        """Return the current time."""
+        return self.now
+
+
+def test_it_should_be_due_after_enough_turns():
+    """Make sure a save is due once the turn limit is reached."""
+    policy = AutosavePolicy(turns=3)
+    assert [policy.record_turn() for _ in range(3)] == [False, False, True]
+    policy.reset()
+    assert policy.record_turn() is False
+
+
+def test_it_should_be_due_after_enough_time():
+    """Make sure a save is due once the time limit has passed."""
+    clock = FakeClock()
+    policy = AutosavePolicy(seconds=60, clock=clock.time)
+    clock.now = 59
+    assert policy.record_turn() is False
+    clock.now = 60
+    assert policy.record_turn() is True
+    policy.reset()
+    assert policy.is_due() is False
+
+
+def test_it_should_never_be_due_without_limits():
+    """Make sure a policy without limits never saves."""
+    policy = AutosavePolicy()
+    assert not any(policy.record_turn() for _ in range(1000))
@@ -0,0 +1,19 @@
+"""Test the change tracker."""
+
+from common.game_objective import GameObjective
+from common.room import Room
+from game_repository.change_tracker import ChangeTracker
+from tests.test_helpers import make_item
+
+
+def test_it_should_record_changed_names_until_cleared():
+    """Make sure the names of changed items, rooms and objectives are kept."""
+    tracker = ChangeTracker()
+    tracker.mark_items([make_item("fork"), make_item("spoon")])
+    tracker.mark_room(Room.default_room())
+    tracker.mark_objective(GameObjective("eat", [], [], []))
+    assert tracker.items == {"fork", "spoon"}
+    assert tracker.rooms == {Room.default_room().name}
+    assert tracker.objectives == {"eat"}
+    tracker.clear()
+    assert tracker.items == tracker.rooms == tracker.objectives == set()
@@ -0,0 +1,35 @@
+"""Test the encoding of the content bundle."""
+
+from game_repository.content_bundle import ContentBundle
+
+stamps = {"data/items.json": (12, 34, "digest")}
+content = {"items": [{"name": "key", "hidden": False}], "player": {"location": "a"}}
+
+
+def test_it_should_decode_the_content_it_encoded():
+    """Make sure the content and stamps survive a round trip."""
+    checked = []
+    data = ContentBundle.encode(stamps, content)
+    assert ContentBundle.decode(data, lambda s: checked.append(s) or True) == content
+    assert checked == [stamps]
+
+
+def test_it_should_reject_a_bundle_which_is_out_of_date():
+    """Make sure the content is not used once a data file changed."""
+    data = ContentBundle.encode(stamps, content)
+    result = ContentBundle.decode(data, lambda s: False)
+    assert result.message == "The content bundle is out of date."
+
+
+def test_it_should_reject_an_incomplete_bundle():
+    """Make sure a bundle too short to hold its header is reported."""
+    result = ContentBundle.decode(b"FORK", lambda s: True)
+    assert result.message == "The content bundle is incomplete."
+
+
+def test_it_should_reject_a_bundle_from_another_version():
+    """Make sure a bundle built by another version of the game is not read."""
+    data = bytearray(ContentBundle.encode(stamps, content))
+    data[len(ContentBundle.magic)] += 1
+    result = ContentBundle.decode(bytes(data), lambda s: True)
+    assert result.message == "The content bundle needs to be rebuilt."
@@ -0,0 +1,137 @@
+"""Test the linking of the names used by a game to what they name."""
+
+from common.game_objective import GameObjective
+from common.room import Room
+from game_repository.content_linker import ContentLinker
+from game_repository.game_repository import GameRepository
+from game_repository.item_manager import ItemManager
+from tests.test_helpers import make_item
+
+
+def make_room(name: str, exits: list[str], blockers: list[dict]) -> Room:
+    """Return a room with the given exits and blockers."""
+    return Room(
+        name=name,
+        description={"default": "A room."},
+        exits=exits,
+        directional_exits={"north": exits[0] if exits else None},
+        aliases=[],
+        inventory=[],
+        starting_inventory=[],
+        blockers=blockers,
+    )
+
+
+def test_it_should_link_the_game_data_without_problems():
+    """Make sure every name used by the game data refers to something."""
+    repository = GameRepository()
+    repository.load_default_state()
+    repository.try_load_game_state(new=True)
+    assert repository.link_problems == []
+    gum = repository.items.get_item_by_name("gum")
+    assert gum.links["chew"].transforms == [
+        (gum, repository.items.get_item_by_name("chewed gum"))
+    ]
+
+
+def test_it_should_link_items_to_the_items_they_name():
+    """Make sure each interaction refers to the items it names."""
+    key = make_item("key")
+    box = make_item("box")
+    chest = make_item(
+        "chest",
+        interactions={
+            "open": {
+                "requires": ["key"],
+                "discovers": ["box"],
+                "unlocks": ["box"],
+                "transforms": [{"from": "key", "to": None}],
+            }
+        },
+    )
+    items = ItemManager()
+    items.items = {item.name: item for item in [key, box, chest]}
+    assert ContentLinker(items, {}, {}).link() == []
+    links = chest.links["open"]
+    assert links.requires == [key]
+    assert links.discovers == [box]
+    assert links.unlocks == [box]
+    assert links.unhides == []
+    assert links.transforms == [(key, None)]
+
+
+def test_it_should_link_rooms_to_the_objectives_blocking_them():
+    """Make sure a room refers to the objectives which block it."""
+    objective = GameObjective("light", [], [], [])
+    room = make_room("hall", [], [{"name": "light", "message": "Too dark."}])
+    problems = ContentLinker(ItemManager(), {"hall": room}, {"light": objective}).link()
+    assert problems == []
+    assert room.blocking_objectives == [(objective, "Too dark.")]
+
+
+def test_it_should_report_every_broken_name_together():
+    """Make sure all names which refer to nothing are reported in one pass."""
+    chest = make_item(
+        "chest",
+        interactions={
+            "open": {
+                "requires": ["key"],
+                "transforms": [{"from": "chest", "to": "open chest"}],
+                "completes": ["escape"],
+            }
+        },
+    )
+    items = ItemManager()
+    items.items = {"chest": chest}
+    room = make_room("hall", ["garden"], [{"name": "light", "message": "Too dark."}])
+    problems = ContentLinker(items, {"hall": room}, {}).link()
+    assert problems == [
+        "The open interaction of chest refers to a missing objective, escape.",
+        "The open interaction of chest refers to a missing item, open chest.",
+        "The open interaction of chest refers to a missing item, key.",
+        "The room hall refers to a missing objective, light.",
+        "The room hall refers to a missing room, garden.",
+    ]
+    assert chest.links["open"].requires == [None]
+    assert chest.links["open"].transforms == [(chest, None)]
+    assert room.blocking_objectives == []
+
+
+def test_it_should_report_room_inventories_naming_missing_items():
+    """Make sure an item left out of a room because of a typo is reported."""
+    repository = GameRepository()
+    repository.items.items = {"lamp": make_item("lamp")}
+    repository.apply_room_state(
+        [
+            {
+                "name": "hall",
+                "description": {"default": "A room."},
+                "short_description": "A room.",
+                "exits": [],
+                "directional_exits": {},
+                "aliases": [],
+                "blockers": [],
+                "inventory": ["lamp", "lmap"],
+                "starting_inventory": ["lamp", "lmap"],
+            }
+        ]
+    )
+    repository.link_game()
+    assert repository.rooms["hall"].inventory_item_names == ["lamp"]
+    assert repository.link_problems == ["The room hall refers to a missing item, lmap."]
+
+
+def test_it_should_report_players_naming_missing_rooms_and_items():
+    """Make sure unknown rooms and items given to the player are reported."""
+    repository = GameRepository()
+    repository.items.items = {"lamp": make_item("lamp")}
+    repository.rooms = {"entry": make_room("entry", [], [])}
+    repository.apply_player_state(
+        {"name": "Player 1", "location": "attic", "inventory": ["lamp", "lmap"]}
+    )
+    repository.link_game()
+    assert repository.player.location.name == "entry"
+    assert repository.link_problems == [
+        "The player refers to a missing room, attic.",
+        "The player refers to a missing item, lmap.",
+    ]
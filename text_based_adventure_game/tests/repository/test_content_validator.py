@@ -0,0 +1,69 @@
+"""Test the checks made on the game data before it is compiled."""
+
+from game_repository.content_validator import ContentValidator
+from game_repository.file_manager import FileManager
+
+
+def new_game_states() -> list:
+    """Return the contents of the new game files."""
+    return [
+        FileManager.get_items_file(new=True),
+        FileManager.get_room_file(new=True),
+        FileManager.get_player_file(new=True),
+        FileManager.get_objectives_file(new=True),
+    ]
+
+
+def test_it_should_find_no_problems_in_the_game_data():
+    """Make sure the data files shipped with the game are consistent."""
+    assert ContentValidator(*new_game_states()).validate() == []
+
+
+def test_it_should_report_a_missing_item():
+    """Make sure a room holding an item which does not exist is reported."""
+    items, rooms, player, objectives = new_game_states()
+    rooms[0]["inventory"].append("ghost")
+    problems = ContentValidator(items, rooms, player, objectives).validate()
+    assert problems == [f"The room {rooms[0]['name']} refers to a missing item, ghost."]
+
+
+def test_it_should_report_a_missing_objective():
+    """Make sure an interaction completing an unknown objective is reported."""
+    items, rooms, player, objectives = new_game_states()
+    item = next(item for item in items if item["interactions"])
+    action, interaction = next(iter(item["interactions"].items()))
+    interaction["completes"] = ["win the lottery"]
+    problems = ContentValidator(items, rooms, player, objectives).validate()
+    assert problems == [
+        f"The {action} interaction of {item['name']} refers to a missing "
+        "objective, win the lottery."
+    ]
+
+
+def test_it_should_report_a_repeated_name():
+    """Make sure two items sharing a name are reported."""
+    items, rooms, player, objectives = new_game_states()
+    items.append(dict(items[0]))
+    problems = ContentValidator(items, rooms, player, objectives).validate()
+    assert problems == [f"There is more than one item named {items[0]['name']}."]
+
+
+def test_it_should_resolve_names_as_the_game_does():
+    """Make sure a name the game resolves by its alias or case is not reported."""
+    items, rooms, player, objectives = new_game_states()
+    room = next(room for room in rooms if room["aliases"])
+    rooms[0]["exits"].append(room["aliases"][0].upper())
+    rooms[0]["inventory"].append(player["inventory"][0].upper())
+    assert ContentValidator(items, rooms, player, objectives).validate() == []
+
+
+def test_it_should_report_where_the_player_cannot_be_placed():
+    """Make sure a player starting in an unknown room with unknown items is reported."""
+    items, rooms, player, objectives = new_game_states()
+    player["location"] = "attic"
+    player["inventory"].append("ghost")
+    problems = ContentValidator(items, rooms, player, objectives).validate()
+    assert problems == [
+        "The player refers to a missing room, attic.",
+        "The player refers to a missing item, ghost.",
+    ]
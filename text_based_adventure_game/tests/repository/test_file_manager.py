@@ -4,12 +4,9 @@ from unittest.mock import MagicMock, mock_open, patch
 
 import pytest
 
-from common.game_objective import GameObjective
-from common.item import Item
 from common.load_error import FileOperationError
-from common.player import Player
-from common.room import Room
 from game_repository.file_manager import FileManager
+from game_repository.save_file import SaveFile
 
 
 def exception_on_open(filename, mode) -> None:
@@ -17,63 +14,6 @@ def exception_on_open(filename, mode) -> None:
     raise Exception("File not found")
 
 
-def default_player() -> Player:
-    """A test player for testing."""
-    room = Room(
-        name="Test Room",
-        description={"test": "a test room"},
-        inventory=[],
-        starting_inventory=[],
-        exits=["Test Exit"],
-        directional_exits={},
-        aliases=["Test Alias"],
-        blockers=[],
-    )
-    player = Player(
-        name="Test Player",
-        location=room,
-        inventory=[],
-        visited_rooms=["Test Room"],
-        won=False,
-        watched_end_credits=False,
-    )
-    return player
-
-
-def default_rooms() -> dict[str, Room]:
-    """Return a default listing of rooms for testing."""
-    room = Room(
-        name="Test Room",
-        description={"test": "a test room"},
-        inventory=[],
-        starting_inventory=[],
-        exits=["Test Exit"],
-        directional_exits={},
-        aliases=["Test Alias"],
-        blockers=[],
-    )
-    return {"Test Room": room}
-
-
-def default_items() -> dict[str, Item]:
-    """Return a default listing of items for testing."""
-    item = Item(
-        name="Test Item",
-        alias=["Test Alias"],
-        description=["a test item"],
-        look_at_message={"line1": "a test item"},
-        is_collectible=True,
-        discovered=False,
-        interactions={},
-    )
-    return {"Test Item": item}
-
-
-def default_objectives() -> dict[str, GameObjective]:
-    objective = GameObjective("test", [], ["test requirements"], [])
-    return {"test": objective}
-
-
 def test_it_should_load_room_files():
     """Test to make sure it loads the room file."""
     with patch.object(builtins, "open", mock_open(read_data="[]")):
@@ -128,13 +68,22 @@ def test_it_should_load_the_language_file():
         )
 
 
-def test_it_should_load_the_game_stories_file():
-    """Test to make sure it can load the language file."""
-    with patch.object(builtins, "open", mock_open(read_data="[]")):
-        FileManager.load_game_stories()
-        builtins.open.assert_called_once_with(
-            FileManager.join_base_path(FileManager.stories_file), "r"
-        )
+def test_it_should_load_the_game_stories_file(tmp_path):
+    """Test to make sure it can load the game stories file."""
+    stories_file = tmp_path / "game_stories.json"
+    stories_file.write_text('{"title": ["a title"]}')
+    with patch.object(FileManager, "stories_file", str(stories_file)):
+        stories = FileManager.load_game_stories()
+    assert stories["title"] == ["a title"]
+
+
+def test_it_should_report_a_damaged_game_stories_file_when_it_is_loaded(tmp_path):
+    """Test to make sure a damaged stories file stops the game as it starts."""
+    stories_file = tmp_path / "game_stories.json"
+    stories_file.write_text('{"title": ["a title"]')
+    with patch.object(FileManager, "stories_file", str(stories_file)):
+        with pytest.raises(SystemExit):
+            FileManager.load_game_stories()
 
 
 def test_file_manager_language_file_handles_raises():
@@ -152,82 +101,6 @@ def test_file_manager_game_stories_handles_raises():
             FileManager.load_game_stories()
 
 
-def test_it_should_save_player_state():
-    """Test to make sure it can save player state."""
-    with patch.object(builtins, "open", mock_open()) as mock_file:
-        with patch.object(os, "makedirs", return_value=None) as mockdirs:
-            with patch.object(os.path, "exists", return_value=False) as mockexists:
-                FileManager.save_player_file(default_player())
-                mock_file.assert_called_once_with(
-                    FileManager.join_base_path(FileManager.saved_player_file), "w"
-                )
-                mockdirs.assert_called_once()
-                mockexists.assert_called_once()
-
-
-def test_it_should_handle_player_save_exceptions():
-    """Test to make sure exceptions are handled during player state saving."""
-    with patch.object(builtins, "open", exception_on_open):
-        assert FileManager.save_player_file(default_player()) == None
-
-
-def test_it_should_save_room_state():
-    """Test to make sure it can save room state."""
-    with patch.object(builtins, "open", mock_open()) as mock_file:
-        with patch.object(os, "makedirs", return_value=None) as mockdirs:
-            with patch.object(os.path, "exists", return_value=False) as mockexists:
-                FileManager.save_room_file(default_rooms())
-                mock_file.assert_called_once_with(
-                    FileManager.join_base_path(FileManager.saved_room_file), "w"
-                )
-                mockdirs.assert_called_once()
-                mockexists.assert_called_once()
-
-
-def test_it_should_handle_room_save_exceptions():
-    """Test to make sure it handles room saving exceptions."""
-    with patch.object(builtins, "open", exception_on_open):
-        assert FileManager.save_room_file(default_rooms()) == None
-
-
-def test_it_should_save_item_state():
-    """test to make sure it can save item state."""
-    with patch.object(builtins, "open", mock_open()) as mock_file:
-        with patch.object(os, "makedirs", return_value=None) as mockdirs:
-            with patch.object(os.path, "exists", return_value=False) as mockexists:
-                FileManager.save_items_file(default_items())
-                mock_file.assert_called_once_with(
-                    FileManager.join_base_path(FileManager.saved_items_file), "w"
-                )
-                mockdirs.assert_called_once()
-                mockexists.assert_called_once()
-
-
-def test_it_should_save_objectives_state():
-    """test to make sure it can save objective state."""
-    with patch.object(builtins, "open", mock_open()) as mock_file:
-        with patch.object(os, "makedirs", return_value=None) as mockdirs:
-            with patch.object(os.path, "exists", return_value=False) as mockexists:
-                FileManager.save_objectives_file(default_objectives())
-                mock_file.assert_called_once_with(
-                    FileManager.join_base_path(FileManager.saved_objectives_file), "w"
-                )
-                mockdirs.assert_called_once()
-                mockexists.assert_called_once()
-
-
-def test_it_should_handle_objective_save_exceptions():
-    """Test to make sure it handles item saving exceptions."""
-    with patch.object(builtins, "open", exception_on_open):
-        assert FileManager.save_objectives_file(default_objectives()) is None
-
-
-def test_it_should_handle_item_save_exceptions():
-    """Test to make sure it handles item saving exceptions."""
-    with patch.object(builtins, "open", exception_on_open):
-        assert FileManager.save_items_file(default_items()) is None
-
-
 def test_it_should_handle_player_file_exceptions():
     """Make sure the get_player_file method returns FileOperationError on exception."""
     with patch.object(builtins, "open", exception_on_open):
@@ -283,13 +156,22 @@ def test_it_should_read_from_the_save_objectives_file():
         )
 
 
-def test_it_should_load_the_game_map_file():
+def test_it_should_load_the_game_map_file(tmp_path):
     """Test to make sure it can load the map file."""
-    with patch.object(builtins, "open", mock_open(read_data="[]")):
-        FileManager.load_art()
-        builtins.open.assert_called_once_with(
-            FileManager.join_base_path(FileManager.game_art_file), "r"
-        )
+    art_file = tmp_path / "game_art.json"
+    art_file.write_text('{"game_map": ["a map"]}')
+    with patch.object(FileManager, "game_art_file", str(art_file)):
+        art = FileManager.load_art()
+    assert art["game_map"] == ["a map"]
+
+
+def test_it_should_report_a_damaged_game_map_file_when_it_is_loaded(tmp_path):
+    """Test to make sure a damaged art file stops the game as it starts."""
+    art_file = tmp_path / "game_art.json"
+    art_file.write_text('{"game_map": "a map')
+    with patch.object(FileManager, "game_art_file", str(art_file)):
+        with pytest.raises(SystemExit):
+            FileManager.load_art()
 
 
 def test_file_manager_game_map_handles_raises():
@@ -303,3 +185,141 @@ def test_join_base_path():
     """Test to make sure the join_base_path method works."""
     with patch.object(os.path, "abspath", return_value="C:/test1/test2/test3"):
         assert FileManager.join_base_path("test") == "C:/test1/test"
+
+
+def test_it_should_save_the_game_file(tmp_path):
+    """Test to make sure the game is saved in a single save file."""
+    saved_game_file = tmp_path / "save_data" / "game.sav"
+    with patch.object(FileManager, "saved_game_file", str(saved_game_file)):
+        assert FileManager.save_game_file({"player": {}}) is None
+    assert SaveFile.decode(saved_game_file.read_bytes()) == {"player": {}}
+    assert sorted(os.listdir(saved_game_file.parent)) == ["game.sav", "saves.jsonl"]
+
+
+def test_it_should_keep_the_old_save_when_a_save_fails(tmp_path):
+    """Test to make sure a failed save is reported and leaves the last save whole."""
+    saved_game_file = tmp_path / "game.sav"
+    with patch.object(FileManager, "saved_game_file", str(saved_game_file)):
+        FileManager.save_game_file({"player": {"name": "old"}})
+        with patch.object(os, "replace", side_effect=OSError("disk full")):
+            result = FileManager.save_game_file({"player": {"name": "new"}})
+    assert isinstance(result, FileOperationError)
+    assert result.message == FileManager.bad_operation_message("saving", "saved game")
+    assert SaveFile.decode(saved_game_file.read_bytes()) == {"player": {"name": "old"}}
+    assert sorted(os.listdir(tmp_path)) == ["game.sav", "saves.jsonl"]
+
+
+def test_it_should_give_saves_the_permissions_of_a_file_made_with_open(tmp_path):
+    """Test to make sure saving does not leave the files readable only by us."""
+    saved_game_file = tmp_path / "game.sav"
+    index_file = tmp_path / FileManager.save_index_name
+    with patch.object(FileManager, "saved_game_file", str(saved_game_file)):
+        FileManager.save_game_file({"player": {}})
+        assert FileManager.replace_save_index([{"slot": "game"}]) is None
+    for saved_file in [saved_game_file, index_file]:
+        assert saved_file.stat().st_mode & 0o777 == FileManager.new_file_mode
+
+
+def test_it_should_keep_the_permissions_of_a_replaced_save(tmp_path):
+    """Test to make sure saving again keeps the permissions the files were given."""
+    saved_game_file = tmp_path / "game.sav"
+    index_file = tmp_path / FileManager.save_index_name
+    with patch.object(FileManager, "saved_game_file", str(saved_game_file)):
+        FileManager.save_game_file({"player": {}})
+        os.chmod(saved_game_file, 0o640)
+        os.chmod(index_file, 0o604)
+        FileManager.save_game_file({"player": {"name": "new"}})
+        FileManager.replace_save_index([{"slot": "game"}])
+    assert saved_game_file.stat().st_mode & 0o777 == 0o640
+    assert index_file.stat().st_mode & 0o777 == 0o604
+
+
+def test_it_should_read_the_saved_game_file():
+    """Test to make sure the saved game is decoded from the save file."""
+    data = SaveFile.encode({"player": {"name": "Player"}})
+    with patch.object(builtins, "open", mock_open(read_data=data)):
+        assert FileManager.get_saved_game() == {"player": {"name": "Player"}}
+        builtins.open.assert_called_once_with(
+            FileManager.join_base_path(FileManager.saved_game_file), "rb"
+        )
+
+
+def test_it_should_handle_saved_game_file_exceptions():
+    """Test to make sure a missing save file is reported."""
+    with patch.object(builtins, "open", exception_on_open):
+        result = FileManager.get_saved_game()
+    assert isinstance(result, FileOperationError)
+
+
+def content_files(tmp_path) -> list[str]:
+    """Return the names of data files written to the temporary directory."""
+    file_names = []
+    for index, text in enumerate(['{"a": 1}', "[]"]):
+        data_file = tmp_path / f"data{index}.json"
+        data_file.write_text(text)
+        file_names.append(str(data_file))
+    return file_names
+
+
+def save_bundle(tmp_path, file_names: list[str]) -> None:
+    """Save a content bundle compiled from the data files."""
+    stamps = {
+        file_name: FileManager.stamp_content_file(file_name) for file_name in file_names
+    }
+    assert FileManager.save_content_bundle(stamps, {"items": []}) is None
+
+
+def test_it_should_load_the_content_bundle_while_it_is_current(tmp_path):
+    """Test to make sure the compiled content is used until a data file changes."""
+    file_names = content_files(tmp_path)
+    bundle_file = str(tmp_path / "content.bundle")
+    with patch.object(FileManager, "content_files", file_names):
+        with patch.object(FileManager, "content_bundle_file", bundle_file):
+            save_bundle(tmp_path, file_names)
+            assert FileManager.get_content_bundle() == {"items": []}
+            os.utime(file_names[0], ns=(0, 0))
+            assert FileManager.get_content_bundle() == {"items": []}
+            (tmp_path / "data0.json").write_text('{"a": 2}')
+            result = FileManager.get_content_bundle()
+    assert result.message == "The content bundle is out of date."
+
+
+def test_it_should_not_load_a_bundle_built_from_other_files(tmp_path):
+    """Test to make sure a bundle is not used once the list of data files changes."""
+    file_names = content_files(tmp_path)
+    bundle_file = str(tmp_path / "content.bundle")
+    with patch.object(FileManager, "content_bundle_file", bundle_file):
+        with patch.object(FileManager, "content_files", file_names[:1]):
+            save_bundle(tmp_path, file_names[:1])
+        with patch.object(FileManager, "content_files", file_names):
+            result = FileManager.get_content_bundle()
+    assert result.message == "The content bundle is out of date."
+
+
+def test_it_should_keep_the_old_bundle_when_building_one_fails(tmp_path):
+    """Test to make sure a failed build leaves the last bundle whole."""
+    file_names = content_files(tmp_path)
+    bundle_file = tmp_path / "content.bundle"
+    with patch.object(FileManager, "content_files", file_names):
+        with patch.object(FileManager, "content_bundle_file", str(bundle_file)):
+            save_bundle(tmp_path, file_names)
+            os.chmod(bundle_file, 0o640)
+            with patch.object(os, "replace", side_effect=OSError("disk full")):
+                result = FileManager.save_content_bundle({}, {"items": [1]})
+            assert FileManager.get_content_bundle() == {"items": []}
+            save_bundle(tmp_path, file_names)
+    assert isinstance(result, FileOperationError)
+    assert bundle_file.stat().st_mode & 0o777 == 0o640
+    assert sorted(os.listdir(tmp_path)) == [
+        "content.bundle",
+        "data0.json",
+        "data1.json",
+    ]
+
+
+def test_it_should_report_a_content_bundle_which_was_not_built(tmp_path):
+    """Test to make sure a missing bundle is reported rather than raised."""
+    bundle_file = str(tmp_path / "content.bundle")
+    with patch.object(FileManager, "content_bundle_file", bundle_file):
+        result = FileManager.get_content_bundle()
+    assert result.message == "The content bundle has not been built."
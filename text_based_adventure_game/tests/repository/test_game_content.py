@@ -0,0 +1,112 @@
+"""Test the shared game content."""
+
+from unittest.mock import patch
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.game_content import GameContent
+
+
+def loaded_content() -> GameContent:
+    """Return content loaded from the game data files."""
+    content = GameContent()
+    assert content.load() is None
+    return content
+
+
+def test_it_should_fail_to_load_when_a_file_is_missing():
+    """Make sure a missing new game file is reported."""
+    error = FileOperationError("oops")
+    missing = FileOperationError("missing")
+    with patch.object(FileManager, "get_content_bundle", return_value=missing):
+        with patch.object(FileManager, "get_room_file", return_value=error):
+            assert GameContent().load() == error
+
+
+def test_it_should_share_the_language_between_repositories():
+    """Make sure the read only content is loaded once and shared."""
+    content = loaded_content()
+    first = content.new_repository()
+    second = content.new_repository()
+    assert first.language is content.language
+    assert second.stories is content.stories
+    assert second.art_manager is content.art_manager
+    assert first.target_phrases is second.target_phrases
+
+
+def test_it_should_keep_game_state_separate_between_repositories():
+    """Make sure a change in one game does not show up in another."""
+    content = loaded_content()
+    first = content.new_repository()
+    second = content.new_repository()
+    assert first.items.items.keys() == second.items.items.keys()
+    assert first.player.location.name == second.player.location.name
+    room = first.player.location
+    item = room.inventory[0]
+    room.inventory.remove(item)
+    first.player.inventory.append(item)
+    objective = next(iter(first.objectives.objectives.values()))
+    objective.interactions[0]["complete"] = True
+    assert item.name in [other.name for other in second.player.location.inventory]
+    assert item.name not in [other.name for other in second.player.inventory]
+    other_objective = second.objectives.objectives[objective.name]
+    assert other_objective.interactions[0]["complete"] is False
+
+
+def test_it_should_start_a_new_game_in_an_existing_repository():
+    """Make sure starting over puts the player back where they began."""
+    content = loaded_content()
+    repository = content.new_repository()
+    start = repository.player.location.name
+    repository.move_player(next(iter(repository.room_neighbours[start].values())))
+    epoch = repository.world_epoch
+    content.start_new_game(repository)
+    assert repository.player.location.name == start
+    assert not repository.state_dirty
+    assert repository.world_epoch > epoch
+
+
+def test_it_should_not_change_the_template_during_play():
+    """Make sure playing a game leaves the new game world untouched."""
+    content = loaded_content()
+    repository = content.new_repository()
+    template = content.template
+    room = repository.player.location
+    item = room.inventory[0]
+    room.inventory.remove(item)
+    repository.player.inventory.append(item)
+    item.discovered = not item.discovered
+    repository.player.visited_rooms.append("somewhere")
+    template_item = template.items.items[item.name]
+    assert item is not template_item
+    assert template_item.discovered is not item.discovered
+    assert template_item in template.player.location.inventory
+    assert template_item not in template.player.inventory
+    assert "somewhere" not in template.player.visited_rooms
+
+
+def test_it_should_share_unchanging_item_data_with_the_template():
+    """Make sure a new game only copies the state that changes during play."""
+    content = loaded_content()
+    repository = content.new_repository()
+    for name, item in repository.items.items.items():
+        template_item = content.template.items.items[name]
+        assert item is not template_item
+        assert item.interactions is template_item.interactions
+        assert repository.items.item_index[name.lower()] is item
+
+
+def test_it_should_link_each_game_to_its_own_items():
+    """Make sure a new game follows links to its own items, not the template's."""
+    content = loaded_content()
+    repository = content.new_repository()
+    gum = repository.items.get_item_by_name("gum")
+    from_item, to_item = gum.links["chew"].transforms[0]
+    assert from_item is gum
+    assert to_item is repository.items.get_item_by_name("chewed gum")
+    blocked = next(
+        room for room in repository.rooms.values() if room.blocking_objectives
+    )
+    objective, _ = blocked.blocking_objectives[0]
+    assert objective is repository.objectives.objectives[objective.name]
+    assert repository.link_problems == []
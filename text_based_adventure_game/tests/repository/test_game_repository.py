@@ -1,5 +1,6 @@
 """Test the features of the game repository."""
 import builtins
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -13,6 +14,7 @@ from game_repository.file_manager import FileManager
 from game_repository.game_repository import GameRepository
 from game_repository.item_manager import ItemManager
 from game_repository.objectives_manager import ObjectiveManager
+from game_repository.save_state import SaveState
 from language.language_manager import LanguageManager
 from language.story_manager import StoryManager
 from tests.test_helpers import any_message_contents
@@ -326,6 +328,7 @@ def test_it_should_have_dirty_state_after_movement():
     repo.player = MagicMock(Player)
     repo.player.visited_rooms = []
     repo.player.location = MagicMock(Room)
+    repo.player.location.inventory = []
     repo.rooms = {
         "north": Room(
             name="north",
@@ -342,6 +345,23 @@ def test_it_should_have_dirty_state_after_movement():
     assert repo.state_dirty == True
 
 
+def test_it_should_advance_the_world_epoch_when_targets_could_change():
+    """Moving and changing items should make parsed targets out of date."""
+    repo = GameRepository()
+    repo.player = MagicMock(Player)
+    repo.player.visited_rooms = []
+    repo.player.location = MagicMock(Room)
+    repo.player.location.inventory = []
+    room = Room("north", {"test": "a room"}, [], {}, [], [], [], [])
+    epoch = repo.world_epoch
+    repo.move_player(room)
+    assert repo.world_epoch == epoch + 1
+    repo.mark_items_moved([])
+    repo.mark_items_changed([])
+    repo.invalidate_target_phrases()
+    assert repo.world_epoch == epoch + 4
+
+
 def test_it_should_load_state_when_load_game_state_called():
     """Test if the other load state methods are called when load_game_state is called."""
 
@@ -355,7 +375,8 @@ def test_it_should_load_state_when_load_game_state_called():
 
     repo.state_dirty = True
 
-    repo.try_load_game_state(new=False)
+    with patch.object(FileManager, "has_saved_game_file", return_value=False):
+        repo.try_load_game_state(new=False)
     repo.load_room_state.assert_called_once_with(new=False)
     repo.load_player_state.assert_called_once_with(new=False)
     repo.items.load_items.assert_called_once_with(new=False)
@@ -524,28 +545,147 @@ def test_it_should_return_entry_when_player_is_none():
     assert game_repo.current_location == game_repo.rooms["entry"]
 
 
-def test_it_should_save_game_state():
-    """Test to make sure the save_game_state method works."""
-    FileManager.save_player_file = MagicMock()
-    FileManager.save_room_file = MagicMock()
-    FileManager.save_items_file = MagicMock()
-    FileManager.save_objectives_file = MagicMock()
+def loaded_new_game() -> GameRepository:
+    """Return a repository holding a new game loaded from the game data files."""
     repo = GameRepository()
+    repo.try_load_game_state(new=True)
+    return repo
+
+
+def test_it_should_save_game_state():
+    """Test to make sure the save_game_state method saves the changes from a new game."""
+    repo = loaded_new_game()
+    flashlight = repo.items.get_item_by_name("flashlight")
+    flashlight.discovered = True
     repo.state_dirty = True
-    repo.save_game_state()
-    FileManager.save_player_file.assert_called_once()
-    FileManager.save_room_file.assert_called_once()
-    FileManager.save_items_file.assert_called_once()
-    FileManager.save_objectives_file.assert_called_once()
+    with patch.object(FileManager, "save_game_file", return_value=None) as save:
+        assert repo.save_game_state() is None
+        assert repo.finish_saving() is None
+    changes = save.call_args.args[0]
+    assert changes["items"] == {"flashlight": {"discovered": True}}
+    assert changes["rooms"] == {}
+    assert changes["objectives"] == {}
+    assert changes["player"]["location"] == repo.player.location.name
     assert repo.state_dirty == False
 
 
+def test_it_should_report_a_failed_save():
+    """Test to make sure a failed save is reported and the game is still unsaved."""
+    repo = loaded_new_game()
+    error = FileOperationError("a message")
+    with patch.object(FileManager, "save_game_file", return_value=error):
+        assert repo.save_game_state() is None
+        assert repo.finish_saving() == error
+    assert repo.state_dirty == True
+    assert repo.finish_saving() is None
+
+
+def test_it_should_report_a_failed_save_on_the_next_save():
+    """Test to make sure a save that failed in the background is not forgotten."""
+    repo = loaded_new_game()
+    error = FileOperationError("a message")
+    with patch.object(FileManager, "save_game_file", return_value=error):
+        repo.save_game_state()
+        repo.save_writer.pending.result()
+        assert repo.save_game_state() == error
+        repo.finish_saving()
+
+
+def test_it_should_not_wait_for_the_disk_when_saving():
+    """Test to make sure saving returns while the save file is still being written."""
+    repo = loaded_new_game()
+    written = threading.Event()
+    release = threading.Event()
+
+    def slow_save(state, slot, metadata):
+        release.wait(5)
+        written.set()
+
+    with patch.object(FileManager, "save_game_file", side_effect=slow_save):
+        assert repo.save_game_state() is None
+        assert not written.is_set()
+        release.set()
+        assert repo.finish_saving() is None
+    assert written.is_set()
+
+
+def test_it_should_load_a_saved_game():
+    """Test to make sure a saved game is restored on top of a new game."""
+    repo = loaded_new_game()
+    room = repo.player.location
+    item = room.inventory[0]
+    room.inventory.remove(item)
+    repo.player.inventory.append(item)
+    item.discovered = True
+    item.description = ["A changed description."]
+    objective = next(iter(repo.objectives.objectives.values()))
+    interaction = objective.interactions[0]
+    objective.complete_interaction_objective(
+        interaction["item"], interaction["interaction_type"]
+    )
+    with patch.object(FileManager, "save_game_file", return_value=None) as save:
+        repo.save_game_state()
+        repo.finish_saving()
+    saved_game = save.call_args.args[0]
+    loaded = GameRepository()
+    with patch.object(FileManager, "has_saved_game_file", return_value=True):
+        with patch.object(FileManager, "get_saved_game", return_value=saved_game):
+            result = loaded.try_load_game_state(new=False)
+    assert result.status == RequestStatus.SUCCESS
+    loaded_item = loaded.items.get_item_by_name(item.name)
+    assert loaded_item in loaded.player.inventory
+    assert loaded_item not in loaded.player.location.inventory
+    assert loaded_item.discovered == True
+    assert loaded_item.description == "A changed description."
+    loaded_objective = loaded.objectives.objectives[objective.name]
+    assert loaded_objective.interactions[0]["complete"] == True
+
+
+def test_it_should_save_and_load_named_slots(tmp_path):
+    """Test to make sure games saved in different slots are kept apart."""
+    repo = loaded_new_game()
+    item = repo.player.location.inventory[0]
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        assert repo.save_game_state() is None
+        repo.player.location.inventory.remove(item)
+        repo.player.inventory.append(item)
+        repo.state_dirty = True
+        assert repo.save_game_state("castle") is None
+        assert repo.finish_saving() is None
+        assert repo.save_slot == "castle"
+        metadata = FileManager.get_saved_game_metadata("castle")
+        loaded = GameRepository()
+        first = loaded.try_load_game_state(new=False)
+        first_inventory = [held.name for held in loaded.player.inventory]
+        second = loaded.try_load_game_state(new=False, slot="castle")
+        missing = loaded.try_load_game_state(new=False, slot="tower")
+    assert metadata["player"] == repo.player.name
+    assert metadata["location"] == repo.player.location.name
+    assert metadata["objectives"] == len(repo.objectives.objectives)
+    assert first.status == RequestStatus.SUCCESS
+    assert item.name not in first_inventory
+    assert second.status == RequestStatus.SUCCESS
+    assert item.name in [held.name for held in loaded.player.inventory]
+    assert loaded.save_slot == "castle"
+    assert any_message_contents(missing.messages, "There is no game saved as tower.")
+
+
+def test_it_should_not_load_a_damaged_saved_game():
+    """Test to make sure a save file without a player is reported."""
+    repo = GameRepository()
+    with patch.object(FileManager, "has_saved_game_file", return_value=True):
+        with patch.object(FileManager, "get_saved_game", return_value={}):
+            result = repo.try_load_game_state(new=False)
+    assert result.status == RequestStatus.FAILURE
+
+
 def test_it_should_return_file_operation_error_when_item_state_none():
     """Test to make sure that the try_load_game_state method returns FileOperationError when the item state is None."""
     error = FileOperationError("a message")
     with patch.object(ItemManager, "load_items", return_value=error):
         repo = GameRepository()
-        result = repo.try_load_game_state(False)
+        with patch.object(FileManager, "has_saved_game_file", return_value=False):
+            result = repo.try_load_game_state(False)
         assert any_message_contents(result.messages, error.message)
         assert result.status == RequestStatus.FAILURE
 
@@ -557,7 +697,8 @@ def test_it_should_return_file_operation_error_when_room_state_none():
         with patch.object(ItemManager, "load_items", return_value=None):
             repo = GameRepository()
             repo.items = MagicMock(ItemManager)
-            result = repo.try_load_game_state(False)
+            with patch.object(FileManager, "has_saved_game_file", return_value=False):
+                result = repo.try_load_game_state(False)
             assert any_message_contents(result.messages, error.message)
             assert result.status == RequestStatus.FAILURE
 
@@ -571,7 +712,10 @@ def test_it_should_return_file_operation_error_when_player_state_none():
             with patch.object(ItemManager, "load_items", return_value=None):
                 repo = GameRepository()
                 repo.items = MagicMock(ItemManager)
-                result = repo.try_load_game_state(False)
+                with patch.object(
+                    FileManager, "has_saved_game_file", return_value=False
+                ):
+                    result = repo.try_load_game_state(False)
                 assert any_message_contents(result.messages, error.message)
                 assert result.status == RequestStatus.FAILURE
 
@@ -586,7 +730,10 @@ def test_it_should_return_file_operation_error_when_objectives_state_none():
                 with patch.object(ItemManager, "load_items", return_value=None):
                     repo = GameRepository()
                     repo.items = MagicMock(ItemManager)
-                    result = repo.try_load_game_state(False)
+                    with patch.object(
+                        FileManager, "has_saved_game_file", return_value=False
+                    ):
+                        result = repo.try_load_game_state(False)
                     assert any_message_contents(result.messages, error.message)
                     assert result.status == RequestStatus.FAILURE
 
@@ -661,7 +808,8 @@ def test_it_should_return_file_operation_error_when_room_state_error():
         repo = GameRepository()
         repo.items = MagicMock(ItemManager)
         repo.items.load_items = MagicMock(return_value=None)
-        result = repo.try_load_game_state(False)
+        with patch.object(FileManager, "has_saved_game_file", return_value=False):
+            result = repo.try_load_game_state(False)
         assert any_message_contents(result.messages, error.message)
         assert result.status == RequestStatus.FAILURE
 
@@ -697,9 +845,11 @@ def test_it_should_load_state():
     repo.stories = MagicMock(StoryManager)
     repo.stories.load_stories = MagicMock()
     repo.art_manager.load_art = MagicMock()
-    repo.load_default_state()
+    missing = FileOperationError("missing")
+    with patch.object(FileManager, "get_content_bundle", return_value=missing):
+        repo.load_default_state()
     repo.language.load_language.assert_called_once()
-    repo.items.load_items.assert_called_once()
+    repo.items.load_items.assert_not_called()
     repo.stories.load_stories.assert_called_once()
     repo.art_manager.load_art.assert_called_once()
 
@@ -726,3 +876,192 @@ def test_find_target_should_find_room_targets_by_direction():
 
     result = repo.find_target("room", True)
     assert result == "room"
+
+
+def test_it_should_build_target_phrases_from_rooms_items_and_language():
+    """Test to make sure the target phrases include every resolvable name."""
+    repo = GameRepository()
+    repo.language.language = {"move_north": ["north", "up"], "look_requests": ["look"]}
+    repo.rooms = {
+        "wine cellar": Room(
+            name="wine cellar",
+            description={"test": "a test room"},
+            exits=[],
+            directional_exits={},
+            blockers=[],
+            aliases=["cellar"],
+            inventory=[],
+            starting_inventory=[],
+        )
+    }
+    repo.items.items = {
+        "key": Item(
+            name="key",
+            alias=["brass key"],
+            description=["a key"],
+            look_at_message={},
+            is_collectible=True,
+            discovered=False,
+            interactions={},
+        )
+    }
+    for phrase in ["north", "up", "look", "wine cellar", "cellar", "key", "brass key"]:
+        assert phrase in repo.target_phrases
+    assert "wine" not in repo.target_phrases
+
+
+def test_it_should_rebuild_target_phrases_after_loading():
+    """Test to make sure loading a game invalidates the target phrases."""
+    repo = GameRepository()
+    repo.items = MagicMock(ItemManager)
+    repo.items.load_items = MagicMock(return_value=None)
+    repo.items.items = {}
+    repo.objectives = MagicMock(ObjectiveManager)
+    repo.objectives.load_objectives = MagicMock(return_value=None)
+    repo.load_room_state = MagicMock(return_value=None)
+    repo.load_player_state = MagicMock(return_value=None)
+    assert "library" not in repo.target_phrases
+    repo.language.language = {"game_map": ["library"]}
+    assert "library" not in repo.target_phrases
+    repo.try_load_game_state(new=True)
+    assert "library" in repo.target_phrases
+
+
+def test_it_should_index_rooms_by_name_and_alias():
+    """Test to make sure rooms can be found by any name and connections are indexed."""
+    repo = GameRepository()
+    repo.rooms = {
+        "entry": Room(
+            name="entry",
+            description={"test": "a test room"},
+            exits=["parlor"],
+            directional_exits={"north": None, "south": "sitting room"},
+            blockers=[],
+            aliases=["foyer"],
+            inventory=[],
+            starting_inventory=[],
+        ),
+        "parlor": Room(
+            name="parlor",
+            description={"test": "a test room"},
+            exits=["entry"],
+            directional_exits={"north": "foyer"},
+            blockers=[],
+            aliases=["sitting room", "foyer"],
+            inventory=[],
+            starting_inventory=[],
+        ),
+    }
+    entry = repo.rooms["entry"]
+    parlor = repo.rooms["parlor"]
+    assert repo.get_room_by_name("Foyer") == entry
+    assert repo.get_room_by_name("sitting room") == parlor
+    assert repo.get_room_by_name(None) is None
+    assert repo.room_neighbours == {
+        "entry": {"south": parlor},
+        "parlor": {"north": entry},
+    }
+    assert repo.room_is_connected(entry, "parlor")
+    assert not repo.room_is_connected(entry, "sitting room")
+
+
+def test_it_should_return_none_when_no_room_in_direction():
+    """Test to make sure a missing directional exit does not find a room."""
+    repo = GameRepository()
+    room = Room(
+        name="room",
+        description={"test": "a test room"},
+        exits=[],
+        directional_exits={"north": None},
+        blockers=[],
+        aliases=[],
+        inventory=[],
+        starting_inventory=[],
+    )
+    repo.rooms = {"room": room}
+    repo.player = Player("player", room, [], [], False, False)
+    repo.language = MagicMock(LanguageManager)
+    repo.language.get_directional_alias = MagicMock(return_value="north")
+    assert repo.get_room_by_direction("north") is None
+    repo.language.get_directional_alias = MagicMock(return_value="west")
+    assert repo.get_room_by_direction("west") is None
+
+
+def test_it_should_invalidate_objectives_for_both_rooms_when_moving():
+    """Moving should refresh objectives that need items in either room."""
+    repo = GameRepository()
+    repo.objectives = MagicMock(ObjectiveManager)
+    fork = MagicMock(Item)
+    fork.name = "fork"
+    spoon = MagicMock(Item)
+    spoon.name = "spoon"
+    first = Room.default_room()
+    first.inventory = [fork]
+    second = Room.default_room()
+    second.inventory = [spoon]
+    repo.player.location = first
+    repo.move_player(second)
+    repo.objectives.invalidate_items.assert_called_once_with(["fork", "spoon"])
+    assert repo.state_dirty
+
+
+def bundled_content() -> dict:
+    """Return content laid out as it is in the content bundle."""
+    return {
+        "language": FileManager.load_language(),
+        "items": FileManager.get_items_file(new=True),
+        "rooms": FileManager.get_room_file(new=True),
+        "player": FileManager.get_player_file(new=True),
+        "objectives": FileManager.get_objectives_file(new=True),
+    }
+
+
+def test_it_should_build_the_same_new_game_from_the_content_bundle():
+    """Test to make sure a new game from the bundle matches one from the data files."""
+    from_files = GameRepository()
+    missing = FileOperationError("missing")
+    with patch.object(FileManager, "get_content_bundle", return_value=missing):
+        from_files.load_default_state()
+        from_files.try_load_game_state(new=True)
+    from_bundle = GameRepository()
+    with patch.object(
+        FileManager, "get_content_bundle", side_effect=lambda: bundled_content()
+    ):
+        from_bundle.load_default_state()
+        from_bundle.try_load_game_state(new=True)
+        assert from_bundle.use_content_bundle
+        assert from_bundle.get_new_game() is not from_bundle
+    assert from_bundle.language.language == from_files.language.language
+    changes = SaveState(
+        from_files.rooms, from_files.items.items, from_files.objectives.objectives
+    ).changes(
+        from_bundle.player,
+        from_bundle.rooms,
+        from_bundle.items.items,
+        from_bundle.objectives.objectives,
+    )
+    assert changes["items"] == changes["rooms"] == changes["objectives"] == {}
+    assert from_bundle.rooms.keys() == from_files.rooms.keys()
+    assert from_bundle.player.location.name == from_files.player.location.name
+
+
+def test_it_should_show_link_problems_in_development(capsys):
+    """Test to make sure names which refer to nothing are shown in development."""
+    repo = GameRepository(is_development=True)
+    repo.rooms = {
+        "hall": Room(
+            name="hall",
+            description={"default": "A hall."},
+            exits=["garden"],
+            directional_exits={},
+            aliases=[],
+            inventory=[],
+            starting_inventory=[],
+            blockers=[],
+        )
+    }
+    repo.link_game()
+    assert repo.link_problems == ["The room hall refers to a missing room, garden."]
+    assert (
+        capsys.readouterr().out == "The room hall refers to a missing room, garden.\n"
+    )
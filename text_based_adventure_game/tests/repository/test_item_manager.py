@@ -3,12 +3,14 @@
 import builtins
 from unittest.mock import MagicMock, patch
 
-from common.item import Item
+from common.inventory import Inventory
+from common.item import InteractionLinks, Item
 from common.load_error import FileOperationError
 from common.player import Player
 from common.room import Room
 from game_repository.file_manager import FileManager
 from game_repository.item_manager import ItemManager
+from tests.test_helpers import make_item
 
 
 def mock_item_helper(include_alias: bool = True):
@@ -88,7 +90,7 @@ def test_it_should_get_item_by_name():
 def test_it_should_get_item_by_name_by_room():
     """Test for getting an item by name or alias based on inventory or room inventory"""
     items = mock_item_helper(True)
-    inventory = [items.get("test")]
+    inventory = Inventory([items.get("test")])
     player = MagicMock(Player)
     player.inventory = inventory
     manager = ItemManager()
@@ -96,7 +98,7 @@ def test_it_should_get_item_by_name_by_room():
     assert response is not None
     assert response == inventory[0]
 
-    player.inventory = []
+    player.inventory = Inventory()
     player.location = MagicMock(Room)
     player.location.inventory = inventory
     response = manager.get_item_by_name_by_room("test", player)
@@ -104,13 +106,13 @@ def test_it_should_get_item_by_name_by_room():
     assert response == inventory[0]
 
     items = mock_item_helper(False)
-    inventory = [items.get("test")]
+    inventory = Inventory([items.get("test")])
     player.inventory = inventory
     response = manager.get_item_by_name_by_room("test", player)
     assert response is not None
     assert response == inventory[0]
 
-    player.inventory = []
+    player.inventory = Inventory()
     player.location = MagicMock(Room)
     player.location.inventory = inventory
     response = manager.get_item_by_name_by_room("test", player)
@@ -130,3 +132,68 @@ def test_get_list_of_items():
     response = manager.get_list_of_items(item_names)
     assert len(response) == 1
     assert response[0] == item
+
+
+def test_it_should_get_item_by_name_ignoring_case():
+    """Test to make sure lookups by name or alias ignore case."""
+    key = make_item("brass key", ["Key"])
+    manager = ItemManager()
+    manager.items = {key.name: key}
+    assert manager.get_item_by_name("BRASS KEY") == key
+    assert manager.get_item_by_name("key") == key
+    assert manager.get_item_by_name("lock") is None
+    assert manager.get_item_by_name(None) is None
+
+
+def test_it_should_detect_alias_collisions():
+    """Test to make sure shared aliases resolve to the first item and are reported."""
+    bench = make_item("bench", ["seat", "chair"])
+    toilet = make_item("toilet", ["seat", "seat"])
+    chairs = make_item("chairs", ["seats"])
+    manager = ItemManager()
+    manager.items = {"bench": bench, "toilet": toilet, "chairs": chairs}
+    assert manager.get_item_by_name("seat") == bench
+    assert manager.alias_collisions == {"seat": ["bench", "toilet"]}
+
+
+def test_it_should_index_added_items():
+    """Test to make sure added and replaced items are kept in the index."""
+    manager = ItemManager()
+    manager.add_item(make_item("key", ["skeleton key"]))
+    assert manager.get_item_by_name("skeleton key") == manager.items["key"]
+    replacement = make_item("key", ["rusty key"])
+    manager.add_item(replacement)
+    assert manager.get_item_by_name("rusty key") == replacement
+    assert manager.get_item_by_name("skeleton key") is None
+    assert manager.items == {"key": replacement}
+
+
+def test_it_should_copy_items_and_index():
+    """Test to make sure a copied manager indexes its own copies of the items."""
+    bench = make_item("bench", ["seat"])
+    toilet = make_item("toilet", ["seat"])
+    manager = ItemManager()
+    manager.items = {"bench": bench, "toilet": toilet}
+    copied = manager.copy()
+    assert copied.items["bench"] is not bench
+    assert copied.get_item_by_name("seat") is copied.items["bench"]
+    copied.add_item(make_item("chair", ["seat"]))
+    assert manager.alias_collisions == {"seat": ["bench", "toilet"]}
+
+
+def test_it_should_link_copied_items_to_the_other_copies():
+    """Test to make sure the links of copied items refer to the copies."""
+    bench = make_item("bench", [])
+    toilet = make_item("toilet", [])
+    bench.links = {
+        "sit": InteractionLinks(requires=[toilet, None], transforms=[(bench, None)]),
+        "look": InteractionLinks(),
+    }
+    manager = ItemManager()
+    manager.items = {"bench": bench, "toilet": toilet}
+    copied = manager.copy()
+    links = copied.items["bench"].links
+    assert links["sit"].requires == [copied.items["toilet"], None]
+    assert links["sit"].transforms == [(copied.items["bench"], None)]
+    assert links["look"] is bench.links["look"]
+    assert bench.links["sit"].requires == [toilet, None]
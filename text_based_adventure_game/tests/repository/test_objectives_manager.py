@@ -3,11 +3,14 @@
 from unittest.mock import MagicMock, patch
 
 from common.game_objective import GameObjective
+from common.inventory import Inventory
 from common.item import Item
 from common.load_error import FileOperationError
 from common.player import Player
+from common.room import Room
 from game_repository.file_manager import FileManager
 from game_repository.objectives_manager import ObjectiveManager
+from tests.test_helpers import make_item
 
 
 def test_it_should_not_load_objectives_when_failure():
@@ -101,3 +104,122 @@ def test_it_should_tell_not_all_objectives_complete():
     manager = ObjectiveManager()
     manager.objectives = {"test": objective}
     assert not manager.all_objectives_complete(player)
+
+
+def make_room(names: list[str]) -> MagicMock:
+    """Return a room holding items which cannot be taken, with the given names."""
+    room = MagicMock(Room)
+    room.inventory = Inventory(make_item(name) for name in names)
+    for item in room.inventory:
+        item.is_collectible = False
+    return room
+
+
+def test_it_should_only_evaluate_changed_objectives():
+    """Make sure completed objectives are not evaluated again on every check."""
+    player = MagicMock(Player)
+    player.inventory = Inventory()
+    player.location = make_room(["fork"])
+    fork = GameObjective("fork", [], ["fork"], [])
+    spoon = GameObjective("spoon", [], ["spoon"], [])
+    manager = ObjectiveManager()
+    manager.objectives = {"fork": fork, "spoon": spoon}
+    assert not manager.all_objectives_complete(player)
+    fork.evaluate = MagicMock(return_value=True)
+    spoon.evaluate = MagicMock(return_value=True)
+    manager.invalidate_items(["spoon"])
+    assert manager.all_objectives_complete(player)
+    fork.evaluate.assert_not_called()
+    spoon.evaluate.assert_called_once_with(player)
+
+
+def test_it_should_invalidate_objectives_that_require_moved_items():
+    """Make sure moving a required item out of reach is noticed."""
+    player = MagicMock(Player)
+    player.inventory = Inventory()
+    room = make_room(["fork"])
+    player.location = room
+    objective = GameObjective("fork", [], ["fork"], [])
+    manager = ObjectiveManager()
+    manager.objectives = {"fork": objective}
+    assert manager.all_objectives_complete(player)
+    room.inventory = Inventory()
+    assert manager.all_objectives_complete(player)
+    manager.invalidate_items(["fork"])
+    assert not manager.all_objectives_complete(player)
+
+
+def test_it_should_invalidate_objectives_after_interactions():
+    """Make sure a completed interaction is picked up by the next check."""
+    player = MagicMock(Player)
+    player.inventory = Inventory()
+    interactions = [{"interaction_type": "use", "item": "fork", "complete": False}]
+    objective = GameObjective("fork", [], [], interactions)
+    manager = ObjectiveManager()
+    manager.objectives = {"fork": objective}
+    assert not manager.all_objectives_complete(player)
+    interactions[0]["complete"] = True
+    manager.invalidate_objective(objective)
+    assert manager.all_objectives_complete(player)
+
+
+def test_it_should_index_objectives_by_requirement():
+    """Make sure each required item points at the objectives needing it."""
+    first = GameObjective("first", [], ["fork", "fork", "spoon"], [])
+    second = GameObjective("second", [], ["fork"], [])
+    manager = ObjectiveManager()
+    manager.objectives = {"first": first, "second": second}
+    assert manager.requirement_index == {"fork": [first, second], "spoon": [first]}
+
+
+def test_it_should_find_related_objectives_from_the_interaction_index():
+    """Test to make sure only objectives with a matching item and action are found."""
+    item = MagicMock(Item)
+    item.name = "fork"
+    use_fork = GameObjective(
+        "use fork",
+        [],
+        [],
+        [
+            {"interaction_type": "use", "item": "fork", "complete": False},
+            {"interaction_type": "use", "item": "fork", "complete": False},
+        ],
+    )
+    eat_fork = GameObjective(
+        "eat fork", [], [], [{"interaction_type": "eat", "item": "fork"}]
+    )
+    manager = ObjectiveManager()
+    manager.objectives = {"use fork": use_fork, "eat fork": eat_fork}
+    assert manager.find_related_objectives(item, "use") == [use_fork]
+    assert manager.find_related_objectives(item, "throw") == []
+    item.name = "spoon"
+    assert manager.find_related_objectives(item, "use") == []
+
+
+def test_it_should_rebuild_the_interaction_index_when_objectives_change():
+    """Test to make sure replacing the objectives replaces the index."""
+    item = MagicMock(Item)
+    item.name = "fork"
+    interactions = [{"interaction_type": "use", "item": "fork", "complete": False}]
+    manager = ObjectiveManager()
+    manager.objectives = {"old": GameObjective("old", [], [], interactions)}
+    assert manager.find_related_objectives(item, "use")[0].name == "old"
+    manager.objectives = {"new": GameObjective("new", [], [], interactions)}
+    assert manager.find_related_objectives(item, "use")[0].name == "new"
+
+
+def test_it_should_copy_objectives_and_indexes():
+    """Make sure a copied manager indexes its own copies of the objectives."""
+    objective = GameObjective(
+        "lamp",
+        [],
+        ["lamp"],
+        [{"interaction_type": "turn on", "item": "lamp", "complete": False}],
+    )
+    manager = ObjectiveManager()
+    manager.objectives = {"lamp": objective}
+    copied = manager.copy()
+    copy = copied.objectives["lamp"]
+    assert copy is not objective
+    assert copied.requirement_index == {"lamp": [copy]}
+    assert copied.find_related_objectives(make_item("lamp"), "turn on") == [copy]
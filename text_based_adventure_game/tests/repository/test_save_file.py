@@ -0,0 +1,62 @@
+"""Test the save file format."""
+
+from common.load_error import FileOperationError
+from game_repository.save_file import SaveFile
+
+
+def test_it_should_decode_what_it_encodes():
+    """Make sure a saved state is read back unchanged."""
+    state = {"player": {"name": "Player 1"}, "items": {"fork": {"hidden": False}}}
+    assert SaveFile.decode(SaveFile.encode(state)) == state
+
+
+def test_it_should_start_with_a_header():
+    """Make sure the file starts with the magic number and version."""
+    data = SaveFile.encode({})
+    magic, version, _, metadata_length, length = SaveFile.header.unpack_from(data)
+    assert magic == SaveFile.magic
+    assert version == SaveFile.version
+    assert length == len(data) - SaveFile.header.size - metadata_length
+
+
+def test_it_should_reject_damaged_files():
+    """Make sure a changed byte is caught by the checksum."""
+    data = bytearray(SaveFile.encode({"player": {"name": "Player 1"}}))
+    data[-3] = ord("X")
+    result = SaveFile.decode(bytes(data))
+    assert isinstance(result, FileOperationError)
+    assert result.message == "The saved game file is damaged."
+
+
+def test_it_should_reject_truncated_files():
+    """Make sure a partly written file is not loaded."""
+    data = SaveFile.encode({"player": {"name": "Player 1"}})
+    assert isinstance(SaveFile.decode(data[:-1]), FileOperationError)
+    assert isinstance(SaveFile.decode(data[:4]), FileOperationError)
+
+
+def test_it_should_reject_other_files_and_versions():
+    """Make sure files from elsewhere or another version are not loaded."""
+    data = SaveFile.encode({})
+    assert isinstance(SaveFile.decode(b"{}" + data), FileOperationError)
+    other_version = SaveFile.header.pack(SaveFile.magic, SaveFile.version + 1, 0, 0, 0)
+    result = SaveFile.decode(other_version)
+    assert result.message == (
+        "The saved game was made by a different version of the game."
+    )
+
+
+def test_it_should_hold_metadata_before_the_state():
+    """Make sure the metadata can be read from the start of the file alone."""
+    metadata = {"player": "Player 1", "location": "Kitchen"}
+    data = SaveFile.encode({"player": {"name": "Player 1"}}, metadata)
+    metadata_end = SaveFile.metadata_end(data[: SaveFile.header.size])
+    assert SaveFile.decode_metadata(data[:metadata_end]) == metadata
+    assert SaveFile.decode(data) == {"player": {"name": "Player 1"}}
+
+
+def test_it_should_reject_damaged_metadata():
+    """Make sure a changed byte in the metadata is caught by the checksum."""
+    data = bytearray(SaveFile.encode({}, {"player": "Player 1"}))
+    data[SaveFile.header.size + 3] = ord("X")
+    assert isinstance(SaveFile.decode(bytes(data)), FileOperationError)
@@ -0,0 +1,71 @@
+"""Test the index of the slots games are saved in."""
+
+import os
+from unittest.mock import patch
+
+from game_repository.file_manager import FileManager
+from game_repository.save_file import SaveFile
+from game_repository.save_slots import SaveSlots
+
+
+def save(slot: str, saved_at: float) -> None:
+    """Save a small game in a slot, as if it was saved at the time."""
+    metadata = {"player": slot.title(), "location": "Kitchen", "saved_at": saved_at}
+    assert FileManager.save_game_file({"player": {}}, slot, metadata) is None
+
+
+def test_it_should_name_slots_from_what_the_player_types():
+    """Make sure the names players give become the names of save files."""
+    assert SaveSlots.slot_name("My Castle") == "my_castle"
+    assert SaveSlots.slot_name("game-2") == "game-2"
+    assert SaveSlots.slot_name("../game") is None
+    assert SaveSlots.slot_name("") is None
+
+
+def test_it_should_list_slots_from_the_index_alone(tmp_path):
+    """Make sure the slots are listed without reading any save file."""
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        save("castle", 1)
+        save("game", 3)
+        save("tower", 2)
+        with patch.object(SaveFile, "decode_metadata") as decode_metadata:
+            slots = SaveSlots.list_slots()
+        decode_metadata.assert_not_called()
+        assert SaveSlots.most_recent_slot() == "game"
+    assert [slot["slot"] for slot in slots] == ["game", "tower", "castle"]
+    assert slots[2]["player"] == "Castle"
+    assert slots[2]["size"] == os.path.getsize(tmp_path / "castle.sav")
+
+
+def test_it_should_rebuild_a_missing_index_from_the_save_files(tmp_path):
+    """Make sure the index is rebuilt from the metadata of each save file."""
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        save("castle", 1)
+        save("tower", 2)
+        os.remove(tmp_path / FileManager.save_index_name)
+        slots = SaveSlots.list_slots()
+        assert os.path.exists(tmp_path / FileManager.save_index_name)
+    assert [slot["slot"] for slot in slots] == ["tower", "castle"]
+    assert slots[0]["location"] == "Kitchen"
+
+
+def test_it_should_drop_old_lines_from_the_index(tmp_path):
+    """Make sure saving one slot many times does not keep growing the index."""
+    index_file = tmp_path / FileManager.save_index_name
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        for saved_at in range(50):
+            save("castle", saved_at)
+        assert len(index_file.read_text().splitlines()) == 50
+        slots = SaveSlots.list_slots()
+    assert len(index_file.read_text().splitlines()) == 1
+    assert slots[0]["saved_at"] == 49
+
+
+def test_it_should_skip_partly_written_index_lines(tmp_path):
+    """Make sure a line cut off when the game stopped does not hide the others."""
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        save("castle", 1)
+        with open(tmp_path / FileManager.save_index_name, "a") as index_file:
+            index_file.write('{"slot":"tow')
+        slots = SaveSlots.list_slots()
+    assert [slot["slot"] for slot in slots] == ["castle"]
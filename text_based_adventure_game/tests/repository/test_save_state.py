@@ -0,0 +1,76 @@
+"""Test the changes recorded for saved games."""
+
+import random
+from unittest.mock import patch
+
+from ForkOff import AdventureGame
+from game_repository.autosave_policy import AutosavePolicy
+from game_repository.file_manager import FileManager
+from game_repository.game_content import GameContent
+
+verbs = ["take", "drop", "look at", "use", "turn on", "eat", "feed", "open", "unlock"]
+directions = ["north", "south", "east", "west", "up", "down"]
+
+
+def random_command(game: AdventureGame, generator: random.Random) -> str:
+    """Return a random command, usually one the items around the player support."""
+    repository = game.game_repository
+    nearby = [*repository.current_location.inventory, *repository.player.inventory]
+    if generator.random() < 0.25 or len(nearby) == 0:
+        return f"go {generator.choice(directions)}"
+    if generator.random() < 0.3:
+        item = generator.choice(list(repository.items.items.values()))
+        return f"{generator.choice(verbs)} {item.name}"
+    item = generator.choice(nearby)
+    actions = list(item.interactions.keys()) + ["take", "drop"]
+    action = generator.choice(actions)
+    if action == "use_with":
+        return f"use {item.name} with {generator.choice(nearby).name}"
+    return f"{action} {item.name}"
+
+
+def test_it_should_track_the_same_changes_as_comparing_everything():
+    """Make sure saving only tracked changes matches comparing the whole game."""
+    content = GameContent()
+    content.load()
+    game = AdventureGame().initialize_game_with_repository(content.new_repository())
+    repository = game.game_repository
+    generator = random.Random(7)
+    with patch.object(FileManager, "save_game_file", return_value=None) as save:
+        for turn in range(600):
+            game.run_command(random_command(game, generator))
+            if turn % 5 == 0:
+                repository.save_game_state()
+                repository.finish_saving()
+                save_state = repository._save_state
+                assert save.call_args.args[0] == save_state.changes(
+                    repository.player,
+                    repository.rooms,
+                    repository.items.items,
+                    repository.objectives.objectives,
+                )
+    assert len(save.call_args.args[0]["items"]) > 0
+    assert len(save.call_args.args[0]["rooms"]) > 0
+
+
+def test_it_should_save_every_few_turns_with_an_autosave_policy():
+    """Make sure the autosave policy saves only after changes."""
+    content = GameContent()
+    content.load()
+    game = AdventureGame().initialize_game_with_repository(content.new_repository())
+    repository = game.game_repository
+    repository.autosave = AutosavePolicy(turns=2)
+    with patch.object(FileManager, "save_game_file", return_value=None) as save:
+        game.run_command("look")
+        game.end_turn()
+        game.run_command("look")
+        game.end_turn()
+        assert repository.finish_saving() is None
+        save.assert_not_called()
+        game.run_command("take flashlight")
+        game.end_turn()
+        game.run_command("look")
+        game.end_turn()
+        assert repository.finish_saving() is None
+        save.assert_called_once()
+    assert not repository.state_dirty
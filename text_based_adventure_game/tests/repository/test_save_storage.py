@@ -0,0 +1,119 @@
+"""Test the storages which saved games can be kept in."""
+
+from unittest.mock import patch
+
+import pytest
+
+from common.load_error import FileOperationError
+from common.request_status import RequestStatus
+from game_repository.file_manager import FileManager
+from game_repository.game_repository import GameRepository
+from game_repository.memory_save_storage import MemorySaveStorage
+from game_repository.save_storage import FileSaveStorage, SaveStorage
+from game_repository.sqlite_save_storage import SqliteSaveStorage
+from tests.test_helpers import any_message_contents
+
+
+def storages(tmp_path) -> list[SaveStorage]:
+    """Return one of each storage, keeping anything written in the directory."""
+    return [
+        FileSaveStorage(),
+        MemorySaveStorage(),
+        SqliteSaveStorage(str(tmp_path / "saves.db")),
+    ]
+
+
+def test_every_storage_should_keep_saved_games(tmp_path):
+    """Make sure each storage loads what was saved in each slot."""
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        for storage in storages(tmp_path):
+            assert not storage.has_any_saved_game()
+            assert storage.save_game({"player": {"name": "A"}}, "castle") is None
+            assert storage.save_game({"player": {"name": "B"}}, "tower") is None
+            assert storage.save_game({"player": {"name": "C"}}, "castle") is None
+            assert storage.has_saved_game("castle")
+            assert not storage.has_saved_game("cellar")
+            assert storage.get_saved_game("castle") == {"player": {"name": "C"}}
+            assert isinstance(storage.get_saved_game("cellar"), FileOperationError)
+            assert {slot["slot"] for slot in storage.list_slots()} == {
+                "castle",
+                "tower",
+            }
+
+
+def test_every_storage_should_list_the_most_recent_save_first(tmp_path):
+    """Make sure each storage orders the slots by when they were saved."""
+    with patch.object(FileManager, "saved_game_file", str(tmp_path / "game.sav")):
+        for storage in storages(tmp_path):
+            storage.save_games(
+                [
+                    ({}, "castle", {"player": "A", "saved_at": 1}),
+                    ({}, "tower", {"player": "B", "saved_at": 3}),
+                    ({}, "cellar", {"player": "C", "saved_at": 2}),
+                ]
+            )
+            slots = storage.list_slots()
+            assert [slot["slot"] for slot in slots] == ["tower", "cellar", "castle"]
+            assert slots[0]["player"] == "B"
+            assert slots[0]["size"] > 0
+            assert storage.most_recent_slot() == "tower"
+
+
+def test_the_sqlite_storage_should_keep_games_once_it_is_reopened(tmp_path):
+    """Make sure games saved in the database outlive the connection."""
+    database = str(tmp_path / "saves.db")
+    storage = SqliteSaveStorage(database)
+    storage.save_game({"player": {"name": "A"}}, "castle")
+    storage.close()
+    assert SqliteSaveStorage(database).get_saved_game("castle") == {
+        "player": {"name": "A"}
+    }
+
+
+def test_the_sqlite_storage_should_report_failed_saves(tmp_path):
+    """Make sure a save that could not be written is reported."""
+    storage = SqliteSaveStorage(str(tmp_path / "saves.db"))
+    storage.close()
+    result = storage.save_game({}, "castle")
+    assert isinstance(result, FileOperationError)
+    assert result.message == FileManager.bad_operation_message("saving", "saved game")
+
+
+def test_a_game_should_be_saved_and_loaded_through_its_storage():
+    """Make sure the game repository saves and loads games with its storage."""
+    storage = MemorySaveStorage()
+    repo = GameRepository(storage=storage)
+    repo.try_load_game_state(new=True)
+    item = repo.player.location.inventory[0]
+    repo.player.location.inventory.remove(item)
+    repo.player.inventory.append(item)
+    assert repo.save_game_state("castle") is None
+    assert repo.finish_saving() is None
+    loaded = GameRepository(storage=storage)
+    result = loaded.try_load_game_state(new=False, slot="castle")
+    assert result.status == RequestStatus.SUCCESS
+    assert item.name in [held.name for held in loaded.player.inventory]
+    assert storage.list_slots()[0]["player"] == repo.player.name
+
+
+def test_only_the_file_storage_should_load_games_from_the_older_json_files():
+    """Make sure another storage without a saved game does not read the files."""
+    repo = GameRepository(storage=MemorySaveStorage())
+    with patch.object(GameRepository, "load_game_files") as load_game_files:
+        result = repo.try_load_game_state(new=False)
+    assert result.status == RequestStatus.FAILURE
+    assert any_message_contents(
+        result.messages, f"There is no game saved as {FileManager.default_save_slot}."
+    )
+    load_game_files.assert_not_called()
+
+
+def test_a_storage_must_say_where_it_keeps_saved_games():
+    """Make sure a storage missing a way to save or load cannot be made."""
+
+    class ListingStorage(SaveStorage):
+        def list_slots(self: "ListingStorage") -> list[dict]:
+            return []
+
+    with pytest.raises(TypeError):
+        ListingStorage()  # type: ignore[abstract]
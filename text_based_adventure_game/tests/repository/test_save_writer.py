@@ -0,0 +1,49 @@
+"""Test the background save writer."""
+
+from unittest.mock import patch
+
+from common.load_error import FileOperationError
+from game_repository.file_manager import FileManager
+from game_repository.memory_save_storage import MemorySaveStorage
+from game_repository.save_storage import FileSaveStorage
+from game_repository.save_writer import SaveWriter
+
+
+def test_it_should_write_saves_in_order():
+    """Make sure queued saves are written one after another in the order given."""
+    written = []
+    writer = SaveWriter(FileSaveStorage())
+
+    def save_game_file(state, slot, metadata):
+        written.append(state)
+
+    with patch.object(FileManager, "save_game_file", side_effect=save_game_file):
+        for number in range(5):
+            writer.submit({"number": number})
+        assert writer.flush() is None
+    assert written == [{"number": number} for number in range(5)]
+
+
+def test_it_should_keep_errors_until_they_are_taken():
+    """Make sure an unexpected exception while saving becomes an error."""
+    writer = SaveWriter(FileSaveStorage())
+    with patch.object(FileManager, "save_game_file", side_effect=OSError("oops")):
+        writer.submit({})
+        error = writer.flush()
+    assert isinstance(error, FileOperationError)
+    assert writer.take_error() is None
+
+
+def test_it_should_flush_when_nothing_was_saved():
+    """Make sure waiting without any saves does nothing."""
+    assert SaveWriter(FileSaveStorage()).flush() is None
+
+
+def test_it_should_write_to_its_storage():
+    """Make sure saves are written to the storage the writer was given."""
+    storage = MemorySaveStorage()
+    writer = SaveWriter(storage)
+    writer.submit({"player": {}}, "castle", {"player": "Player 1"})
+    assert writer.flush() is None
+    assert storage.get_saved_game("castle") == {"player": {}}
+    assert storage.list_slots()[0]["player"] == "Player 1"
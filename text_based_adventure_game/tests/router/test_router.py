@@ -2,16 +2,23 @@
 
 from unittest.mock import MagicMock
 
+import pytest
+
 from common.controller_type import ControllerType
 from common.game_request import GameRequest
 from common.game_response import GameResponse
 from common.request_status import RequestStatus
 from common.request_type import RequestType
+from common.service_type import ServiceType
 from controllers.game_controller import GameController
 from controllers.interaction_controller import InteractionController
 from controllers.inventory_controller import InventoryController
 from controllers.movement_controller import MovementController
 from router.router import Router
+from services.game_service import GameService
+from services.interaction_service import InteractionService
+from services.inventory_service import InventoryService
+from services.movement_service import MovementService
 from tests.test_helpers import any_message_contents
 
 
@@ -41,26 +48,22 @@ def get_default_controllers(
         RequestType.PULL,
         RequestType.USE,
     ]
-    if controller_type == ControllerType.MOVEMENT:
-        movement_controller.route = MagicMock(
-            name="move", return_value=expected_response
-        )
-    elif controller_type == ControllerType.GAME:
-        game_controller.route = MagicMock(name="route", return_value=expected_response)
-    elif controller_type == ControllerType.INVENTORY:
-        inventory_controller.route = MagicMock(
-            name="route", return_value=expected_response
-        )
-    else:
-        interaction_controller.route = MagicMock(
-            name="route", return_value=expected_response
-        )
-    return {
+    controllers = {
         ControllerType.MOVEMENT: movement_controller,
         ControllerType.GAME: game_controller,
         ControllerType.INVENTORY: inventory_controller,
         ControllerType.INTERACTION: interaction_controller,
     }
+    for kind, controller in controllers.items():
+        # A single handler stands in for the service methods of each controller.
+        controller.handler = MagicMock(name="handler")
+        if kind == controller_type:
+            controller.handler.return_value = expected_response
+        controller.handlers.return_value = {
+            request_type: controller.handler
+            for request_type in controller.request_types
+        }
+    return controllers
 
 
 def test_router_can_handle_movement():
@@ -73,7 +76,7 @@ def test_router_can_handle_movement():
     response = router.route(request)
     assert any_message_contents(response.messages, "Moved north")
     assert response.status == expected_response.status
-    controllers[ControllerType.MOVEMENT].route.assert_called_once_with(request)
+    controllers[ControllerType.MOVEMENT].handler.assert_called_once_with(request)
 
 
 def test_router_can_handle_exit():
@@ -85,7 +88,7 @@ def test_router_can_handle_exit():
     response = router.route(request)
     assert any_message_contents(response.messages, "Goodbye")
     assert response.status == expected_response.status
-    controllers[ControllerType.GAME].route.assert_called_once_with(request)
+    controllers[ControllerType.GAME].handler.assert_called_once_with(request)
 
 
 def test_router_can_handle_game_stories():
@@ -97,7 +100,7 @@ def test_router_can_handle_game_stories():
     response = router.route(request)
     assert response.status == expected_response.status
     assert any_message_contents(response.messages, "Game story")
-    controllers[ControllerType.GAME].route.assert_called_once_with(request)
+    controllers[ControllerType.GAME].handler.assert_called_once_with(request)
 
 
 def test_router_can_handle_look_requests():
@@ -109,7 +112,7 @@ def test_router_can_handle_look_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Looked")
     assert response.status == expected_response.status
-    controllers[ControllerType.MOVEMENT].route.assert_called_once_with(request)
+    controllers[ControllerType.MOVEMENT].handler.assert_called_once_with(request)
 
 
 def test_router_handles_invalid_requests():
@@ -131,7 +134,7 @@ def test_router_handles_save_game_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Saved")
     assert response.status == expected_response.status
-    controllers[ControllerType.GAME].route.assert_called_once_with(request)
+    controllers[ControllerType.GAME].handler.assert_called_once_with(request)
 
 
 def test_router_handles_new_game_requests():
@@ -143,7 +146,7 @@ def test_router_handles_new_game_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "New Game")
     assert response.status == expected_response.status
-    controllers[ControllerType.GAME].route.assert_called_once_with(request)
+    controllers[ControllerType.GAME].handler.assert_called_once_with(request)
 
 
 def test_router_handles_load_game_requests():
@@ -155,7 +158,7 @@ def test_router_handles_load_game_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Loaded")
     assert response.status == expected_response.status
-    controllers[ControllerType.GAME].route.assert_called_once_with(request)
+    controllers[ControllerType.GAME].handler.assert_called_once_with(request)
 
 
 def test_router_handles_take_requests():
@@ -167,7 +170,7 @@ def test_router_handles_take_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Taken")
     assert response.status == expected_response.status
-    controllers[ControllerType.INVENTORY].route.assert_called_once_with(request)
+    controllers[ControllerType.INVENTORY].handler.assert_called_once_with(request)
 
 
 def test_router_handles_drop_requests():
@@ -179,7 +182,7 @@ def test_router_handles_drop_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Dropped")
     assert response.status == expected_response.status
-    controllers[ControllerType.INVENTORY].route.assert_called_once_with(request)
+    controllers[ControllerType.INVENTORY].handler.assert_called_once_with(request)
 
 
 def test_router_handles_inventory_requests():
@@ -191,7 +194,7 @@ def test_router_handles_inventory_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Inventory")
     assert response.status == expected_response.status
-    controllers[ControllerType.INVENTORY].route.assert_called_once_with(request)
+    controllers[ControllerType.INVENTORY].handler.assert_called_once_with(request)
 
 
 def test_router_handles_interaction_requests():
@@ -203,4 +206,51 @@ def test_router_handles_interaction_requests():
     response = router.route(request)
     assert any_message_contents(response.messages, "Interacted")
     assert response.status == expected_response.status
-    controllers[ControllerType.INTERACTION].route.assert_called_once_with(request)
+    controllers[ControllerType.INTERACTION].handler.assert_called_once_with(request)
+
+
+def test_router_rejects_a_request_type_with_two_handlers():
+    """Test the router to ensure two controllers cannot handle the same request."""
+    controllers = get_default_controllers(ControllerType.GAME, MagicMock)
+    controllers[ControllerType.INVENTORY].request_types.append(RequestType.EXIT)
+    controllers[ControllerType.INVENTORY].handlers.return_value[
+        RequestType.EXIT
+    ] = MagicMock()
+    with pytest.raises(ValueError, match="EXIT requests already have a handler"):
+        Router(controllers=controllers)
+
+
+def test_router_routes_registered_request_types():
+    """Test the router to ensure a request type can be handled by registering it."""
+    expected_response = GameResponse.success("Hinted")
+    controllers = get_default_controllers(ControllerType.GAME, MagicMock)
+    router = Router(controllers=controllers)
+    handler = MagicMock(name="hint", return_value=expected_response)
+    router.register(RequestType.HINT, handler)
+    request = GameRequest(request_type=RequestType.HINT, targets=[None])
+    response = router.route(request)
+    assert any_message_contents(response.messages, "Hinted")
+    handler.assert_called_once_with(request)
+
+
+def test_router_dispatches_to_the_service_methods_of_real_controllers():
+    """Test the router to ensure requests go straight to the service methods."""
+    game_service = MagicMock(GameService)
+    game_service.load_game.return_value = GameResponse.success("New Game")
+    services = {
+        ServiceType.MOVEMENT: MagicMock(MovementService),
+        ServiceType.GAME: game_service,
+        ServiceType.INVENTORY: MagicMock(InventoryService),
+        ServiceType.INTERACTION: MagicMock(InteractionService),
+    }
+    controllers = {
+        ControllerType.MOVEMENT: MovementController(services),
+        ControllerType.GAME: GameController(services),
+        ControllerType.INVENTORY: InventoryController(services),
+        ControllerType.INTERACTION: InteractionController(services),
+    }
+    router = Router(controllers=controllers)
+    request = GameRequest(request_type=RequestType.NEW_GAME, targets=[None])
+    response = router.route(request)
+    assert any_message_contents(response.messages, "New Game")
+    game_service.load_game.assert_called_once_with(request, new=True)
@@ -0,0 +1,115 @@
+"""Test the multi-session game server."""
+
+import asyncio
+import json
+
+from common.request_status import RequestStatus
+from ForkOff import AdventureGame
+from game_repository.game_content import GameContent
+from game_repository.memory_save_storage import MemorySaveStorage
+from server.game_server import GameServer, GameSession
+
+
+def loaded_content() -> GameContent:
+    """Return content loaded from the game data files."""
+    content = GameContent()
+    content.load()
+    return content
+
+
+def test_it_should_run_commands_in_a_session():
+    """Make sure a session plays the game."""
+    session = GameSession(loaded_content())
+    assert session.start().status == RequestStatus.SUCCESS
+    response = session.handle_command("take flashlight")
+    assert response.status == RequestStatus.SUCCESS
+    assert "flashlight" in [
+        item.name for item in session.game.game_repository.player.inventory
+    ]
+
+
+def test_it_should_parse_multi_word_commands_as_a_local_game_does():
+    """Make sure a session finds the targets of a command among other words."""
+    session = GameSession(loaded_content())
+    local = AdventureGame().initialize_game(False, MemorySaveStorage())
+    local.game_repository.try_load_game_state(new=True)
+    for command in ["go east now", "take the flashlight please"]:
+        expected = local.text_parser.parse_text(command, True)
+        request = session.game.text_parser.parse_text(command, True)
+        assert (request.action, request.targets) == (expected.action, expected.targets)
+    assert session.game.text_parser.parse_text("go east now", True).targets == ["east"]
+
+
+def test_it_should_find_targets_again_after_a_new_game():
+    """Make sure commands parsed in the old game are not reused in a new one."""
+    session = GameSession(loaded_content())
+    repository = session.game.game_repository
+    session.handle_command("take flashlight")
+    lookups = repository.world_lookups
+    session.game.text_parser.parse_text("look at flashlight", True)
+    assert repository.world_lookups > lookups
+    session.game.text_parser.parse_text("look at flashlight", True)
+    lookups = repository.world_lookups
+    response = session.handle_command("newgame")
+    assert response.status == RequestStatus.SUCCESS
+    assert "flashlight" not in repository.player.inventory.names
+    session.game.text_parser.parse_text("look at flashlight", True)
+    assert repository.world_lookups > lookups
+
+
+def test_it_should_start_new_games_through_the_router():
+    """Make sure a new game in a session is handled like any other command."""
+    session = GameSession(loaded_content())
+    session.handle_command("take flashlight")
+    response = session.handle_command("newgame")
+    assert response.status == RequestStatus.SUCCESS
+    assert response.messages[1].contents == "New game started."
+    repository = session.game.game_repository
+    assert "flashlight" not in repository.player.inventory.names
+    assert repository.template is session.content.template
+
+
+def test_it_should_refuse_to_save_or_load_in_a_session():
+    """Make sure sessions never touch the save files."""
+    session = GameSession(loaded_content())
+    for command in ["savegame", "loadgame"]:
+        response = session.handle_command(command)
+        assert response.status == RequestStatus.FAILURE
+        assert response.messages[1].contents == (
+            "Saving and loading aren't available online."
+        )
+
+
+def test_it_should_end_a_session_when_the_player_exits():
+    """Make sure the session reports that it is no longer active."""
+    session = GameSession(loaded_content())
+    session.handle_command("exit")
+    assert not session.active
+
+
+def test_it_should_serve_separate_games_to_each_connection():
+    """Make sure two connections have their own game state."""
+
+    async def play() -> list[dict]:
+        server = await GameServer(loaded_content()).start("127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        first = await asyncio.open_connection("127.0.0.1", port)
+        second = await asyncio.open_connection("127.0.0.1", port)
+        replies = []
+        for reader, writer in [first, second]:
+            await reader.readline()
+        for (reader, writer), command in [
+            (first, "take flashlight"),
+            (second, "take flashlight"),
+            (first, "exit"),
+        ]:
+            writer.write(f"{command}\n".encode("utf-8"))
+            replies.append(json.loads(await reader.readline()))
+        for _, writer in [first, second]:
+            writer.close()
+        server.close()
+        await server.wait_closed()
+        return replies
+
+    replies = asyncio.run(play())
+    assert [reply["status"] for reply in replies] == ["SUCCESS", "SUCCESS", "SUCCESS"]
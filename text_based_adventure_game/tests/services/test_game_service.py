@@ -1,21 +1,28 @@
 """Test the game service to ensure it performs correctly."""
 
 
+import threading
+from typing import Any
 from unittest.mock import MagicMock, PropertyMock
 
 from common.environment import Environment
 from common.game_objective import GameObjective
 from common.game_request import GameRequest
 from common.game_response import GameResponse
+from common.inventory import Inventory
 from common.item import Item
+from common.load_error import FileOperationError
 from common.player import Player
+from common.profiler import Profiler
 from common.request_status import RequestStatus
 from common.request_type import RequestType
 from common.room import Room
 from game_repository.art_manager import ArtManager
 from game_repository.game_repository import GameRepository
 from game_repository.item_manager import ItemManager
+from game_repository.memory_save_storage import MemorySaveStorage
 from game_repository.objectives_manager import ObjectiveManager
+from game_repository.save_storage import SaveStorage
 from language.language_manager import LanguageManager
 from language.story_manager import StoryManager
 from services.game_service import GameService
@@ -53,7 +60,7 @@ def test_game_service_save_game_method_should_fail_when_raises():
         "An error occurred while saving your game: error"
     )
     game_service = GameService(mock_repository)
-    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, ["a message"]))
+    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, [None]))
     assert any_message_contents(
         result.messages, "An error occurred while saving your game: error"
     )
@@ -66,7 +73,7 @@ def test_game_service_save_game_method_should_pass_when_ok():
     mock_repository.save_game_state = MagicMock()
     expected_response = GameResponse.success("Your game was saved successfully.")
     game_service = GameService(mock_repository)
-    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, ["a message"]))
+    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, [None]))
     assert any_message_contents(result.messages, "Your game was saved successfully.")
     assert result.status == expected_response.status
     mock_repository.save_game_state.assert_called_once()
@@ -86,6 +93,118 @@ def test_load_game_should_succeed():
     mock_repository.try_load_game_state.assert_called_once()
 
 
+def test_it_should_save_and_load_named_games():
+    """Save and load should use the slot named by the request."""
+    mock_repository = MagicMock(GameRepository)
+    mock_repository.save_game_state = MagicMock(return_value=None)
+    mock_repository.try_load_game_state = MagicMock(
+        return_value=GameResponse.success("Game loaded successfully.")
+    )
+    game_service = GameService(mock_repository)
+    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, ["My Castle"]))
+    assert any_message_contents(result.messages, "Your game was saved as my_castle.")
+    mock_repository.save_game_state.assert_called_once_with("my_castle")
+    game_service.load_game(GameRequest(RequestType.LOAD_GAME, ["my castle"]), False)
+    mock_repository.try_load_game_state.assert_called_once_with(
+        new=False, slot="my_castle"
+    )
+
+
+def test_it_should_refuse_names_which_cannot_be_saved_games():
+    """Save and load should reject names which cannot be used for a save file."""
+    mock_repository = MagicMock(GameRepository)
+    game_service = GameService(mock_repository)
+    for request in [
+        GameRequest(RequestType.SAVE_GAME, ["../game"]),
+        GameRequest(RequestType.LOAD_GAME, ["../game"]),
+    ]:
+        if request.action == RequestType.SAVE_GAME:
+            result = game_service.save_game(request)
+        else:
+            result = game_service.load_game(request, False)
+        assert result.status == RequestStatus.FAILURE
+        assert any_message_contents(result.messages, GameService.bad_slot_message)
+    mock_repository.save_game_state.assert_not_called()
+    mock_repository.try_load_game_state.assert_not_called()
+
+
+def test_it_should_list_saved_games():
+    """The saved games should be listed from their metadata."""
+    saves = [
+        {
+            "slot": "castle",
+            "player": "Player 1",
+            "location": "Kitchen",
+            "objectives_done": 2,
+            "objectives": 5,
+            "saved_at": 0,
+        },
+        {"slot": "game", "saved_at": 0},
+    ]
+    mock_repository = MagicMock(GameRepository)
+    mock_repository.storage = MagicMock(SaveStorage)
+    game_service = GameService(mock_repository)
+    mock_repository.storage.list_slots.return_value = saves
+    result = game_service.list_saves(GameRequest(RequestType.LIST_SAVES, []))
+    assert result.status == RequestStatus.SUCCESS
+    assert any_message_contents(
+        result.messages, "Player 1 in Kitchen with 2 of 5 objectives done."
+    )
+    assert any_message_contents(result.messages, "game - saved")
+    mock_repository.storage.list_slots.return_value = []
+    result = game_service.list_saves(GameRequest(RequestType.LIST_SAVES, []))
+    assert any_message_contents(result.messages, "You have no saved games.")
+
+
+class SlowSaveStorage(MemorySaveStorage):
+    """Keeps saved games in memory, once it is told to go ahead."""
+
+    def __init__(self: "SlowSaveStorage") -> None:
+        """Initialize the storage, which holds saves until released."""
+        super().__init__()
+        self.released = threading.Event()
+
+    def save_game(
+        self: "SlowSaveStorage",
+        state: dict[str, Any],
+        slot: str,
+        metadata: dict[str, Any] | None = None,
+    ) -> None | FileOperationError:
+        """Save the game once the storage is released."""
+        self.released.wait()
+        return super().save_game(state, slot, metadata)
+
+
+def test_it_should_list_a_save_which_is_still_being_written():
+    """A game saved just before the saves are listed should be listed."""
+    storage = SlowSaveStorage()
+    repository = GameRepository(storage=storage)
+    repository.try_load_game_state(new=True)
+    game_service = GameService(repository)
+    game_service.save_game(GameRequest(RequestType.SAVE_GAME, ["castle"]))
+    assert repository.save_writer.pending is not None
+    threading.Timer(0.05, storage.released.set).start()
+    result = game_service.list_saves(GameRequest(RequestType.LIST_SAVES, []))
+    assert result.status == RequestStatus.SUCCESS
+    assert any_message_contents(result.messages, "castle - saved")
+
+
+def test_it_should_summarize_the_profile():
+    """The profile should be summarized when the game is profiled."""
+    mock_repository = MagicMock(GameRepository)
+    mock_repository.profiler = None
+    game_service = GameService(mock_repository)
+    request = GameRequest(RequestType.PROFILE, [None])
+    result = game_service.profile(request)
+    assert result.status == RequestStatus.FAILURE
+    assert any_message_contents(result.messages, "--profile")
+    mock_repository.profiler = Profiler()
+    mock_repository.profiler.spans.append(("Router.route", 0, 2000, 0, 1))
+    result = game_service.profile(request)
+    assert result.status == RequestStatus.SUCCESS
+    assert any_message_contents(result.messages, "Router.route - 1 call,")
+
+
 def test_new_game_should_succeed():
     """New game method should call new_game_state and return success response."""
     mock_repository = MagicMock(GameRepository)
@@ -144,9 +263,9 @@ def test_it_should_list_objectives():
     """Make sure it can list objectives."""
     mock_repository = MagicMock(GameRepository)
     mock_repository.player = MagicMock(GameRepository)
-    mock_repository.player.inventory = []
+    mock_repository.player.inventory = Inventory()
     mock_repository.player.location = MagicMock(Room)
-    mock_repository.player.location.inventory = []
+    mock_repository.player.location.inventory = Inventory()
     mock_repository.objectives = MagicMock(ObjectiveManager)
     objective = GameObjective("objective1", [], ["requirement1"], [])
     mock_repository.objectives.objectives = {"objective1": objective}
@@ -483,3 +602,14 @@ def test_get_scroll_speed_update_description():
     service = GameService(repo)
     response = service.get_scroll_speed_update_description("invalid")
     assert response == "Text printing speed not changed."
+
+
+def test_game_service_save_game_method_should_fail_when_the_save_fails():
+    """Test the save game method of the game service when the file can't be saved."""
+    mock_repository = MagicMock(GameRepository)
+    error = FileOperationError("a message")
+    mock_repository.save_game_state = MagicMock(return_value=error)
+    game_service = GameService(mock_repository)
+    result = game_service.save_game(GameRequest(RequestType.SAVE_GAME, [None]))
+    assert any_message_contents(result.messages, "a message")
+    assert result.status == RequestStatus.FAILURE
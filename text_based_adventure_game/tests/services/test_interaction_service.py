@@ -7,7 +7,7 @@ from unittest.mock import MagicMock
 from common.game_objective import GameObjective
 from common.game_request import GameRequest
 from common.game_response import GameResponse
-from common.item import Item
+from common.item import InteractionLinks, Item
 from common.player import Player
 from common.request_status import RequestStatus
 from common.request_type import RequestType
@@ -168,6 +168,7 @@ def test_update_interaction_description():
     interaction_service = InteractionService(repo)
     interaction_service.update_interaction_description(item, "test")
     assert item.description == "New Message"
+    repo.mark_items_changed.assert_called_once_with([item])
     item.description = "Starting description."
     item.interactions = {"test": {"message": "Test Message"}}
     interaction_service.update_interaction_description(item, "test")
@@ -202,6 +203,7 @@ def test_interact_single_item_when_interaction_defined():
     item.interactions = {
         "test": {"message": "Test Message", "new_description": "New Message"}
     }
+    item.links = {"test": InteractionLinks()}
     interaction_service = InteractionService(repo)
     interaction_service.update_interaction_description = MagicMock()
     interaction_service.handle_interaction_transformations = MagicMock()
@@ -280,8 +282,7 @@ def test_get_interaction_requirements_should_return_list_of_items():
     repo = MagicMock(GameRepository)
     repo.items = MagicMock(ItemManager)
     item = MagicMock(Item)
-    item.interactions = {"test": {"requires": ["Test Item"]}}
-    repo.items.get_item_by_name = MagicMock(return_value=item)
+    item.links = {"test": InteractionLinks(requires=[item])}
     interaction_service = InteractionService(repo)
     assert interaction_service.get_interaction_requirements(item, "test") == [item]
 
@@ -292,8 +293,7 @@ def test_get_interaction_requirements_returns_empty_list_when_interaction_none()
     repo = MagicMock(GameRepository)
     repo.items = MagicMock(ItemManager)
     item = MagicMock(Item)
-    item.interactions = {}
-    repo.items.get_item_by_name = MagicMock(return_value=item)
+    item.links = {}
     interaction_service = InteractionService(repo)
     assert interaction_service.get_interaction_requirements(item, "test") == []
 
@@ -304,39 +304,33 @@ def test_get_interaction_requirements_returns_empty_list_when_requires_none():
     repo = MagicMock(GameRepository)
     repo.items = MagicMock(ItemManager)
     item = MagicMock(Item)
-    item.interactions = {"use": {}}
-    repo.items.get_item_by_name = MagicMock(return_value=item)
+    item.links = {"use": InteractionLinks()}
     interaction_service = InteractionService(repo)
     assert interaction_service.get_interaction_requirements(item, "use") == []
 
 
-def test_get_transformations_returns_empty_list_when_interaction_none():
-    """Test to make sure an empty list is returned when the interaction
-    transformations are not set."""
+def test_get_links_returns_no_links_when_interaction_none():
+    """Test to make sure an interaction which is not defined names no items."""
     repo = MagicMock(GameRepository)
-    repo.items = MagicMock(ItemManager)
     item = MagicMock(Item)
-    item.interactions = {}
-    repo.items.get_item_by_name = MagicMock(return_value=item)
+    item.links = {}
     interaction_service = InteractionService(repo)
-    assert interaction_service.get_transformations(item, "test") == []
-
+    links = interaction_service.get_links(item, "test")
+    assert links.requires == []
+    assert links.transforms == []
 
-def test_get_transformations_returns_transformations():
-    """Test to make sure a list of transformations is returned when the interaction
-    transformations are set."""
 
+def test_get_links_returns_linked_transformations():
+    """Test to make sure the transformations linked to the interaction are returned."""
     repo = MagicMock(GameRepository)
-    repo.items = MagicMock(ItemManager)
     item = MagicMock(Item)
     item.name = "Test Item"
-    item.interactions = {
-        "test": {"transforms": [{"from": "Test Item", "to": "Test Item 2"}]}
-    }
+    other_item = MagicMock(Item)
+    other_item.name = "Test Item 2"
+    item.links = {"test": InteractionLinks(transforms=[(item, other_item)])}
     interaction_service = InteractionService(repo)
-    assert interaction_service.get_transformations(item, "test") == [
-        {"from": "Test Item", "to": "Test Item 2"}
-    ]
+    links = interaction_service.get_links(item, "test")
+    assert links.transforms == [(item, other_item)]
 
 
 def test_can_handle_single_interaction_when_not_nearby():
@@ -518,14 +512,10 @@ def test_handle_interaction_transformations_should_transform_items():
     transformed_item.name = "Transformed Item"
     transformed_item.discovered = True
     transformed_item.is_collectible = True
-    interaction_service.get_transformations = MagicMock(
-        return_value=[item.interactions["test"]["transforms"]]
-    )
+    item.links = {"test": InteractionLinks(transforms=[(item, transformed_item)])}
     interaction_service.transform_item = MagicMock()
     interaction_service.handle_interaction_transformations(item, "test")
-    interaction_service.transform_item.assert_called_once_with(
-        "Test Item", "Transformed Item"
-    )
+    interaction_service.transform_item.assert_called_once_with(item, transformed_item)
 
 
 def test_transform_item_does_nothing_when_both_items_none():
@@ -536,9 +526,8 @@ def test_transform_item_does_nothing_when_both_items_none():
     repo.player.inventory = []
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = []
-    repo.items.get_item_by_name = MagicMock(return_value=None)
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("from", "to")
+    interaction_service.transform_item(None, None)
     assert repo.player.inventory == []
     assert repo.current_location.inventory == []
 
@@ -555,14 +544,8 @@ def test_transform_item_removes_item_from_player_when_to_is_none():
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = []
 
-    def mock_item_by_name(name):
-        if name == "From Item":
-            return from_item
-        return None
-
-    repo.items.get_item_by_name = mock_item_by_name
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("From Item", None)
+    interaction_service.transform_item(from_item, None)
     assert repo.player.inventory == []
     assert repo.current_location.inventory == []
 
@@ -579,14 +562,8 @@ def test_transform_item_removes_item_from_room_inventory_when_to_is_none():
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = [from_item]
 
-    def mock_item_by_name(name):
-        if name == "From Item":
-            return from_item
-        return None
-
-    repo.items.get_item_by_name = mock_item_by_name
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("From Item", None)
+    interaction_service.transform_item(from_item, None)
     assert repo.player.inventory == []
     assert repo.current_location.inventory == []
 
@@ -603,14 +580,8 @@ def test_transform_item_adds_item_to_player_inventory_when_from_none():
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = []
 
-    def mock_item_by_name(name):
-        if name == "To Item":
-            return to_item
-        return None
-
-    repo.items.get_item_by_name = mock_item_by_name
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("From Item", "To Item")
+    interaction_service.transform_item(None, to_item)
     assert repo.player.inventory == [to_item]
     assert repo.current_location.inventory == []
 
@@ -629,15 +600,8 @@ def test_transform_item_adds_to_item_to_player_and_removes_from_item_from_player
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = []
 
-    def mock_item_by_name(name):
-        if name == "From Item":
-            return from_item
-        else:
-            return to_item
-
-    repo.items.get_item_by_name = mock_item_by_name
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("From Item", "To Item")
+    interaction_service.transform_item(from_item, to_item)
     assert repo.player.inventory == [to_item]
     assert repo.current_location.inventory == []
 
@@ -656,15 +620,8 @@ def test_transform_item_adds_to_item_to_player_and_removes_from_item_from_room()
     repo.current_location = MagicMock(Room)
     repo.current_location.inventory = [from_item]
 
-    def mock_item_by_name(name):
-        if name == "From Item":
-            return from_item
-        else:
-            return to_item
-
-    repo.items.get_item_by_name = mock_item_by_name
     interaction_service = InteractionService(repo)
-    interaction_service.transform_item("From Item", "To Item")
+    interaction_service.transform_item(from_item, to_item)
     assert repo.player.inventory == [to_item]
     assert repo.current_location.inventory == []
 
@@ -861,6 +818,8 @@ def test_interact_multiple_items_should_pass_when_valid():
     service.get_interaction_message_response = MagicMock(return_value=response)
     item1.interactions = {"use_with": {"requires": ["test item 2"]}}
     item2.interactions = {"use_with": {"requires": ["test item 1"]}}
+    item1.links = {"use_with": InteractionLinks(requires=[item2])}
+    item2.links = {"use_with": InteractionLinks(requires=[item1])}
     service.handle_interaction_transformations = MagicMock()
     actual = service.interact_multiple_items([item1, item2], "use_with")
     service.update_interaction_description.assert_called()
@@ -965,6 +924,7 @@ def test_update_interaction_objectives_should_update_objectives():
     objective.complete_interaction_objective.assert_called_once_with(
         "test item", "use_with"
     )
+    repo.mark_objective_changed.assert_called_once_with(objective)
 
 
 def test_unhide_items_returns_when_not_defined():
@@ -972,6 +932,7 @@ def test_unhide_items_returns_when_not_defined():
     item = MagicMock(Item)
     item.hidden = True
     item.interactions = {}
+    item.links = {}
     service = InteractionService(MagicMock(GameRepository))
     service.unhide_items(item, "use_with")
     assert item.hidden
@@ -984,12 +945,12 @@ def test_unhides_items_actually_unhides_hidden_items():
     hidden_item = MagicMock(Item)
     hidden_item.hidden = True
     test_item.interactions = {"use_with": {"unhides": ["hidden item"]}}
+    test_item.links = {"use_with": InteractionLinks(unhides=[hidden_item])}
     repo = MagicMock(GameRepository)
-    repo.items = MagicMock(ItemManager)
-    repo.items.get_item_by_name = MagicMock(return_value=hidden_item)
     service = InteractionService(repo)
     service.unhide_items(test_item, "use_with")
     assert not hidden_item.hidden
+    repo.mark_items_changed.assert_called_once_with([hidden_item])
 
 
 def test_unlock_items_returns_when_not_defined():
@@ -997,6 +958,7 @@ def test_unlock_items_returns_when_not_defined():
     item = MagicMock(Item)
     item.locked = True
     item.interactions = {}
+    item.links = {}
     service = InteractionService(MagicMock(GameRepository))
     service.unlock_items(item, "use_with")
     assert item.locked
@@ -1009,12 +971,12 @@ def test_unlock_items_actually_unlocks_locked_items():
     locked_item = MagicMock(Item)
     locked_item.locked = True
     test_item.interactions = {"use_with": {"unlocks": ["locked item"]}}
+    test_item.links = {"use_with": InteractionLinks(unlocks=[locked_item])}
     repo = MagicMock(GameRepository)
-    repo.items = MagicMock(ItemManager)
-    repo.items.get_item_by_name = MagicMock(return_value=locked_item)
     service = InteractionService(repo)
     service.unlock_items(test_item, "use_with")
     assert not locked_item.locked
+    repo.mark_items_changed.assert_called_once_with([locked_item])
 
 
 def test_sit_should_not_find_empty_lists():
@@ -1058,10 +1020,11 @@ def test_discover_items():
     item2 = MagicMock(Item)
     item2.name = "Test Item 2"
     item2.discovered = False
-    repo.items.get_item_by_name = MagicMock(return_value=item2)
+    item1.links = {"use": InteractionLinks(discovers=[item2])}
     interaction_service = InteractionService(repo)
     interaction_service.discover_items(item1, "use")
     assert item2.discovered == True
+    repo.mark_items_changed.assert_called_once_with([item2])
 
 
 def test_discover_items_does_nothing_when_interaction_none():
@@ -1071,10 +1034,10 @@ def test_discover_items_does_nothing_when_interaction_none():
     item1 = MagicMock(Item)
     item1.name = "Test Item"
     item1.interactions = {}
+    item1.links = {}
     item2 = MagicMock(Item)
     item2.name = "Test Item 2"
     item2.discovered = False
-    repo.items.get_item_by_name = MagicMock(return_value=item2)
     interaction_service = InteractionService(repo)
     interaction_service.discover_items(item1, "use")
     assert item2.discovered == False
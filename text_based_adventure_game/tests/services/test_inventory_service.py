@@ -251,6 +251,9 @@ def test_remove_item_from_room_and_add_to_player():
     assert len(repository.player.inventory) == 1
     assert len(repository.rooms["entry"].inventory) == 1
     assert repository.player.inventory[0].name == "hammer"
+    repository.mark_items_moved.assert_called_once_with(
+        [repository.player.inventory[0]]
+    )
 
 
 def test_it_should_remove_item_from_player_and_add_to_room():
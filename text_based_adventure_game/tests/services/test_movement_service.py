@@ -6,13 +6,13 @@ from common.game_message import GameMessage
 from common.game_objective import GameObjective
 from common.game_request import GameRequest
 from common.game_response import GameResponse
+from common.inventory import Inventory
 from common.item import Item
 from common.player import Player
 from common.request_status import RequestStatus
 from common.request_type import RequestType
 from common.room import Room
 from game_repository.game_repository import GameRepository
-from game_repository.objectives_manager import ObjectiveManager
 from services.movement_service import MovementService
 from tests.test_helpers import any_message_contents
 
@@ -79,12 +79,11 @@ def test_movement_service_can_move_method_when_room_blocked():
     )
     # No interaction requirements, but one item requirement.
     objective = GameObjective("test blocker", [], ["imaginary item"], [])
+    test_room.blocking_objectives = [(objective, "test message")]
     mock_repo.current_location = current_room
-    mock_repo.objectives = MagicMock(ObjectiveManager)
     mock_repo.player = MagicMock(Player)
-    mock_repo.player.inventory = []
+    mock_repo.player.inventory = Inventory()
     mock_repo.player.location = current_room
-    mock_repo.objectives.get_objective_by_name = MagicMock(return_value=objective)
     movement_service = MovementService(mock_repo)
     result = movement_service.can_move("test")
     assert result is False
@@ -598,28 +597,26 @@ def test_move_method_fails_when_request_targets_empty():
 def test_movement_service_get_blocked_message():
     """Test the get blocked message method."""
     mock_repo = MagicMock(GameRepository)
-    mock_repo.objectives = MagicMock(ObjectiveManager)
     objective = MagicMock(GameObjective)
     objective.is_complete = MagicMock(return_value=False)
-    mock_repo.objectives.get_objective_by_name = MagicMock(return_value=objective)
     mock_repo.player = MagicMock(Player)
     movement_service = MovementService(mock_repo)
     room = MagicMock(Room)
     room.blockers = [{"name": "test", "message": "test message"}]
+    room.blocking_objectives = [(objective, "test message")]
     assert movement_service.get_blocked_message(room) == "test message"
 
 
 def test_get_blocked_message_when_not_blocked():
     """Get blocked message shouldn't be called when not blocked, but if so, it should return a message."""
     mock_repo = MagicMock(GameRepository)
-    mock_repo.objectives = MagicMock(ObjectiveManager)
     objective = MagicMock(GameObjective)
     objective.is_complete = MagicMock(return_value=True)
-    mock_repo.objectives.get_objective_by_name = MagicMock(return_value=objective)
     mock_repo.player = MagicMock(Player)
     movement_service = MovementService(mock_repo)
     room = MagicMock(Room)
     room.blockers = [{"name": "test", "message": "test message"}]
+    room.blocking_objectives = [(objective, "test message")]
     assert (
         movement_service.get_blocked_message(room)
         == "Tell the developer that they messed up..."
@@ -1,6 +1,9 @@
 """Helpful methods for testing."""
 
+from typing import Any, Iterable
+
 from common.game_message import GameMessage
+from common.item import Item
 
 
 def any_message_contents(messages: list[GameMessage], test_message: str) -> bool:
@@ -10,3 +13,18 @@ def any_message_contents(messages: list[GameMessage], test_message: str) -> bool
         if isinstance(message.contents, str):
             results.append(test_message in message.contents)
     return any(results)
+
+
+def make_item(
+    name: str, alias: Iterable[str] = (), interactions: dict[str, Any] | None = None
+) -> Item:
+    """Make an undiscovered, collectible item with the given name for testing."""
+    return Item(
+        name=name,
+        alias=list(alias),
+        description=[name],
+        look_at_message={},
+        is_collectible=True,
+        discovered=False,
+        interactions=interactions or {},
+    )